@@ -0,0 +1,459 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Content-Addressed Storage Benchmarks
+
+Micro-benchmarks and workload replay for ContentAddressedStorage.
+
+Scenarios:
+- put/get throughput across object-size distributions
+- Dedup ratio and chunking cost
+- Index hit rates for puts and lookups
+- Foreground latency while the integrity scrubber runs
+- Open (index rebuild) time for a populated store
+- Replay of recorded access traces
+
+Results are written as JSON with the commit and environment, and can be
+compared against an earlier run with --compare.
+
+Usage:
+    python benchmarks/cas_bench.py --output bench.json
+    python benchmarks/cas_bench.py --open-objects 1000000
+    python benchmarks/cas_bench.py --replay trace.jsonl
+    python benchmarks/cas_bench.py --compare baseline.json
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from services.storage.cas import DEFAULT_CHUNK_SIZE, ContentAddressedStorage
+from services.storage.integrity import IntegrityScrubber
+
+KIB = 1024
+MIB = 1024 * 1024
+
+# name -> (min bytes, max bytes, share of --objects); sizes are
+# log-uniform within the range
+SIZE_DISTRIBUTIONS = {
+    "small": (256, 16 * KIB, 1.0),
+    "mixed": (1 * KIB, 4 * MIB, 1.0),
+    "large": (1 * MIB, 8 * MIB, 0.05),
+}
+
+
+def _sizes(distribution: str, count: int, rng: random.Random) -> List[int]:
+    """Draw object sizes from a named distribution."""
+    low, high, _ = SIZE_DISTRIBUTIONS[distribution]
+    return [int(low * (high / low) ** rng.random()) for _ in range(count)]
+
+
+def _payload(seed: str, size: int) -> bytes:
+    """Deterministic, incompressible payload of a given size."""
+    return random.Random(seed).randbytes(size)
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    """Summarize latency samples in microseconds."""
+    if not samples:
+        return {"p50_us": 0.0, "p99_us": 0.0, "max_us": 0.0}
+    ordered = sorted(samples)
+    
+    def pick(q: float) -> float:
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+    
+    return {
+        "p50_us": round(pick(0.50) * 1e6, 2),
+        "p99_us": round(pick(0.99) * 1e6, 2),
+        "max_us": round(ordered[-1] * 1e6, 2),
+    }
+
+
+def _throughput(count: int, nbytes: int, seconds: float) -> Dict[str, float]:
+    """Summarize a timed batch."""
+    seconds = max(seconds, 1e-9)
+    return {
+        "ops_per_s": round(count / seconds, 1),
+        "mb_per_s": round(nbytes / MIB / seconds, 2),
+        "seconds": round(seconds, 4),
+    }
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    """Run fn and return elapsed seconds."""
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def bench_throughput(root: Optional[str], count: int, seed: int) -> Dict[str, Any]:
+    """put/put_many/get/get_view throughput for each size distribution."""
+    results = {}
+    for name, (_, _, share) in SIZE_DISTRIBUTIONS.items():
+        rng = random.Random(seed)
+        n = max(int(count * share), 2)
+        blobs = [_payload(f"{name}-{i}", size)
+                 for i, size in enumerate(_sizes(name, n, rng))]
+        total = sum(len(b) for b in blobs)
+        
+        with tempfile.TemporaryDirectory(dir=root) as tmp:
+            cas = ContentAddressedStorage(tmp if root else None)
+            put_s = _timed(lambda: [cas.put(b) for b in blobs])
+            addresses = cas.list_objects()
+            
+            batch = ContentAddressedStorage(
+                os.path.join(tmp, "batch") if root else None
+            )
+            put_many_s = _timed(lambda: batch.put_many(blobs))
+            
+            get_s = _timed(lambda: [cas.get(a) for a in addresses])
+            view_s = _timed(lambda: [cas.get_view(a) for a in addresses])
+        
+        results[name] = {
+            "objects": n,
+            "bytes": total,
+            "put": _throughput(n, total, put_s),
+            "put_many": _throughput(n, total, put_many_s),
+            "get": _throughput(n, total, get_s),
+            "get_view": _throughput(n, total, view_s),
+        }
+    return results
+
+
+def bench_dedup(root: Optional[str], count: int, seed: int,
+                duplicate_ratio: float = 0.3,
+                chunk_size: int = 256 * KIB) -> Dict[str, Any]:
+    """Dedup ratio, put hit rate and chunking cost on a mixed workload."""
+    rng = random.Random(seed)
+    sizes = _sizes("mixed", count, rng)
+    blobs = []
+    for i, size in enumerate(sizes):
+        if blobs and rng.random() < duplicate_ratio:
+            blobs.append(rng.choice(blobs))
+        else:
+            blobs.append(_payload(f"dedup-{i}", size))
+    logical = sum(len(b) for b in blobs)
+    
+    with tempfile.TemporaryDirectory(dir=root) as tmp:
+        plain = ContentAddressedStorage(os.path.join(tmp, "plain") if root else None)
+        plain_s = _timed(lambda: [plain.put(b) for b in blobs])
+        stored_plain = sum(plain.stat(a).size for a in plain.list_objects())
+        
+        chunked = ContentAddressedStorage(os.path.join(tmp, "chunked") if root else None)
+        chunked_s = _timed(lambda: [chunked.put_chunked(b, chunk_size) for b in blobs])
+        stored_chunks = sum(
+            chunked.stat(a).size for a in chunked.list_objects(codec="raw")
+        )
+        
+        unique = len(plain.list_objects())
+        lookups = plain.list_objects()
+        has_s = _timed(lambda: plain.has_many(lookups))
+    
+    return {
+        "objects": count,
+        "logical_bytes": logical,
+        "dedup_ratio": round(logical / max(stored_plain, 1), 3),
+        "chunked_dedup_ratio": round(logical / max(stored_chunks, 1), 3),
+        "put_hit_rate": round(1 - unique / count, 3),
+        "has_many": _throughput(len(lookups), 0, has_s),
+        "put_plain": _throughput(count, logical, plain_s),
+        "put_chunked": _throughput(count, logical, chunked_s),
+        "chunking_overhead": round(chunked_s / max(plain_s, 1e-9), 3),
+    }
+
+
+def bench_scrub_pauses(root: str, count: int, seed: int,
+                       rate_mb_per_s: float = 64.0) -> Dict[str, Any]:
+    """Foreground get latency with the integrity scrubber idle and running."""
+    rng = random.Random(seed)
+    blobs = [_payload(f"scrub-{i}", size)
+             for i, size in enumerate(_sizes("mixed", count, rng))]
+    
+    with tempfile.TemporaryDirectory(dir=root) as tmp:
+        cas = ContentAddressedStorage(tmp)
+        addresses = cas.put_many(blobs)
+        probe = [rng.choice(addresses) for _ in range(2000)]
+        
+        def sample() -> List[float]:
+            latencies = []
+            for address in probe:
+                started = time.perf_counter()
+                cas.get(address)
+                latencies.append(time.perf_counter() - started)
+            return latencies
+        
+        idle = _percentiles(sample())
+        
+        scrubber = IntegrityScrubber(cas, rate_mb_per_s=rate_mb_per_s,
+                                     pass_interval=0.0)
+        scrubber.start()
+        busy = _percentiles(sample())
+        scrubber.stop(timeout=10)
+    
+    return {
+        "objects": count,
+        "scrub_rate_mb_per_s": rate_mb_per_s,
+        "get_idle": idle,
+        "get_while_scrubbing": busy,
+    }
+
+
+def bench_open(root: str, objects: int, object_size: int = 64) -> Dict[str, Any]:
+    """Time to open (rebuild the index of) a populated disk store."""
+    with tempfile.TemporaryDirectory(dir=root) as tmp:
+        cas = ContentAddressedStorage(tmp)
+        batch = 10000
+        for start in range(0, objects, batch):
+            cas.put_many(
+                i.to_bytes(8, "big").ljust(object_size, b"\0")
+                for i in range(start, min(start + batch, objects))
+            )
+        
+        open_s = _timed(lambda: ContentAddressedStorage(tmp))
+    
+    return {
+        "objects": objects,
+        "open_seconds": round(open_s, 4),
+        "open_us_per_object": round(open_s / max(objects, 1) * 1e6, 3),
+    }
+
+
+class TraceRecorder:
+    """
+    Wraps a ContentAddressedStorage and records its calls as a trace.
+    
+    Each call is appended to a JSON-lines file with its operation, address,
+    size and time offset, and can be replayed with replay_trace().
+    """
+    
+    def __init__(self, cas: ContentAddressedStorage, path: str):
+        """
+        Initialize the recorder.
+        
+        Args:
+            cas: Storage to wrap
+            path: Trace file to append to
+        """
+        self.cas = cas
+        self._file = open(path, "a")
+        self._started = time.monotonic()
+    
+    def _record(self, op: str, address: str, **fields: Any) -> None:
+        """Append one trace event."""
+        event = {"t": round(time.monotonic() - self._started, 6),
+                 "op": op, "address": address, **fields}
+        self._file.write(json.dumps(event) + "\n")
+    
+    def put(self, data: bytes) -> str:
+        """Store data, recording its address and size."""
+        address = self.cas.put(data)
+        self._record("put", address, size=len(data))
+        return address
+    
+    def put_many(self, items: Iterable[bytes],
+                 max_workers: Optional[int] = None) -> List[str]:
+        """Store many objects, recording each as a put."""
+        blobs = list(items)
+        addresses = self.cas.put_many(blobs, max_workers)
+        for address, data in zip(addresses, blobs):
+            self._record("put", address, size=len(data))
+        return addresses
+    
+    def put_chunked(self, data: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    max_workers: Optional[int] = None) -> str:
+        """Store data as chunks, recording its size and chunk size."""
+        address = self.cas.put_chunked(data, chunk_size, max_workers)
+        self._record("put_chunked", address, size=len(data), chunk_size=chunk_size)
+        return address
+    
+    def get(self, address: str) -> Optional[bytes]:
+        """Retrieve data, recording the lookup."""
+        data = self.cas.get(address)
+        self._record("get", address)
+        return data
+    
+    def get_view(self, address: str) -> Optional[memoryview]:
+        """Retrieve a view of data, recording the lookup."""
+        view = self.cas.get_view(address)
+        self._record("get_view", address)
+        return view
+    
+    def has(self, address: str) -> bool:
+        """Check existence, recording the lookup."""
+        self._record("has", address)
+        return self.cas.has(address)
+    
+    def has_many(self, addresses: Iterable[str]) -> List[bool]:
+        """Check existence of many objects, recording each as a has."""
+        addresses = list(addresses)
+        for address in addresses:
+            self._record("has", address)
+        return self.cas.has_many(addresses)
+    
+    def read_range(self, address: str, offset: int, length: int) -> Optional[bytes]:
+        """Read a range, recording its bounds."""
+        self._record("read_range", address, offset=offset, length=length)
+        return self.cas.read_range(address, offset, length)
+    
+    def close(self) -> None:
+        """Flush and close the trace file."""
+        self._file.close()
+
+
+def replay_trace(root: Optional[str], events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Replay a recorded trace against a fresh store.
+    
+    Recorded addresses are mapped to synthetic payloads of the recorded
+    size, so the replay reproduces the access pattern and dedup structure
+    without the original data.
+    """
+    latencies: Dict[str, List[float]] = {}
+    mapping: Dict[str, str] = {}
+    found = lookups = 0
+    
+    with tempfile.TemporaryDirectory(dir=root) as tmp:
+        cas = ContentAddressedStorage(tmp if root else None)
+        for event in events:
+            op = event["op"]
+            recorded = event["address"]
+            address = mapping.get(recorded, recorded)
+            
+            started = time.perf_counter()
+            if op == "put":
+                address = cas.put(_payload(recorded, event["size"]))
+                mapping[recorded] = address
+            elif op == "put_chunked":
+                data = _payload(recorded, event["size"])
+                address = cas.put_chunked(data, event["chunk_size"])
+                mapping[recorded] = address
+            elif op == "get":
+                result = cas.get(address)
+            elif op == "get_view":
+                result = cas.get_view(address)
+            elif op == "has":
+                result = cas.has(address)
+            elif op == "read_range":
+                result = cas.read_range(address, event["offset"], event["length"])
+            else:
+                continue
+            latencies.setdefault(op, []).append(time.perf_counter() - started)
+            
+            if not op.startswith("put"):
+                lookups += 1
+                found += result is not None and result is not False
+    
+    return {
+        "events": sum(len(v) for v in latencies.values()),
+        "lookup_hit_rate": round(found / max(lookups, 1), 3),
+        "latency": {op: _percentiles(v) for op, v in sorted(latencies.items())},
+    }
+
+
+def _environment() -> Dict[str, Any]:
+    """Identify the code and machine a run was made on."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": time.time(),
+    }
+
+
+def _flatten(results: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    """Flatten nested results to dotted metric names."""
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Report metric changes between two runs."""
+    before = _flatten(baseline["results"])
+    after = _flatten(current["results"])
+    lines = [f"baseline {baseline['environment'].get('commit')} -> "
+             f"current {current['environment'].get('commit')}"]
+    for name in sorted(before.keys() & after.keys()):
+        old, new = before[name], after[name]
+        change = (new - old) / old * 100 if old else 0.0
+        lines.append(f"  {name:<55} {old:>14} -> {new:>14} ({change:+.1f}%)")
+    return lines
+
+
+def main() -> None:
+    """Run the selected benchmarks and emit JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--objects", type=int, default=200,
+                        help="objects per throughput/dedup scenario")
+    parser.add_argument("--open-objects", type=int, default=20000,
+                        help="objects in the store for the open-time scenario")
+    parser.add_argument("--memory", action="store_true",
+                        help="benchmark the in-memory store instead of disk")
+    parser.add_argument("--dir", default=None,
+                        help="directory for temporary stores")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--replay", help="replay a recorded JSON-lines trace")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="compare against an earlier results file")
+    args = parser.parse_args()
+    
+    workdir = args.dir or tempfile.gettempdir()
+    root = None if args.memory else workdir
+    results: Dict[str, Any] = {}
+    
+    if args.replay:
+        with open(args.replay) as f:
+            results["replay"] = replay_trace(root, (json.loads(line) for line in f if line.strip()))
+    else:
+        results["throughput"] = bench_throughput(root, args.objects, args.seed)
+        results["dedup"] = bench_dedup(root, args.objects, args.seed)
+        results["scrub_pauses"] = bench_scrub_pauses(workdir, args.objects, args.seed)
+        results["open"] = bench_open(workdir, args.open_objects)
+    
+    report = {
+        "environment": _environment(),
+        "parameters": vars(args),
+        "results": results,
+    }
+    
+    encoded = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(encoded + "\n")
+    print(encoded)
+    
+    if args.compare:
+        with open(args.compare) as f:
+            print("\n".join(compare(json.load(f), report)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,11 +11,19 @@ Implements role-based access control for secure permission management.
 """
 
 import logging
-from typing import Set, Dict, List
-from dataclasses import dataclass
+from collections import deque
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+WILDCARD = "*"
+
+
+def _segments(permission: str) -> List[str]:
+    """Split a permission into segments at ':' and '/'."""
+    return permission.replace("/", ":").split(":")
+
 
 @dataclass
 class Role:
@@ -23,6 +31,74 @@ class Role:
     name: str
     permissions: Set[str]
     description: str
+    inherits: Set[str] = field(default_factory=set)  # Roles whose permissions this one includes
+
+
+class _PermissionTrie:
+    """
+    Wildcard permission patterns compiled into a trie of segments.
+    
+    Permissions are split into segments at ':' and '/'. A '*' segment
+    at the end of a pattern matches one or more remaining segments, and
+    anywhere else exactly one, so "ledger:read:site/*" covers
+    "ledger:read:site/berlin/node1". Matching walks the permission's
+    segments once, ORing the bits of every pattern it satisfies.
+    """
+    
+    __slots__ = ("children", "exact", "below")
+    
+    def __init__(self):
+        """Initialize an empty node."""
+        self.children: Dict[str, "_PermissionTrie"] = {}
+        # Bits of patterns ending here, and of patterns ending in '*' here
+        self.exact = 0
+        self.below = 0
+    
+    def add(self, pattern: str, bit: int) -> None:
+        """
+        Insert a pattern.
+        
+        Args:
+            pattern: Permission pattern containing '*' segments
+            bit: The pattern's permission bit
+        """
+        segments = _segments(pattern)
+        node = self
+        for segment in segments[:-1]:
+            node = node.children.setdefault(segment, _PermissionTrie())
+        if segments[-1] == WILDCARD:
+            node.below |= bit
+        else:
+            node.children.setdefault(segments[-1], _PermissionTrie()).exact |= bit
+    
+    def match(self, permission: str) -> int:
+        """
+        Bits of the patterns a permission satisfies.
+        
+        Args:
+            permission: Concrete permission
+            
+        Returns:
+            OR of the matching patterns' bits
+        """
+        mask = 0
+        nodes = [self]
+        for segment in _segments(permission):
+            following = []
+            for node in nodes:
+                mask |= node.below
+                child = node.children.get(segment)
+                if child is not None:
+                    following.append(child)
+                child = node.children.get(WILDCARD)
+                if child is not None:
+                    following.append(child)
+            nodes = following
+            if not nodes:
+                return mask
+        for node in nodes:
+            mask |= node.exact
+        return mask
 
 
 class RBAC:
@@ -30,12 +106,55 @@ class RBAC:
     Role-Based Access Control system.
     
     Manages roles and permissions to control access to resources.
+    
+    Roles are compiled into integer bitmasks as they are added: each
+    permission gets a bit, each role the OR of its permissions' bits,
+    and each user the OR of their roles' masks. A permission check is
+    then a dict lookup and an AND, however many roles the user holds.
+    Change a role by adding it again or through grant_permission and
+    revoke_permission, so its mask is recompiled.
+    
+    A role may inherit from other roles. Each role's transitive closure
+    is folded into its mask and permission set when it is compiled, so
+    checks never walk the hierarchy; only adding or changing a role
+    does, to recompile the roles that inherit from it.
+    
+    Permissions may be scoped to resources and contain wildcards, such
+    as "ledger:read:site/*". Wildcard patterns get bits like any other
+    permission and are also compiled into one trie, so checking a
+    concrete permission against thousands of patterns costs one walk of
+    its segments plus the usual AND.
+    
+    Effective permission sets are cached per user and stamped with the
+    policy version at which the user's roles last changed. Only changes
+    to a user's own roles restamp them, so other users' entries stay
+    valid and a repeat lookup returns the cached set without building one.
     """
     
     def __init__(self):
         """Initialize RBAC system."""
         self.roles: Dict[str, Role] = {}
         self.user_roles: Dict[str, Set[str]] = {}
+        # Compiled policy: permission -> bit, role -> mask, user -> mask
+        self._permission_bits: Dict[str, int] = {}
+        self._patterns = _PermissionTrie()
+        self._has_patterns = False
+        self._role_masks: Dict[str, int] = {}
+        # Inheritance: role -> roles directly inheriting from it
+        self._heirs: Dict[str, Set[str]] = {}
+        # Effective permissions of each role, inherited ones included
+        self._role_permissions: Dict[str, FrozenSet[str]] = {}
+        self._user_masks: Dict[str, int] = {}
+        # Policy version, bumped on every change, and the version at which
+        # each user's effective permissions last changed
+        self._version = 0
+        self._user_versions: Dict[str, int] = {}
+        # Effective permissions: user -> (version built at, permissions)
+        self._permission_cache: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+        self.stats = {
+            "cache_hits": 0,
+            "cache_misses": 0
+        }
         
         # Define default roles
         self._initialize_default_roles()
@@ -45,40 +164,100 @@ class RBAC:
     def _initialize_default_roles(self) -> None:
         """Set up default roles."""
         
-        # Admin role
+        # Viewer role
         self.add_role(Role(
-            name="admin",
-            permissions={
-                "read", "write", "delete", "manage_users",
-                "manage_roles", "view_audit_log"
-            },
-            description="Full system access"
+            name="viewer",
+            permissions={"read"},
+            description="Read-only access"
         ))
         
         # Operator role
         self.add_role(Role(
             name="operator",
-            permissions={"read", "write", "view_audit_log"},
-            description="Standard operations"
+            permissions={"write", "view_audit_log"},
+            description="Standard operations",
+            inherits={"viewer"}
         ))
         
-        # Viewer role
+        # Admin role
         self.add_role(Role(
-            name="viewer",
-            permissions={"read"},
-            description="Read-only access"
+            name="admin",
+            permissions={"delete", "manage_users", "manage_roles"},
+            description="Full system access",
+            inherits={"operator"}
         ))
     
     def add_role(self, role: Role) -> None:
         """
-        Add a new role.
+        Add a new role, or replace one of the same name.
         
         Args:
             role: Role to add
+            
+        Raises:
+            ValueError: If the role inherits from an unknown role, or from
+                itself directly or indirectly
         """
+        for parent in role.inherits:
+            if parent not in self.roles and parent != role.name:
+                raise ValueError(f"Role {role.name} inherits from unknown role: {parent}")
+        cycle = self._find_cycle(role)
+        if cycle:
+            raise ValueError(f"Role inheritance cycle: {' -> '.join(cycle)}")
+        
+        previous = self.roles.get(role.name)
+        for parent in previous.inherits if previous else ():
+            self._heirs[parent].discard(role.name)
+        for parent in role.inherits:
+            self._heirs.setdefault(parent, set()).add(role.name)
         self.roles[role.name] = role
+        self._recompile_role(role.name)
         logger.info(f"Role added: {role.name}")
     
+    def grant_permission(self, role_name: str, permission: str) -> bool:
+        """
+        Add a permission to a role.
+        
+        Args:
+            role_name: Name of role to change
+            permission: Permission to grant
+            
+        Returns:
+            True if granted successfully
+        """
+        role = self.roles.get(role_name)
+        if role is None:
+            logger.error(f"Role not found: {role_name}")
+            return False
+        
+        if permission not in role.permissions:
+            role.permissions.add(permission)
+            self._recompile_role(role_name)
+            logger.info(f"Granted {permission} to role {role_name}")
+        return True
+    
+    def revoke_permission(self, role_name: str, permission: str) -> bool:
+        """
+        Remove a permission from a role.
+        
+        Args:
+            role_name: Name of role to change
+            permission: Permission to revoke
+            
+        Returns:
+            True if revoked successfully
+        """
+        role = self.roles.get(role_name)
+        if role is None:
+            logger.error(f"Role not found: {role_name}")
+            return False
+        
+        if permission in role.permissions:
+            role.permissions.discard(permission)
+            self._recompile_role(role_name)
+            logger.info(f"Revoked {permission} from role {role_name}")
+        return True
+    
     def assign_role(self, user_id: str, role_name: str) -> bool:
         """
         Assign role to user.
@@ -97,7 +276,10 @@ class RBAC:
         if user_id not in self.user_roles:
             self.user_roles[user_id] = set()
         
-        self.user_roles[user_id].add(role_name)
+        if role_name not in self.user_roles[user_id]:
+            self.user_roles[user_id].add(role_name)
+            self._user_masks[user_id] = self._user_masks.get(user_id, 0) | self._role_masks[role_name]
+            self._touch(user_id)
         logger.info(f"Assigned role {role_name} to user {user_id}")
         return True
     
@@ -107,22 +289,21 @@ class RBAC:
         
         Args:
             user_id: User identifier
-            permission: Permission to check
-            
+            permission: Permission to check, such as "write" or
+                "ledger:read:site/berlin/node1"
+                
         Returns:
-            True if user has permission
+            True if user has permission, exactly or through a wildcard
+            pattern
         """
-        if user_id not in self.user_roles:
+        mask = self._user_masks.get(user_id, 0)
+        if mask & self._permission_bits.get(permission, 0):
+            return True
+        if not (mask and self._has_patterns):
             return False
-        
-        for role_name in self.user_roles[user_id]:
-            role = self.roles.get(role_name)
-            if role and permission in role.permissions:
-                return True
-        
-        return False
+        return bool(mask & self._patterns.match(permission))
     
-    def get_user_permissions(self, user_id: str) -> Set[str]:
+    def get_user_permissions(self, user_id: str) -> FrozenSet[str]:
         """
         Get all permissions for a user.
         
@@ -130,17 +311,126 @@ class RBAC:
             user_id: User identifier
             
         Returns:
-            Set of permissions
+            Set of permissions, shared with the cache so not to be modified
         """
+        version = self._user_versions.get(user_id)
+        entry = self._permission_cache.get(user_id)
+        if entry is not None and entry[0] == version:
+            self.stats["cache_hits"] += 1
+            return entry[1]
+        
+        self.stats["cache_misses"] += 1
+        if user_id not in self.user_roles:
+            return frozenset()
+        
         permissions = set()
+        for role_name in self.user_roles[user_id]:
+            permissions.update(self._role_permissions.get(role_name, ()))
         
-        if user_id in self.user_roles:
-            for role_name in self.user_roles[user_id]:
-                role = self.roles.get(role_name)
-                if role:
-                    permissions.update(role.permissions)
+        frozen = frozenset(permissions)
+        self._permission_cache[user_id] = (version, frozen)
+        return frozen
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get effective-permission cache statistics.
         
-        return permissions
+        Returns:
+            Hit and miss counts, hit rate, cached users and policy version
+        """
+        lookups = self.stats["cache_hits"] + self.stats["cache_misses"]
+        return dict(
+            self.stats,
+            hit_rate=self.stats["cache_hits"] / lookups if lookups else 0.0,
+            cached_users=len(self._permission_cache),
+            version=self._version
+        )
+    
+    def _compile(self, permissions: Set[str]) -> int:
+        """Mask for a set of permissions, allocating bits for new ones."""
+        bits = self._permission_bits
+        mask = 0
+        for permission in permissions:
+            bit = bits.get(permission)
+            if bit is None:
+                bit = bits[permission] = 1 << len(bits)
+                if WILDCARD in _segments(permission):
+                    self._patterns.add(permission, bit)
+                    self._has_patterns = True
+            mask |= bit
+        return mask
+    
+    def _find_cycle(self, role: Role) -> Optional[List[str]]:
+        """Inheritance path from a role back to itself, if adding it would make one."""
+        if role.name in role.inherits:
+            return [role.name, role.name]
+        
+        # The hierarchy is acyclic already, so a cycle needs one of the new
+        # parents to inherit from the role: search the role's heirs for one
+        reached_from = {role.name: None}
+        pending = deque([role.name])
+        while pending:
+            name = pending.popleft()
+            for heir in self._heirs.get(name, ()):
+                if heir in reached_from:
+                    continue
+                reached_from[heir] = name
+                if heir in role.inherits:
+                    path = [role.name]
+                    while heir is not None:
+                        path.append(heir)
+                        heir = reached_from[heir]
+                    return path
+                pending.append(heir)
+        return None
+    
+    def _recompile_role(self, role_name: str) -> None:
+        """Recompile a role, the roles inheriting from it and the users holding any of them."""
+        # Roles inheriting from this one, directly or indirectly, and how
+        # many of each one's parents are among them
+        waiting = {role_name: 0}
+        pending = [role_name]
+        while pending:
+            for heir in self._heirs.get(pending.pop(), ()):
+                if heir not in waiting:
+                    waiting[heir] = 0
+                    pending.append(heir)
+                waiting[heir] += 1
+        
+        # Compile parents before heirs, so each role folds in its parents'
+        # already-closed masks and permissions
+        ready = [role_name]
+        while ready:
+            name = ready.pop()
+            role = self.roles[name]
+            permissions = set(role.permissions)
+            mask = self._compile(role.permissions)
+            for parent in role.inherits:
+                permissions.update(self._role_permissions[parent])
+                mask |= self._role_masks[parent]
+            self._role_permissions[name] = frozenset(permissions)
+            self._role_masks[name] = mask
+            for heir in self._heirs.get(name, ()):
+                waiting[heir] -= 1
+                if not waiting[heir]:
+                    ready.append(heir)
+        
+        for user_id, role_names in self.user_roles.items():
+            if not waiting.keys().isdisjoint(role_names):
+                self._user_masks[user_id] = self._user_mask(role_names)
+                self._touch(user_id)
+    
+    def _touch(self, user_id: str) -> None:
+        """Stamp a user's effective permissions as changed."""
+        self._version += 1
+        self._user_versions[user_id] = self._version
+    
+    def _user_mask(self, role_names: Set[str]) -> int:
+        """Mask for a set of roles."""
+        mask = 0
+        for role_name in role_names:
+            mask |= self._role_masks.get(role_name, 0)
+        return mask
 
 
 if __name__ == "__main__":
@@ -12,12 +12,83 @@ Implements an immutable audit ledger for tracking operations and decisions.
 
 import logging
 import hashlib
+import struct
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+from ..networking import codec
+from ..storage.cas import ContentAddressedStorage, IntegrityError
+
 logger = logging.getLogger(__name__)
 
+# Payloads larger than this (encoded) are stored by reference when a
+# payload store is configured
+DEFAULT_INLINE_THRESHOLD = 4096
+
+# Keys of a payload stored by reference. Top-level payload keys starting
+# with "$" are escaped with a second "$" when recorded, so recorded user
+# data never has these keys
+PAYLOAD_REF = "$payload_ref"
+PAYLOAD_SIZE = "$payload_size"
+
+
+def encode_payload(data: Dict[str, Any]) -> bytes:
+    """
+    Encode an entry payload for storage.
+    
+    Uses the P2P codec, so a stored payload resolves to the same values
+    (tuples, bytes) as an inline one.
+    
+    Raises:
+        CodecError: If the payload holds a type the codec cannot encode
+    """
+    return codec.encode(data)
+
+
+def offload_payload(
+    data: Dict[str, Any],
+    store: Optional[ContentAddressedStorage],
+    threshold: int = DEFAULT_INLINE_THRESHOLD
+) -> Dict[str, Any]:
+    """
+    Prepare a payload for recording.
+    
+    Args:
+        data: Payload
+        store: Storage for large payloads (None keeps all inline)
+        threshold: Largest encoded payload kept inline, in bytes
+        
+    Returns:
+        The payload with "$" keys escaped, or a reference holding the
+        address and size of the stored payload if it is too large
+        
+    Raises:
+        CodecError: If a store is given and the payload holds a type the
+            codec cannot encode
+    """
+    if store is not None:
+        encoded = encode_payload(data)
+        if len(encoded) > threshold:
+            return {PAYLOAD_REF: store.put(encoded), PAYLOAD_SIZE: len(encoded)}
+    
+    if not any(isinstance(key, str) and key.startswith("$") for key in data):
+        return data
+    return {
+        "$" + key if isinstance(key, str) and key.startswith("$") else key: value
+        for key, value in data.items()
+    }
+
+
+def _unescape_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Undo the key escaping of offload_payload for an inline payload."""
+    if not any(isinstance(key, str) and key.startswith("$$") for key in data):
+        return data
+    return {
+        key[1:] if isinstance(key, str) and key.startswith("$$") else key: value
+        for key, value in data.items()
+    }
+
 
 @dataclass
 class LedgerEntry:
@@ -30,6 +101,43 @@ class LedgerEntry:
     entry_hash: str
 
 
+# Wire layout of a LedgerEntry: index, timestamp, operation length and
+# both hashes, then the operation, then the data as a typed value
+_ENTRY_LAYOUT = struct.Struct("!QdH32s32s")
+
+
+def _pack_entry(entry: LedgerEntry) -> Tuple[bytes, Any]:
+    """Encode an entry for the P2P codec."""
+    operation = entry.operation.encode()
+    fixed = _ENTRY_LAYOUT.pack(
+        entry.index,
+        entry.timestamp,
+        len(operation),
+        bytes.fromhex(entry.previous_hash),
+        bytes.fromhex(entry.entry_hash)
+    )
+    return fixed + operation, entry.data
+
+
+def _unpack_entry(view: memoryview, pos: int) -> LedgerEntry:
+    """Decode an entry encoded by _pack_entry."""
+    index, timestamp, op_len, previous, entry_hash = _ENTRY_LAYOUT.unpack_from(view, pos)
+    pos += _ENTRY_LAYOUT.size
+    operation = str(view[pos:pos + op_len], "utf-8")
+    data, _ = codec.read_value(view, pos + op_len)
+    return LedgerEntry(
+        index=index,
+        timestamp=timestamp,
+        operation=operation,
+        data=data,
+        previous_hash=previous.hex(),
+        entry_hash=entry_hash.hex()
+    )
+
+
+codec.register(LedgerEntry, codec.MSG_LEDGER_ENTRY, _pack_entry, _unpack_entry)
+
+
 class ImmutableLedger:
     """
     Immutable audit ledger.
@@ -38,10 +146,29 @@ class ImmutableLedger:
     - Sequential entries
     - Hash chain linking
     - Integrity verification
+    
+    With a payload store, large entry payloads are written to
+    content-addressed storage and the entry keeps only their address and
+    size. The address is covered by the entry hash, so the chain still
+    commits to the full payload, and identical payloads are stored once.
+    Read payloads with resolve_data: entry data keeps reference keys, and
+    user keys starting with "$" are escaped so they cannot pass for one.
     """
     
-    def __init__(self):
-        """Initialize ledger."""
+    def __init__(
+        self,
+        payload_store: Optional[ContentAddressedStorage] = None,
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD
+    ):
+        """
+        Initialize ledger.
+        
+        Args:
+            payload_store: Storage for large payloads (None keeps all inline)
+            inline_threshold: Largest encoded payload kept inline, in bytes
+        """
+        self.payload_store = payload_store
+        self.inline_threshold = inline_threshold
         self.entries: List[LedgerEntry] = []
         self._add_genesis_entry()
         logger.info("Immutable Ledger initialized")
@@ -78,8 +205,13 @@ class ImmutableLedger:
             
         Returns:
             Created ledger entry
+            
+        Raises:
+            CodecError: If the payload would be stored by reference but
+                holds a type the codec cannot encode
         """
         previous = self.entries[-1]
+        data = offload_payload(data, self.payload_store, self.inline_threshold)
         
         entry = LedgerEntry(
             index=len(self.entries),
@@ -96,6 +228,50 @@ class ImmutableLedger:
         
         return entry
     
+    def extend(self, entries: List[LedgerEntry]) -> int:
+        """
+        Append entries replicated from another ledger.
+        
+        The entries must continue this ledger's chain. A ledger holding
+        only its own genesis entry may instead take entries from index 0,
+        replacing its genesis with the source's. Either all entries are
+        appended or none are.
+        
+        Args:
+            entries: Consecutive entries, oldest first
+            
+        Returns:
+            Number of entries appended
+            
+        Raises:
+            ValueError: If the entries do not start at the end of the chain
+            IntegrityError: If an entry's hash or chain link is wrong
+        """
+        if not entries:
+            return 0
+        
+        start = entries[0].index
+        if start == 0 and len(self.entries) == 1:
+            previous_hash = "0" * 64
+        elif start == len(self.entries):
+            previous_hash = self.entries[-1].entry_hash
+        else:
+            raise ValueError(
+                f"Entries start at index {start}, ledger has {len(self.entries)}"
+            )
+        
+        for offset, entry in enumerate(entries):
+            if entry.index != start + offset or entry.previous_hash != previous_hash:
+                raise IntegrityError(f"Chain broken at index {entry.index}")
+            if entry.entry_hash != self._compute_hash(entry):
+                raise IntegrityError(f"Hash mismatch at index {entry.index}")
+            previous_hash = entry.entry_hash
+        
+        del self.entries[start:]
+        self.entries.extend(entries)
+        logger.info(f"Ledger extended to index {self.entries[-1].index}")
+        return len(entries)
+    
     def verify_integrity(self) -> bool:
         """
         Verify integrity of entire ledger.
@@ -120,6 +296,35 @@ class ImmutableLedger:
         logger.info("Ledger integrity verified")
         return True
     
+    def resolve_data(self, entry: LedgerEntry) -> Dict[str, Any]:
+        """
+        Get the full payload of an entry.
+        
+        Payloads stored by reference are fetched, verified against their
+        address and decoded. Inline payloads come back with their keys
+        unescaped.
+        
+        Args:
+            entry: Ledger entry
+            
+        Returns:
+            Entry payload
+            
+        Raises:
+            IntegrityError: If the payload is missing or does not match
+        """
+        address = entry.data.get(PAYLOAD_REF)
+        if address is None:
+            return _unescape_payload(entry.data)
+        if self.payload_store is None:
+            raise IntegrityError(f"Payload of entry {entry.index} is unavailable")
+        
+        raw = self.payload_store.get(address)
+        if raw is None or not self.payload_store.verify(address, raw):
+            raise IntegrityError(f"Payload of entry {entry.index} is unavailable")
+        
+        return codec.decode(raw)
+    
     def get_entries(self, operation: Optional[str] = None) -> List[LedgerEntry]:
         """
         Get ledger entries, optionally filtered by operation.
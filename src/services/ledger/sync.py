@@ -0,0 +1,285 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Ledger Sync
+
+Implements anti-entropy replication of the immutable ledger between
+nodes by comparing range digests and transferring only missing entries.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any, Dict, Optional
+from dataclasses import dataclass
+
+from .ledger import ImmutableLedger
+from ..networking import codec
+from ..networking.p2p import P2PNetwork
+from ..networking.rpc import RpcError, RpcProtocol
+from ..storage.cas import IntegrityError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SyncConfig:
+    """Configuration for ledger sync"""
+    fanout: int = 16  # Sub-ranges compared per round when narrowing a difference
+    batch_size: int = 256  # Entries per transfer request
+    window: int = 4  # Transfer requests in flight at once
+    request_timeout: float = 5.0  # Seconds to wait for a reply
+    interval: float = 30.0  # Seconds between anti-entropy rounds
+
+
+@dataclass
+class SyncResult:
+    """Outcome of one sync round with a peer"""
+    received: int = 0  # Entries appended to the local ledger
+    diverged_at: Optional[int] = None  # First index where the chains fork
+    complete: bool = True  # False if the peer stopped answering or sent bad entries
+
+
+class LedgerSync:
+    """
+    Replicates ledger entries from peers.
+    
+    A sync round pulls from one peer. The nodes first compare ledger
+    heads; if they differ, the common prefix is narrowed down by asking
+    the peer for the digests of up to ``fanout`` ranges at a time and
+    recursing into the first range that does not match. Every entry hash
+    covers its predecessor, so the hash of a range's last entry is a
+    digest of the whole range and its history, and neither side rehashes
+    anything to answer. Entries past the common prefix are then streamed
+    in pipelined batches, so a lagging replica costs bandwidth in
+    proportion to its gap, plus a few digests.
+    
+    Received entries are verified and appended with
+    ``ImmutableLedger.extend``. A replica that holds only its genesis
+    entry adopts the peer's chain; any other fork is reported in the
+    result and left alone, since neither chain can be rewritten. Payloads
+    stored by reference are not transferred; fetch them by address with
+    the block exchange.
+    
+    Requests are RPC calls to the ledger.head, ledger.digests and
+    ledger.entries methods, so sync shares the peer connection fairly
+    with other RPC traffic.
+    """
+    
+    def __init__(
+        self,
+        network: P2PNetwork,
+        ledger: ImmutableLedger,
+        config: Optional[SyncConfig] = None,
+        rpc: Optional[RpcProtocol] = None
+    ):
+        """
+        Initialize ledger sync.
+        
+        Args:
+            network: Network to sync over
+            ledger: Local ledger
+            config: Sync configuration (uses defaults if None)
+            rpc: RPC endpoint on the network, to share with other services
+                (creates one if None)
+        """
+        self.network = network
+        self.ledger = ledger
+        self.config = config or SyncConfig()
+        self.rpc = rpc or RpcProtocol(network)
+        self.stats = {
+            "rounds": 0,
+            "in_sync": 0,
+            "digests_requested": 0,
+            "entries_received": 0,
+            "entries_served": 0,
+            "conflicts": 0,
+            "rejected": 0
+        }
+        self.rpc.register("ledger.head", self._serve_head)
+        self.rpc.register("ledger.digests", self._serve_digests)
+        self.rpc.register("ledger.entries", self._serve_entries)
+    
+    async def sync(self, peer: str) -> SyncResult:
+        """
+        Pull missing entries from a peer.
+        
+        Args:
+            peer: Peer to sync with
+            
+        Returns:
+            Sync outcome
+        """
+        self.stats["rounds"] += 1
+        head = await self._request(peer, "ledger.head")
+        if head is None:
+            return SyncResult(complete=False)
+        
+        remote_length = head["length"]
+        local_length = len(self.ledger.entries)
+        common = min(local_length, remote_length)
+        if remote_length == local_length and head["hash"] == self._hash_at(common):
+            self.stats["in_sync"] += 1
+            return SyncResult()
+        
+        matched = await self._common_prefix(peer, common)
+        if matched is None:
+            return SyncResult(complete=False)
+        if matched < common:
+            if matched > 0 or local_length > 1:
+                logger.error(f"Ledger forked from {peer} at index {matched}")
+                self.stats["conflicts"] += 1
+                return SyncResult(diverged_at=matched)
+            # A fresh replica adopts the peer's chain from genesis
+            local_length = 0
+        
+        if remote_length <= local_length:
+            return SyncResult()
+        return await self._transfer(peer, local_length, remote_length)
+    
+    async def sync_all(self) -> Dict[str, SyncResult]:
+        """
+        Pull missing entries from every known peer in turn.
+        
+        Returns:
+            Sync outcome per peer
+        """
+        return {peer: await self.sync(peer) for peer in list(self.network.peers)}
+    
+    async def run(self) -> None:
+        """Sync with a random peer periodically until cancelled."""
+        while True:
+            await asyncio.sleep(self.config.interval)
+            if self.network.peers:
+                await self.sync(random.choice(list(self.network.peers)))
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get sync status.
+        
+        Returns:
+            Local ledger length and sync counters
+        """
+        return dict(self.stats, length=len(self.ledger.entries))
+    
+    # Sync rounds
+    
+    async def _common_prefix(self, peer: str, length: int) -> Optional[int]:
+        """
+        Find how many leading entries two ledgers share.
+        
+        Args:
+            peer: Peer to compare with
+            length: Entries both ledgers have
+            
+        Returns:
+            Length of the shared prefix, or None if the peer stopped answering
+        """
+        if length == 0:
+            return 0
+        
+        # Invariant: prefixes of length lo match, of length hi differ
+        lo, hi = 0, length + 1
+        bounds = [length]
+        while True:
+            reply = await self._request(peer, "ledger.digests", {"bounds": bounds})
+            if reply is None:
+                return None
+            self.stats["digests_requested"] += len(bounds)
+            
+            for bound, digest in zip(bounds, reply["hashes"]):
+                if digest != self._hash_at(bound):
+                    hi = bound
+                    break
+                lo = bound
+            if hi - lo <= 1:
+                return lo
+            
+            span = hi - lo
+            count = min(self.config.fanout, span - 1)
+            bounds = sorted({lo + span * i // (count + 1) for i in range(1, count + 1)})
+    
+    async def _transfer(self, peer: str, start: int, end: int) -> SyncResult:
+        """
+        Stream entries [start, end) from a peer into the local ledger.
+        
+        Returns:
+            Sync outcome
+        """
+        cfg = self.config
+        result = SyncResult()
+        while start < end:
+            starts = range(start, min(end, start + cfg.window * cfg.batch_size), cfg.batch_size)
+            replies = await asyncio.gather(*(
+                self._request(peer, "ledger.entries", {
+                    "start": s,
+                    "count": min(cfg.batch_size, end - s)
+                })
+                for s in starts
+            ))
+            
+            for requested, reply in zip(starts, replies):
+                if not reply or not reply["entries"]:
+                    result.complete = False
+                    return result
+                try:
+                    entries = [codec.decode(data) for data in reply["entries"]]
+                    received = self.ledger.extend(entries)
+                except (codec.CodecError, ValueError, IntegrityError) as e:
+                    logger.error(f"Rejected ledger entries from {peer}: {e}")
+                    self.stats["rejected"] += 1
+                    result.complete = False
+                    return result
+                result.received += received
+                self.stats["entries_received"] += received
+                start = entries[-1].index + 1
+                if start < min(end, requested + cfg.batch_size):
+                    # The peer sent a short batch; re-request from here
+                    break
+        
+        logger.info(f"Received {result.received} ledger entries from {peer}")
+        return result
+    
+    def _hash_at(self, length: int) -> Optional[bytes]:
+        """Digest of the first ``length`` entries: the hash of the last one."""
+        if length == 0:
+            return b""
+        if length > len(self.ledger.entries):
+            return None
+        return bytes.fromhex(self.ledger.entries[length - 1].entry_hash)
+    
+    async def _request(
+        self,
+        peer: str,
+        method: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Call a sync method on a peer, returning None if the call fails or times out."""
+        try:
+            return await self.rpc.call(peer, method, params, timeout=self.config.request_timeout)
+        except (RpcError, asyncio.TimeoutError) as e:
+            logger.warning(f"Ledger sync {method} to {peer} failed: {e!r}")
+            return None
+    
+    # Serving
+    
+    async def _serve_head(self, peer: str, params: Any) -> Dict[str, Any]:
+        """Report the local ledger's length and head hash."""
+        length = len(self.ledger.entries)
+        return {"length": length, "hash": self._hash_at(length)}
+    
+    async def _serve_digests(self, peer: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Report the digests of the requested prefixes."""
+        return {"hashes": [self._hash_at(bound) for bound in params["bounds"]]}
+    
+    async def _serve_entries(self, peer: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a batch of encoded entries."""
+        start = params["start"]
+        count = min(params["count"], self.config.batch_size)
+        batch = self.ledger.entries[start:start + count]
+        self.stats["entries_served"] += len(batch)
+        return {"entries": [codec.encode(entry) for entry in batch]}
@@ -0,0 +1,350 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+P2P Message Codec
+
+Implements a compact, versioned binary encoding for P2P messages.
+
+Every message starts with a version byte and a type byte. Arbitrary
+values use a typed encoding (None, bool, int, float, str, bytes, list,
+tuple, dict); raw bytes are carried as-is, never base64. Tuples stay
+tuples, so ledger entry data hashes the same after a round trip. Hot
+message types (CAS chunks, heartbeats) have fixed struct layouts; other
+services register layouts for their own message classes, as the ledger
+does for its entries.
+"""
+
+import struct
+from typing import Any, Callable, Dict, List, Tuple, Union
+from dataclasses import dataclass
+
+CODEC_VERSION = 1
+
+# Message types
+MSG_VALUE = 0x01
+MSG_BYTES = 0x02
+MSG_LEDGER_ENTRY = 0x10  # Registered by the ledger service
+MSG_CAS_CHUNK = 0x11
+MSG_HEARTBEAT = 0x12
+
+# Value tags
+T_NONE = 0x00
+T_TRUE = 0x01
+T_FALSE = 0x02
+T_INT = 0x03
+T_BIGINT = 0x04
+T_FLOAT = 0x05
+T_STR = 0x06
+T_BYTES = 0x07
+T_LIST = 0x08
+T_DICT = 0x09
+T_TUPLE = 0x0A
+
+# Deepest nesting of lists, tuples and dicts accepted in either direction
+MAX_DEPTH = 64
+
+# Byte payloads at least this large are emitted as separate buffers
+# instead of being copied into the encoded header
+ZERO_COPY_MIN_BYTES = 4096
+
+_HEADER = struct.Struct("!BB")
+_U32 = struct.Struct("!I")
+_I64 = struct.Struct("!q")
+_F64 = struct.Struct("!d")
+_CHUNK = struct.Struct("!32sI")
+_HEARTBEAT = struct.Struct("!Qd")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class CodecError(Exception):
+    """Message cannot be encoded or decoded"""
+
+
+# Registered layouts: class -> (message type, pack), message type -> unpack
+_PACKERS: Dict[type, Tuple[int, Callable[[Any], Tuple[bytes, Any]]]] = {}
+_UNPACKERS: Dict[int, Callable[[memoryview, int], Any]] = {}
+
+
+@dataclass
+class CasChunk:
+    """One chunk of a content-addressed object"""
+    address: str
+    index: int
+    data: Buffer
+
+
+@dataclass
+class Heartbeat:
+    """Liveness heartbeat"""
+    seq: int
+    sent_at: float
+
+
+class _Writer:
+    """Accumulates encoded output as a list of buffers."""
+    
+    def __init__(self):
+        self.parts: List[Buffer] = []
+        self.out = bytearray()
+    
+    def raw(self, data: Buffer) -> None:
+        """Append bytes, by reference when large."""
+        if len(data) >= ZERO_COPY_MIN_BYTES:
+            if self.out:
+                self.parts.append(self.out)
+                self.out = bytearray()
+            self.parts.append(memoryview(data))
+        else:
+            self.out += data
+    
+    def finish(self) -> List[Buffer]:
+        """Return the encoded buffers."""
+        if self.out or not self.parts:
+            self.parts.append(self.out)
+        return self.parts
+
+
+def _write_value(w: _Writer, value: Any, depth: int = 0) -> None:
+    """Encode one typed value."""
+    out = w.out
+    if value is None:
+        out.append(T_NONE)
+    elif value is True:
+        out.append(T_TRUE)
+    elif value is False:
+        out.append(T_FALSE)
+    elif isinstance(value, int):
+        if -(1 << 63) <= value < (1 << 63):
+            out.append(T_INT)
+            out += _I64.pack(value)
+        else:
+            raw = value.to_bytes((value.bit_length() + 8) // 8, "big", signed=True)
+            out.append(T_BIGINT)
+            out += _U32.pack(len(raw)) + raw
+    elif isinstance(value, float):
+        out.append(T_FLOAT)
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        raw = value.encode()
+        out.append(T_STR)
+        out += _U32.pack(len(raw)) + raw
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        out.append(T_BYTES)
+        out += _U32.pack(len(value))
+        w.raw(value)
+    elif isinstance(value, (list, tuple)):
+        if depth >= MAX_DEPTH:
+            raise CodecError("Message nested too deeply")
+        out.append(T_TUPLE if isinstance(value, tuple) else T_LIST)
+        out += _U32.pack(len(value))
+        for item in value:
+            _write_value(w, item, depth + 1)
+    elif isinstance(value, dict):
+        if depth >= MAX_DEPTH:
+            raise CodecError("Message nested too deeply")
+        out.append(T_DICT)
+        out += _U32.pack(len(value))
+        for key, item in value.items():
+            _write_value(w, key, depth + 1)
+            _write_value(w, item, depth + 1)
+    else:
+        raise CodecError(f"Cannot encode {type(value).__name__}")
+
+
+def _read_value(view: memoryview, pos: int, depth: int = 0):
+    """Decode one typed value; returns (value, next position)."""
+    tag = view[pos]
+    pos += 1
+    if tag == T_NONE:
+        return None, pos
+    if tag == T_TRUE:
+        return True, pos
+    if tag == T_FALSE:
+        return False, pos
+    if tag == T_INT:
+        return _I64.unpack_from(view, pos)[0], pos + 8
+    if tag == T_FLOAT:
+        return _F64.unpack_from(view, pos)[0], pos + 8
+    
+    if tag in (T_BIGINT, T_STR, T_BYTES):
+        (length,) = _U32.unpack_from(view, pos)
+        start, end = pos + 4, pos + 4 + length
+        if end > len(view):
+            raise CodecError("Truncated message")
+        raw = view[start:end]
+        if tag == T_STR:
+            return str(raw, "utf-8"), end
+        if tag == T_BYTES:
+            return raw.tobytes(), end
+        return int.from_bytes(raw, "big", signed=True), end
+    
+    if tag in (T_LIST, T_TUPLE, T_DICT):
+        if depth >= MAX_DEPTH:
+            raise CodecError("Message nested too deeply")
+        (count,) = _U32.unpack_from(view, pos)
+        pos += 4
+        if tag != T_DICT:
+            items = []
+            for _ in range(count):
+                item, pos = _read_value(view, pos, depth + 1)
+                items.append(item)
+            return (tuple(items) if tag == T_TUPLE else items), pos
+        mapping = {}
+        for _ in range(count):
+            key, pos = _read_value(view, pos, depth + 1)
+            mapping[key], pos = _read_value(view, pos, depth + 1)
+        return mapping, pos
+    
+    raise CodecError(f"Unknown value tag {tag:#x}")
+
+
+def read_value(view: memoryview, pos: int) -> Tuple[Any, int]:
+    """
+    Decode one typed value, for registered layouts.
+    
+    Args:
+        view: Encoded message
+        pos: Offset of the value
+        
+    Returns:
+        The value and the offset just past it
+    """
+    return _read_value(view, pos)
+
+
+def register(
+    cls: type,
+    msg_type: int,
+    pack: Callable[[Any], Tuple[bytes, Any]],
+    unpack: Callable[[memoryview, int], Any]
+) -> None:
+    """
+    Register the wire layout of a message class.
+    
+    Lets a service give its own hot message type a fixed layout without
+    the codec importing it.
+    
+    Args:
+        cls: Message class (exact type; subclasses are not matched)
+        msg_type: Message type byte
+        pack: Called with a message; returns the bytes that follow the
+            message header and a typed value encoded after them
+        unpack: Called with the encoded message and the offset just past
+            its header; returns the message
+            
+    Raises:
+        ValueError: If the message type is taken by another class
+    """
+    builtin = (MSG_VALUE, MSG_BYTES, MSG_CAS_CHUNK, MSG_HEARTBEAT)
+    owner = next((c for c, (t, _) in _PACKERS.items() if t == msg_type), None)
+    if msg_type in builtin or owner not in (None, cls):
+        raise ValueError(f"Message type {msg_type:#x} is already registered")
+    _PACKERS[cls] = (msg_type, pack)
+    _UNPACKERS[msg_type] = unpack
+
+
+def encode_parts(message: Any) -> List[Buffer]:
+    """
+    Encode a message as a list of buffers.
+    
+    Large byte payloads are referenced rather than copied, so the parts
+    can be written to a socket without joining them.
+    
+    Args:
+        message: CasChunk, Heartbeat, a registered message, bytes, or a
+            typed value
+        
+    Returns:
+        Buffers whose concatenation is the encoded message
+        
+    Raises:
+        CodecError: If the message contains an unsupported type or is
+            nested deeper than MAX_DEPTH
+    """
+    w = _Writer()
+    kind = type(message)
+    
+    if kind is Heartbeat:
+        w.out += _HEADER.pack(CODEC_VERSION, MSG_HEARTBEAT)
+        w.out += _HEARTBEAT.pack(message.seq, message.sent_at)
+    elif kind is CasChunk:
+        w.out += _HEADER.pack(CODEC_VERSION, MSG_CAS_CHUNK)
+        w.out += _CHUNK.pack(bytes.fromhex(message.address), message.index)
+        w.raw(message.data)
+    elif kind in _PACKERS:
+        msg_type, pack = _PACKERS[kind]
+        fixed, value = pack(message)
+        w.out += _HEADER.pack(CODEC_VERSION, msg_type)
+        w.out += fixed
+        _write_value(w, value)
+    elif kind in (bytes, bytearray, memoryview):
+        w.out += _HEADER.pack(CODEC_VERSION, MSG_BYTES)
+        w.raw(message)
+    else:
+        w.out += _HEADER.pack(CODEC_VERSION, MSG_VALUE)
+        _write_value(w, message)
+    
+    return w.finish()
+
+
+def encode(message: Any) -> bytes:
+    """
+    Encode a message into a single buffer.
+    
+    Args:
+        message: CasChunk, Heartbeat, a registered message, bytes, or a
+            typed value
+        
+    Returns:
+        Encoded message
+    """
+    return b"".join(encode_parts(message))
+
+
+def decode(data: Buffer) -> Any:
+    """
+    Decode a message.
+    
+    CAS chunk data is returned as a memoryview into the input buffer.
+    
+    Args:
+        data: Encoded message
+        
+    Returns:
+        Decoded message
+        
+    Raises:
+        CodecError: If the message is malformed or from an unknown version
+    """
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise CodecError("Truncated message")
+    
+    version, kind = _HEADER.unpack_from(view, 0)
+    if version != CODEC_VERSION:
+        raise CodecError(f"Unsupported codec version {version}")
+    pos = _HEADER.size
+    
+    try:
+        if kind == MSG_VALUE:
+            value, _ = _read_value(view, pos)
+            return value
+        if kind == MSG_BYTES:
+            return view[pos:].tobytes()
+        if kind == MSG_HEARTBEAT:
+            return Heartbeat(*_HEARTBEAT.unpack_from(view, pos))
+        if kind == MSG_CAS_CHUNK:
+            address, index = _CHUNK.unpack_from(view, pos)
+            return CasChunk(address.hex(), index, view[pos + _CHUNK.size:])
+        if kind in _UNPACKERS:
+            return _UNPACKERS[kind](view, pos)
+    except (struct.error, IndexError, UnicodeDecodeError, TypeError, RecursionError) as e:
+        # TypeError: a list or dict decoded as a map key
+        raise CodecError(f"Malformed message: {e}") from e
+    
+    raise CodecError(f"Unknown message type {kind:#x}")
@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Link Compression
+
+Implements per-connection zlib stream compression with a preset dictionary.
+"""
+
+import hashlib
+import zlib
+from typing import Any, Dict, List, Optional, Sequence
+from dataclasses import dataclass
+
+from . import codec
+from .codec import Buffer, Heartbeat
+
+
+@dataclass
+class CompressionConfig:
+    """Configuration for link compression"""
+    enabled: bool = True
+    level: int = 6
+    min_size: int = 128  # Smaller frames are sent uncompressed
+    probe_size: int = 1024  # Sample size for the compressibility check
+    skip_ratio: float = 0.9  # Skip frames whose sample compresses worse than this
+    fast_link_rtt: float = 0.002  # Skip links with a faster round trip, in seconds
+
+
+def _build_dictionary() -> bytes:
+    """
+    Build the preset dictionary from encodings of typical messages.
+    
+    zlib matches against the end of the dictionary first, so the most
+    frequent content (gossip and telemetry) goes last.
+    """
+    samples = [
+        {"id": 0, "key": bytes(32)},
+        {"id": 0, "nodes": [["node", "10.0.0.1", 7400]]},
+        {"node_id": "node", "port": 7400, "compression": ["zlib"]},
+        # Ledger entry operations and payloads, including payload references
+        "process_start", {"input": {}},
+        "process_complete", {"result": {}},
+        "ethics_flag", {"phase": "pre_process", "term": "", "action": "review_required"},
+        {"$payload_ref": "0" * 64, "$payload_size": 0},
+        {"type": "ihave", "ids": [bytes(16)]},
+        {"type": "iwant", "ids": [bytes(16)]},
+        {
+            "site_type": "telecom_tower", "location": "rural",
+            "inputs": ["pv", "wind", "genset", "grid"], "storage_kwh": 0.0,
+            "priority_loads_kw": 0.0, "thermal_integration": True,
+            "timestamp": 0.0, "soc": 0.0, "load_kw": 0.0, "fuel_offset": 0.0
+        },
+        Heartbeat(0, 0.0),
+        {"type": "msg", "id": bytes(16), "origin": "node", "ttl": 8, "data": {}},
+    ]
+    return b"".join(codec.encode(sample) for sample in samples)
+
+
+PRESET_DICTIONARY = _build_dictionary()
+
+# Both ends must use the same dictionary, so its digest is part of the
+# algorithm name advertised in the handshake
+ALGORITHM = "zlib-" + hashlib.sha256(PRESET_DICTIONARY).hexdigest()[:16]
+
+
+def negotiate(offered: Sequence[str]) -> Optional[str]:
+    """
+    Pick the algorithm to compress with, given what a peer accepts.
+    
+    Args:
+        offered: Algorithms the peer can decompress
+        
+    Returns:
+        Algorithm name, or None to send uncompressed
+    """
+    return ALGORITHM if ALGORITHM in offered else None
+
+
+class StreamCompressor:
+    """
+    Compresses the frames sent on one connection.
+    
+    All frames share one zlib stream, so repeated field names and values
+    across small messages compress well. Each frame is sync-flushed and
+    can be decompressed as soon as it arrives. Frames that are too small
+    or whose leading bytes do not compress are skipped before entering
+    the stream, so encrypted or already-compressed payloads cost only a
+    small probe. So are all frames while the link's fastest measured
+    round trip is under fast_link_rtt: on a LAN, compressing costs more
+    time than sending the bytes saves.
+    """
+    
+    def __init__(
+        self,
+        config: Optional[CompressionConfig] = None,
+        link: Optional[Any] = None
+    ):
+        """
+        Initialize compressor.
+        
+        Args:
+            config: Compression configuration (uses defaults if None)
+            link: Telemetry of the connection, whose rtt histogram (if
+                any) decides whether the link is fast
+        """
+        self.config = config or CompressionConfig()
+        self.link = link
+        self._stream = zlib.compressobj(self.config.level, zdict=PRESET_DICTIONARY)
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.skipped = 0
+    
+    def compress(self, parts: Sequence[Buffer]) -> Optional[bytes]:
+        """
+        Compress one frame payload.
+        
+        Args:
+            parts: Payload buffers
+            
+        Returns:
+            Compressed payload, or None to send the frame as-is
+        """
+        cfg = self.config
+        size = sum(len(part) for part in parts)
+        if size < cfg.min_size or self._fast_link() or not self._compressible(parts, size):
+            self.skipped += 1
+            return None
+        
+        out: List[bytes] = [self._stream.compress(part) for part in parts]
+        out.append(self._stream.flush(zlib.Z_SYNC_FLUSH))
+        compressed = b"".join(out)
+        self.bytes_in += size
+        self.bytes_out += len(compressed)
+        return compressed
+    
+    def _fast_link(self) -> bool:
+        """Check whether round trips on the link show it is too fast to compress for."""
+        rtt = getattr(self.link, "rtt", None)
+        return rtt is not None and rtt.count > 0 and rtt.min < self.config.fast_link_rtt
+    
+    def _compressible(self, parts: Sequence[Buffer], size: int) -> bool:
+        """Check whether a sample of a large payload compresses."""
+        cfg = self.config
+        if size <= cfg.probe_size:
+            return True
+        
+        sample = bytearray()
+        for part in parts:
+            sample += memoryview(part)[:cfg.probe_size - len(sample)]
+            if len(sample) >= cfg.probe_size:
+                break
+        return len(zlib.compress(sample, 1)) < len(sample) * cfg.skip_ratio
+    
+    def get_status(self) -> Dict[str, float]:
+        """
+        Get compression counters.
+        
+        Returns:
+            Bytes in and out of the compressor, skipped frames and ratio
+        """
+        return {
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "skipped": self.skipped,
+            "ratio": self.bytes_out / self.bytes_in if self.bytes_in else 1.0
+        }
+
+
+class StreamDecompressor:
+    """Decompresses the compressed frames received on one connection."""
+    
+    def __init__(self, max_frame_size: int):
+        """
+        Initialize decompressor.
+        
+        Args:
+            max_frame_size: Largest accepted decompressed payload, in bytes
+        """
+        self.max_frame_size = max_frame_size
+        self._stream = zlib.decompressobj(zdict=PRESET_DICTIONARY)
+    
+    def decompress(self, data: Buffer) -> bytes:
+        """
+        Decompress one frame payload.
+        
+        Args:
+            data: Compressed payload
+            
+        Returns:
+            Original payload
+            
+        Raises:
+            ValueError: If the data is corrupt or inflates past the limit
+        """
+        try:
+            out = self._stream.decompress(data, self.max_frame_size)
+        except zlib.error as e:
+            raise ValueError(f"Corrupt compressed frame: {e}") from e
+        if self._stream.unconsumed_tail:
+            raise ValueError("Compressed frame exceeds size limit")
+        return out
@@ -0,0 +1,365 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+CAS Block Exchange
+
+Implements a want/have protocol for fetching content-addressed objects
+from peers, downloading the chunks of large objects from several peers
+in parallel.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+
+from .codec import CasChunk
+from .p2p import FRAME_EXCHANGE, P2PNetwork
+from ..storage.cas import ChunkManifest, ContentAddressedStorage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExchangeConfig:
+    """Configuration for block exchange"""
+    max_inflight_per_peer: int = 8  # Outstanding block requests per holder
+    request_timeout: float = 10.0  # Seconds to wait for one block
+    query_timeout: float = 2.0  # Seconds to wait for have and manifest replies
+    max_peer_failures: int = 3  # Stop asking a peer after this many failures
+
+
+class BlockExchange:
+    """
+    Fetches CAS objects from peers and serves local ones.
+    
+    A fetch first asks peers whether they hold the object (want-have),
+    then gets its chunk manifest from one holder and requests the missing
+    chunks from every holder at once, keeping a few requests in flight
+    per peer. Faster peers therefore serve more chunks, and aggregate
+    throughput grows with the number of holders.
+    
+    Each chunk is checked against its address before it is stored. When
+    only in-flight chunks remain, idle peers request them too; the first
+    copy to arrive wins and the other requests are cancelled.
+    """
+    
+    def __init__(
+        self,
+        network: P2PNetwork,
+        store: ContentAddressedStorage,
+        config: Optional[ExchangeConfig] = None
+    ):
+        """
+        Initialize block exchange.
+        
+        Args:
+            network: Network to exchange blocks over
+            store: Local content-addressed storage
+            config: Exchange configuration (uses defaults if None)
+        """
+        self.network = network
+        self.store = store
+        self.config = config or ExchangeConfig()
+        # Outstanding block requests: address -> peer -> arrival future
+        self._requests: Dict[str, Dict[str, asyncio.Future]] = {}
+        # Outstanding have/manifest queries: (reply type, peer, address)
+        self._queries: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        # Blocks each peer has asked us for, in request order
+        self._serving: Dict[str, "OrderedDict[str, None]"] = {}
+        self._servers: Dict[str, asyncio.Task] = {}
+        self.stats = {
+            "blocks_received": 0,
+            "bytes_received": 0,
+            "duplicates": 0,
+            "corrupt": 0,
+            "cancels_sent": 0,
+            "blocks_served": 0
+        }
+        network.register_protocol(FRAME_EXCHANGE, self._on_message)
+    
+    async def fetch(self, address: str, peers: Optional[List[str]] = None) -> bool:
+        """
+        Fetch an object from peers into the local store.
+        
+        Args:
+            address: Content address
+            peers: Peers to ask (defaults to all known peers)
+            
+        Returns:
+            True if the object is stored locally
+        """
+        if self.store.has(address):
+            return True
+        
+        holders = await self.find_holders(address, peers)
+        if not holders:
+            logger.warning(f"No peer holds {address[:16]}...")
+            return False
+        
+        found, manifest = await self._fetch_manifest(address, holders)
+        if not found:
+            return False
+        
+        chunks = manifest.chunks if manifest else [address]
+        missing = list(OrderedDict.fromkeys(c for c in chunks if not self.store.has(c)))
+        if not await self._fetch_blocks(missing, holders):
+            return False
+        
+        if manifest:
+            self.store.put_manifest(manifest)
+        logger.info(f"Fetched {address[:16]}... from {len(holders)} peers")
+        return True
+    
+    async def find_holders(
+        self,
+        address: str,
+        peers: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Ask peers whether they hold an object.
+        
+        Args:
+            address: Content address
+            peers: Peers to ask (defaults to all known peers)
+            
+        Returns:
+            Peers that hold the object
+        """
+        peers = list(self.network.peers) if peers is None else peers
+        replies = await asyncio.gather(*(
+            self._query(peer, {"type": "want_have", "address": address}, "have")
+            for peer in peers
+        ))
+        return [peer for peer, reply in zip(peers, replies) if reply and reply["has"]]
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get exchange status.
+        
+        Returns:
+            Transfer counters and outstanding request counts
+        """
+        return dict(
+            self.stats,
+            inflight=sum(len(r) for r in self._requests.values()),
+            serving=sum(len(q) for q in self._serving.values())
+        )
+    
+    # Fetching
+    
+    async def _fetch_manifest(
+        self,
+        address: str,
+        holders: List[str]
+    ) -> Tuple[bool, Optional[ChunkManifest]]:
+        """
+        Get an object's chunk manifest from the first holder that sends it.
+        
+        Returns:
+            (found, manifest); manifest is None for unchunked objects
+        """
+        for peer in holders:
+            query = {"type": "want_manifest", "address": address}
+            reply = await self._query(peer, query, "manifest")
+            if reply is None or not reply["has"]:
+                continue
+            if reply["data"] is None:
+                return True, None
+            
+            if hashlib.sha256(reply["data"]).hexdigest() != address:
+                logger.warning(f"Peer {peer} sent a corrupt manifest for {address[:16]}...")
+                self.stats["corrupt"] += 1
+                continue
+            return True, ChunkManifest.from_bytes(reply["data"])
+        return False, None
+    
+    async def _fetch_blocks(self, addresses: List[str], holders: List[str]) -> bool:
+        """
+        Fetch blocks from several holders in parallel.
+        
+        Args:
+            addresses: Blocks to fetch
+            holders: Peers that hold them
+            
+        Returns:
+            True if every block is stored locally
+        """
+        queue: Deque[str] = deque(addresses)
+        wanted = set(addresses)
+        failures: Dict[str, int] = {peer: 0 for peer in holders}
+        
+        def next_for(peer: str) -> Optional[str]:
+            """Next block for a peer: queued first, then endgame duplicates."""
+            while queue:
+                address = queue.popleft()
+                if not self.store.has(address):
+                    return address
+            for address in wanted:
+                requested = self._requests.get(address)
+                if requested and peer not in requested and not self.store.has(address):
+                    return address
+            return None
+        
+        async def worker(peer: str) -> None:
+            """Keep one request in flight to a peer."""
+            while failures[peer] < self.config.max_peer_failures:
+                address = next_for(peer)
+                if address is None:
+                    return
+                if not await self._request_block(peer, address):
+                    failures[peer] += 1
+                    if not self.store.has(address) and address not in queue:
+                        queue.append(address)
+        
+        await asyncio.gather(*(
+            worker(peer)
+            for peer in holders
+            for _ in range(self.config.max_inflight_per_peer)
+        ))
+        missing = [a for a in addresses if not self.store.has(a)]
+        if missing:
+            logger.warning(f"Could not fetch {len(missing)} of {len(addresses)} blocks")
+        return not missing
+    
+    async def _request_block(self, peer: str, address: str) -> bool:
+        """
+        Request one block from a peer and wait for it from any peer.
+        
+        Returns:
+            True if the block arrived, False on timeout or refusal
+        """
+        requests = self._requests.setdefault(address, {})
+        future = requests[peer] = asyncio.get_running_loop().create_future()
+        try:
+            if not await self._send(peer, {"type": "want", "address": address}):
+                return False
+            return await asyncio.wait_for(future, self.config.request_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Block {address[:16]}... from {peer} timed out")
+            await self._cancel(peer, address)
+            return False
+        finally:
+            requests = self._requests.get(address)
+            if requests is not None:
+                requests.pop(peer, None)
+                if not requests:
+                    del self._requests[address]
+    
+    async def _query(
+        self,
+        peer: str,
+        message: Dict[str, Any],
+        reply_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """Send a query and wait for the matching reply, or None on timeout."""
+        key = (reply_type, peer, message["address"])
+        future = self._queries[key] = asyncio.get_running_loop().create_future()
+        try:
+            if not await self._send(peer, message):
+                return None
+            return await asyncio.wait_for(future, self.config.query_timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._queries.pop(key, None)
+    
+    async def _cancel(self, peer: str, address: str) -> None:
+        """Withdraw a block request from a peer."""
+        self.stats["cancels_sent"] += 1
+        await self._send(peer, {"type": "cancel", "address": address})
+    
+    async def _send(self, peer: str, message: Any) -> bool:
+        """Send an exchange message to a peer."""
+        return await self.network.send_frame(peer, FRAME_EXCHANGE, message)
+    
+    # Message handling
+    
+    async def _on_message(self, peer: str, message: Any) -> None:
+        """Dispatch an exchange message."""
+        if isinstance(message, CasChunk):
+            await self._on_block(peer, message)
+            return
+        
+        kind = message.get("type")
+        address = message.get("address")
+        if kind == "want_have":
+            reply = {"type": "have", "address": address, "has": self.store.has(address)}
+            await self._send(peer, reply)
+        elif kind == "want_manifest":
+            await self._send_manifest(peer, address)
+        elif kind == "want":
+            self._serve(peer, address)
+        elif kind == "cancel":
+            self._serving.get(peer, {}).pop(address, None)
+        elif kind == "dont_have":
+            future = self._requests.get(address, {}).get(peer)
+            if future and not future.done():
+                future.set_result(False)
+        elif kind in ("have", "manifest"):
+            future = self._queries.get((kind, peer, address))
+            if future and not future.done():
+                future.set_result(message)
+        else:
+            logger.warning(f"Unknown exchange message from {peer}: {kind}")
+    
+    async def _on_block(self, peer: str, chunk: CasChunk) -> None:
+        """Verify and store an arriving block, then cancel duplicate requests."""
+        requests = self._requests.get(chunk.address)
+        if requests is None or self.store.has(chunk.address):
+            self.stats["duplicates"] += 1
+            return
+        
+        if hashlib.sha256(chunk.data).hexdigest() != chunk.address:
+            logger.warning(f"Peer {peer} sent a corrupt block {chunk.address[:16]}...")
+            self.stats["corrupt"] += 1
+            future = requests.get(peer)
+            if future and not future.done():
+                future.set_result(False)
+            return
+        
+        self.store.put(bytes(chunk.data))
+        self.stats["blocks_received"] += 1
+        self.stats["bytes_received"] += len(chunk.data)
+        
+        for other, future in list(requests.items()):
+            if not future.done():
+                future.set_result(True)
+            if other != peer:
+                await self._cancel(other, chunk.address)
+    
+    async def _send_manifest(self, peer: str, address: str) -> None:
+        """Answer a manifest query."""
+        manifest = self.store.get_manifest(address)
+        reply = {
+            "type": "manifest",
+            "address": address,
+            "has": self.store.has(address),
+            "data": manifest.to_bytes() if manifest else None
+        }
+        await self._send(peer, reply)
+    
+    def _serve(self, peer: str, address: str) -> None:
+        """Queue a requested block for sending to a peer."""
+        self._serving.setdefault(peer, OrderedDict())[address] = None
+        server = self._servers.get(peer)
+        if server is None or server.done():
+            self._servers[peer] = asyncio.ensure_future(self._serve_loop(peer))
+    
+    async def _serve_loop(self, peer: str) -> None:
+        """Send requested blocks to a peer in order, skipping cancelled ones."""
+        wants = self._serving[peer]
+        while wants:
+            address, _ = wants.popitem(last=False)
+            stat = self.store.stat(address)
+            if stat is None or stat.codec != "raw":
+                await self._send(peer, {"type": "dont_have", "address": address})
+                continue
+            await self._send(peer, CasChunk(address, 0, self.store.get_view(address)))
+            self.stats["blocks_served"] += 1
@@ -0,0 +1,415 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Failure Detector
+
+Implements heartbeat scheduling on a hierarchical timer wheel and
+phi-accrual suspicion of silent peers.
+"""
+
+import logging
+import math
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FailureDetectorConfig:
+    """Configuration for heartbeats and failure detection"""
+    enabled: bool = True
+    heartbeat_interval: float = 1.0  # Seconds between heartbeats to each peer
+    threshold: float = 8.0  # Phi at which a peer is declared dead
+    window: int = 100  # Heartbeat intervals kept per peer
+    min_std: float = 0.5  # Floor for the interval standard deviation
+    acceptable_pause: float = 1.0  # Extra silence tolerated before suspicion grows
+    tick: float = 0.1  # Timer wheel resolution in seconds
+    check_interval: float = 0.5  # Seconds between checks of a silent peer
+
+
+class Timer:
+    """A timer scheduled on a TimerWheel."""
+    
+    __slots__ = ("deadline", "callback", "_slot")
+    
+    def __init__(self, deadline: int, callback: Callable[[], None]):
+        """
+        Initialize timer.
+        
+        Args:
+            deadline: Tick at which the timer fires
+            callback: Called when the timer fires
+        """
+        self.deadline = deadline
+        self.callback = callback
+        self._slot: Optional[Dict[int, "Timer"]] = None
+    
+    @property
+    def active(self) -> bool:
+        """Whether the timer is still waiting to fire."""
+        return self._slot is not None
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel.
+    
+    Level 0 has one slot per tick; each higher level has slots covering
+    a whole turn of the level below. A timer goes into the lowest level
+    whose span reaches its deadline and moves down a level each time
+    that level's slot comes round, so scheduling, cancelling and
+    advancing one tick all cost O(1) however many timers are pending.
+    """
+    
+    def __init__(self, tick: float = 0.1, bits: int = 6, levels: int = 4, start: float = 0.0):
+        """
+        Initialize wheel.
+        
+        Args:
+            tick: Seconds per tick
+            bits: log2 of the slots per level
+            levels: Number of levels; later deadlines wait in the top level
+            start: Time of tick 0, in seconds
+        """
+        self.tick = tick
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+        self.levels = levels
+        self.start = start
+        self.now = 0
+        self._wheels: List[List[Dict[int, Timer]]] = [
+            [{} for _ in range(1 << bits)] for _ in range(levels)
+        ]
+        self._count = 0
+    
+    def __len__(self) -> int:
+        """Number of pending timers."""
+        return self._count
+    
+    def schedule(self, delay: float, callback: Callable[[], None]) -> Timer:
+        """
+        Schedule a callback.
+        
+        Args:
+            delay: Seconds from the current tick; rounded up to whole ticks
+            callback: Called when the timer fires
+            
+        Returns:
+            Timer handle for cancel()
+        """
+        ticks = max(1, math.ceil(delay / self.tick - 1e-9))
+        timer = Timer(self.now + ticks, callback)
+        self._place(timer)
+        self._count += 1
+        return timer
+    
+    def cancel(self, timer: Timer) -> None:
+        """
+        Cancel a timer if it has not fired.
+        
+        Args:
+            timer: Timer handle
+        """
+        if timer._slot is not None:
+            del timer._slot[id(timer)]
+            timer._slot = None
+            self._count -= 1
+    
+    def advance(self, now: float) -> int:
+        """
+        Fire every timer due by a given time.
+        
+        Args:
+            now: Current time in seconds
+            
+        Returns:
+            Number of timers fired
+        """
+        target = int((now - self.start) / self.tick + 1e-9)
+        if not self._count:
+            # Nothing pending: skip idle ticks
+            self.now = max(self.now, target)
+            return 0
+        fired = 0
+        while self.now < target:
+            self.now += 1
+            self._cascade()
+            slot = self._wheels[0][self.now & self.mask]
+            while slot:
+                _, timer = slot.popitem()
+                timer._slot = None
+                self._count -= 1
+                fired += 1
+                timer.callback()
+        return fired
+    
+    def _place(self, timer: Timer) -> None:
+        """Put a timer in the slot for its deadline."""
+        delta = timer.deadline - self.now
+        level = 0
+        while level < self.levels - 1 and delta >= 1 << (self.bits * (level + 1)):
+            level += 1
+        if delta >= 1 << (self.bits * self.levels):
+            # Beyond the top level: wait in its furthest slot and re-place
+            index = (self.now >> (self.bits * level)) - 1
+        else:
+            index = timer.deadline >> (self.bits * level)
+        slot = self._wheels[level][index & self.mask]
+        slot[id(timer)] = timer
+        timer._slot = slot
+    
+    def _cascade(self) -> None:
+        """Move timers down from higher levels whose slot has come round."""
+        for level in range(1, self.levels):
+            if (self.now >> (self.bits * (level - 1))) & self.mask:
+                return
+            slot = self._wheels[level][(self.now >> (self.bits * level)) & self.mask]
+            timers = list(slot.values())
+            slot.clear()
+            for timer in timers:
+                self._place(timer)
+
+
+class PhiAccrual:
+    """
+    Phi-accrual suspicion level for one peer.
+    
+    Keeps a sliding window of heartbeat inter-arrival times and models
+    them as a normal distribution. Phi is -log10 of the probability that
+    a heartbeat would still be outstanding after the current silence:
+    phi 8 means a live peer would be this late about once in 10^8
+    heartbeats. Jittery links widen the distribution, so the same
+    threshold tolerates longer silences there.
+    """
+    
+    def __init__(self, config: FailureDetectorConfig, now: float):
+        """
+        Initialize with an estimate of one interval.
+        
+        Args:
+            config: Detector configuration
+            now: Time tracking starts
+        """
+        self.config = config
+        self.last = now
+        self._intervals: Deque[float] = deque()
+        self._sum = 0.0
+        self._squares = 0.0
+        # Seed the window so phi is meaningful before real samples arrive
+        estimate = config.heartbeat_interval
+        self._add(estimate - estimate / 4)
+        self._add(estimate + estimate / 4)
+    
+    def heartbeat(self, now: float) -> None:
+        """
+        Record a heartbeat arrival.
+        
+        Args:
+            now: Arrival time
+        """
+        self._add(now - self.last)
+        self.last = now
+    
+    def phi(self, now: float) -> float:
+        """
+        Suspicion level after the silence since the last heartbeat.
+        
+        Args:
+            now: Current time
+            
+        Returns:
+            Phi; higher is more suspect
+        """
+        count = len(self._intervals)
+        mean = self._sum / count
+        variance = max(self._squares / count - mean * mean, 0.0)
+        std = max(math.sqrt(variance), self.config.min_std)
+        
+        y = (now - self.last - mean - self.config.acceptable_pause) / std
+        # Logistic approximation of the normal tail
+        e = math.exp(-y * (1.5976 + 0.070566 * y * y))
+        if y > 0:
+            return -math.log10(e / (1.0 + e))
+        return -math.log10(1.0 - 1.0 / (1.0 + e))
+    
+    def _add(self, interval: float) -> None:
+        """Add one interval to the window, evicting the oldest."""
+        self._intervals.append(interval)
+        self._sum += interval
+        self._squares += interval * interval
+        if len(self._intervals) > self.config.window:
+            old = self._intervals.popleft()
+            self._sum -= old
+            self._squares -= old * old
+
+
+class FailureDetector:
+    """
+    Heartbeats and phi-accrual failure detection for many peers.
+    
+    Each tracked peer has two timers on a shared wheel: one to send the
+    next heartbeat, and one to check the peer once it has been silent
+    for longer than usual. A heartbeat moves the check timer forward, so
+    peers that keep talking are never examined, and the per-tick cost
+    does not grow with the number of peers. A silent peer is rechecked
+    every check_interval until it speaks or its phi crosses the
+    threshold, when on_dead is called.
+    
+    Any traffic from a peer may be reported as a heartbeat, and the send
+    callback may skip a heartbeat on a link that is already busy, so
+    heartbeats only flow on idle links. Arrivals closer together than
+    half a heartbeat interval are coalesced into one, so bursts neither
+    skew the interval distribution nor cost more than a comparison.
+    """
+    
+    def __init__(
+        self,
+        send: Callable[[str, int], None],
+        on_dead: Callable[[str, float], None],
+        config: Optional[FailureDetectorConfig] = None,
+        start: float = 0.0
+    ):
+        """
+        Initialize detector.
+        
+        Args:
+            send: Sends heartbeat (peer_id, sequence number); returns False
+                if it was skipped because the link carried other traffic
+            on_dead: Called with (peer_id, phi) when a peer is declared dead
+            config: Detector configuration (uses defaults if None)
+            start: Current time, in the clock passed to other methods
+        """
+        self.config = config or FailureDetectorConfig()
+        self._send = send
+        self._on_dead = on_dead
+        self.wheel = TimerWheel(self.config.tick, start=start)
+        self.peers: Dict[str, PhiAccrual] = {}
+        # peer -> [next heartbeat timer, next check timer]
+        self._timers: Dict[str, List[Timer]] = {}
+        self._seq = 0
+        self._now = start
+        self.stats = {
+            "heartbeats_sent": 0,
+            "heartbeats_skipped": 0,
+            "heartbeats_received": 0,
+            "checks": 0,
+            "evictions": 0
+        }
+    
+    def track(self, peer_id: str, now: float) -> None:
+        """
+        Start heartbeating and watching a peer.
+        
+        Args:
+            peer_id: Peer ID
+            now: Current time
+        """
+        if peer_id in self.peers:
+            return
+        self.advance(now)
+        self.peers[peer_id] = PhiAccrual(self.config, now)
+        self._timers[peer_id] = [
+            self.wheel.schedule(self.config.heartbeat_interval, lambda: self._beat(peer_id)),
+            self._schedule_check(peer_id)
+        ]
+    
+    def untrack(self, peer_id: str) -> None:
+        """
+        Stop heartbeating and watching a peer.
+        
+        Args:
+            peer_id: Peer ID
+        """
+        self.peers.pop(peer_id, None)
+        for timer in self._timers.pop(peer_id, []):
+            self.wheel.cancel(timer)
+    
+    def heartbeat(self, peer_id: str, now: float) -> None:
+        """
+        Record a heartbeat, or any other traffic, from a peer.
+        
+        Args:
+            peer_id: Peer ID
+            now: Arrival time
+        """
+        detector = self.peers.get(peer_id)
+        if detector is None or now - detector.last < self.config.heartbeat_interval / 2:
+            return
+        self.advance(now)
+        self.stats["heartbeats_received"] += 1
+        detector.heartbeat(now)
+        timers = self._timers[peer_id]
+        self.wheel.cancel(timers[1])
+        timers[1] = self._schedule_check(peer_id)
+    
+    def phi(self, peer_id: str, now: float) -> Optional[float]:
+        """
+        Current suspicion level of a peer.
+        
+        Args:
+            peer_id: Peer ID
+            now: Current time
+            
+        Returns:
+            Phi, or None if the peer is not tracked
+        """
+        detector = self.peers.get(peer_id)
+        return detector.phi(now) if detector else None
+    
+    def advance(self, now: float) -> None:
+        """
+        Send due heartbeats and check silent peers.
+        
+        Args:
+            now: Current time
+        """
+        self._now = now
+        self.wheel.advance(now)
+    
+    def get_status(self) -> Dict[str, float]:
+        """
+        Get detector counters.
+        
+        Returns:
+            Heartbeat, check and eviction counts and tracked peers
+        """
+        return dict(self.stats, tracked=len(self.peers))
+    
+    def _schedule_check(self, peer_id: str) -> Timer:
+        """Schedule a check for when the peer's next heartbeat is overdue."""
+        cfg = self.config
+        return self.wheel.schedule(
+            cfg.heartbeat_interval + cfg.acceptable_pause, lambda: self._check(peer_id)
+        )
+    
+    def _beat(self, peer_id: str) -> None:
+        """Send a heartbeat and schedule the next one."""
+        self._seq += 1
+        self._timers[peer_id][0] = self.wheel.schedule(
+            self.config.heartbeat_interval, lambda: self._beat(peer_id)
+        )
+        if self._send(peer_id, self._seq) is False:
+            self.stats["heartbeats_skipped"] += 1
+        else:
+            self.stats["heartbeats_sent"] += 1
+    
+    def _check(self, peer_id: str) -> None:
+        """Declare a silent peer dead, or check it again later."""
+        self.stats["checks"] += 1
+        phi = self.peers[peer_id].phi(self._now)
+        if phi < self.config.threshold:
+            self._timers[peer_id][1] = self.wheel.schedule(
+                self.config.check_interval, lambda: self._check(peer_id)
+            )
+            return
+        
+        logger.warning(f"Peer {peer_id} declared dead (phi {phi:.1f})")
+        self.stats["evictions"] += 1
+        self.untrack(peer_id)
+        self._on_dead(peer_id, phi)
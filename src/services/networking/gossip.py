@@ -0,0 +1,243 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Gossip Broadcast
+
+Implements epidemic broadcast with bounded fanout, TTL and deduplication.
+"""
+
+import asyncio
+import logging
+import os
+import random
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Gossip message types
+GOSSIP_MSG = "msg"
+GOSSIP_IHAVE = "ihave"
+GOSSIP_IWANT = "iwant"
+
+
+@dataclass
+class GossipConfig:
+    """Configuration for gossip broadcast"""
+    fanout: int = 6  # Peers each node forwards a new message to
+    ttl: int = 8  # Maximum forwarding hops
+    cache_size: int = 10000  # Message IDs remembered for deduplication
+    history_size: int = 1000  # Recent messages kept to answer IWANT
+    repair_interval: float = 1.0  # Seconds between IHAVE announcements
+    repair_fanout: int = 3  # Peers sent each IHAVE announcement
+    repair_rounds: int = 3  # Repair rounds announcing each message ID
+
+
+class SeenCache:
+    """
+    Bounded set of recently seen message IDs.
+    
+    The oldest ID is evicted once the cache is full, so memory stays
+    constant however many messages pass through.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize cache.
+        
+        Args:
+            capacity: Maximum number of IDs remembered
+        """
+        self.capacity = capacity
+        self._ids: "OrderedDict[bytes, None]" = OrderedDict()
+    
+    def add(self, message_id: bytes) -> bool:
+        """
+        Record a message ID.
+        
+        Args:
+            message_id: Message ID
+            
+        Returns:
+            True if the ID was not already in the cache
+        """
+        if message_id in self._ids:
+            self._ids.move_to_end(message_id)
+            return False
+        
+        self._ids[message_id] = None
+        if len(self._ids) > self.capacity:
+            self._ids.popitem(last=False)
+        return True
+    
+    def __contains__(self, message_id: bytes) -> bool:
+        return message_id in self._ids
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class GossipProtocol:
+    """
+    Epidemic broadcast over a set of peers.
+    
+    A published message is pushed to a few random peers, and every node
+    forwards a message to a few random peers the first time it sees it,
+    until its TTL runs out. With fanout f each node sends at most f copies
+    of a message, and the fleet is covered in O(log N) rounds.
+    
+    Pushes can miss nodes, so each node also periodically announces the
+    IDs it received recently (IHAVE); peers missing any of them request
+    them (IWANT) and receive them from the announcer's history. Each ID
+    is announced for repair_rounds rounds, to fresh random peers each
+    time, so a node that missed both the push and one announcement still
+    catches up.
+    """
+    
+    def __init__(
+        self,
+        node_id: str,
+        send: Callable[[str, Dict[str, Any]], Awaitable[bool]],
+        peers: Callable[[], List[str]],
+        deliver: Callable[[str, Any], None],
+        config: Optional[GossipConfig] = None
+    ):
+        """
+        Initialize gossip protocol.
+        
+        Args:
+            node_id: This node's ID
+            send: Sends a gossip message to a peer
+            peers: Returns the IDs of currently known peers
+            deliver: Called with (origin, data) once per new message
+            config: Gossip configuration (uses defaults if None)
+        """
+        self.node_id = node_id
+        self.config = config or GossipConfig()
+        self._send = send
+        self._peers = peers
+        self._deliver = deliver
+        self.seen = SeenCache(self.config.cache_size)
+        self.history: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        # IDs to announce, with the repair rounds left for each
+        self._recent: "OrderedDict[bytes, int]" = OrderedDict()
+        self.stats = {"published": 0, "delivered": 0, "duplicates": 0, "sent": 0}
+    
+    async def publish(self, data: Any) -> bytes:
+        """
+        Broadcast data to the whole network.
+        
+        Args:
+            data: Message payload
+            
+        Returns:
+            Message ID
+        """
+        message_id = os.urandom(16)
+        message = {
+            "type": GOSSIP_MSG,
+            "id": message_id,
+            "origin": self.node_id,
+            "ttl": self.config.ttl,
+            "data": data
+        }
+        self.seen.add(message_id)
+        self._remember(message)
+        self.stats["published"] += 1
+        await self._forward(message, exclude=set())
+        return message_id
+    
+    async def receive(self, peer_id: str, message: Dict[str, Any]) -> None:
+        """
+        Handle a gossip message from a peer.
+        
+        Args:
+            peer_id: Sending peer
+            message: Gossip message
+        """
+        kind = message.get("type")
+        
+        if kind == GOSSIP_MSG:
+            await self._on_msg(peer_id, message)
+        elif kind == GOSSIP_IHAVE:
+            wanted = [i for i in message["ids"] if i not in self.seen]
+            if wanted:
+                await self._send_to(peer_id, {"type": GOSSIP_IWANT, "ids": wanted})
+        elif kind == GOSSIP_IWANT:
+            for message_id in message["ids"]:
+                stored = self.history.get(message_id)
+                if stored:
+                    await self._send_to(peer_id, stored)
+        else:
+            logger.warning(f"Unknown gossip message from {peer_id}: {kind}")
+    
+    async def repair(self) -> None:
+        """Announce recently published and received message IDs to a few random peers."""
+        ids = []
+        for message_id, rounds in list(self._recent.items()):
+            if message_id not in self.history:
+                # Evicted, so an IWANT could not be answered
+                del self._recent[message_id]
+                continue
+            ids.append(message_id)
+            if rounds > 1:
+                self._recent[message_id] = rounds - 1
+            else:
+                del self._recent[message_id]
+        if not ids:
+            return
+        
+        announce = {"type": GOSSIP_IHAVE, "ids": ids}
+        targets = self._choose(self.config.repair_fanout, exclude=set())
+        await asyncio.gather(*(self._send_to(peer, announce) for peer in targets))
+    
+    async def run(self) -> None:
+        """Run periodic repair rounds until cancelled."""
+        while True:
+            await asyncio.sleep(self.config.repair_interval)
+            await self.repair()
+    
+    async def _on_msg(self, peer_id: str, message: Dict[str, Any]) -> None:
+        """Deliver and forward a message the first time it is seen."""
+        if not self.seen.add(message["id"]):
+            self.stats["duplicates"] += 1
+            return
+        
+        self._remember(message)
+        self.stats["delivered"] += 1
+        try:
+            self._deliver(message["origin"], message["data"])
+        except Exception as e:
+            logger.error(f"Gossip handler failed: {e}")
+        
+        if message["ttl"] > 1:
+            relay = dict(message, ttl=message["ttl"] - 1)
+            await self._forward(relay, exclude={peer_id, message["origin"]})
+    
+    async def _forward(self, message: Dict[str, Any], exclude: Set[str]) -> None:
+        """Push a message to fanout random peers."""
+        targets = self._choose(self.config.fanout, exclude)
+        await asyncio.gather(*(self._send_to(peer, message) for peer in targets))
+    
+    async def _send_to(self, peer_id: str, message: Dict[str, Any]) -> None:
+        """Send one gossip message, counting it."""
+        self.stats["sent"] += 1
+        await self._send(peer_id, message)
+    
+    def _choose(self, count: int, exclude: Set[str]) -> List[str]:
+        """Pick up to count random peers not in exclude."""
+        candidates = [p for p in self._peers() if p not in exclude]
+        return random.sample(candidates, min(count, len(candidates)))
+    
+    def _remember(self, message: Dict[str, Any]) -> None:
+        """Keep a message to announce in the next IHAVE rounds and answer IWANT requests."""
+        self.history[message["id"]] = message
+        if len(self.history) > self.config.history_size:
+            self.history.popitem(last=False)
+        if len(self._recent) < self.config.history_size:
+            self._recent[message["id"]] = self.config.repair_rounds
@@ -10,12 +10,46 @@ P2P Networking Protocol
 Implements peer-to-peer networking for decentralized MAYA Node communication.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import struct
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Any
 from dataclasses import dataclass
 
+from . import codec
+from .compression import (
+    ALGORITHM, CompressionConfig, StreamCompressor, StreamDecompressor, negotiate
+)
+from .failure_detector import FailureDetector, FailureDetectorConfig
+from .gossip import GossipConfig, GossipProtocol
+from .pool import ConnectionPool, PoolConfig
+from .routing import RoutingConfig, RoutingTable, iterative_lookup, node_key
+from .sendqueue import SendQueue, SendQueueConfig, split_batch
+from .session import NodeIdentity, SessionConfig, SessionError, SessionManager
+from .telemetry import NetworkTelemetry, TelemetryConfig
+from .transport import FramedConnection, TcpTransport
+
 logger = logging.getLogger(__name__)
 
+# First byte of every frame identifies its kind
+FRAME_HELLO = 0x00
+FRAME_MESSAGE = 0x01
+FRAME_PING = 0x03
+FRAME_PONG = 0x04
+FRAME_GOSSIP = 0x05
+FRAME_FIND_NODE = 0x06
+FRAME_NODES = 0x07
+FRAME_BATCH = 0x08
+FRAME_EXCHANGE = 0x09
+FRAME_HEARTBEAT = 0x0B
+FRAME_RPC = 0x0C
+FRAME_SESSION = 0x0D
+
+MessageHandler = Callable[[str, Any], None]
+ProtocolHandler = Callable[[str, Any], Awaitable[None]]
+
 
 @dataclass
 class PeerInfo:
@@ -33,25 +67,172 @@ class P2PNetwork:
     
     Provides decentralized networking with:
     - Peer discovery
-    - Encrypted communications
+    - Encrypted communications (with an identity key)
     - Message routing
+    
+    All connections are served by one asyncio event loop. The coroutine
+    API (open, connect, send, send_all, close) runs on the caller's loop;
+    the blocking API (start, connect_peer, send_message, broadcast, stop)
+    runs that loop in a background thread, starting it on first use.
+    
+    Connections are pooled per peer and kept open between messages.
+    Each peer has a bounded send queue, so a slow peer cannot stall
+    sends to others, and small messages are coalesced into batch frames.
+    Messages can be broadcast either by unicast to every peer, or by
+    gossip, where each node forwards to a few peers and messages are
+    relayed through the network.
+    
+    Nodes do not need to know each other: a Kademlia routing table keeps
+    O(log N) contacts, and find_node locates any node in O(log N) hops.
+    Nodes contacted during lookups join peers only if the routing table
+    admits them, so broadcasts and gossip reach explicitly connected
+    peers and routing contacts, not every node a lookup passed through.
+    
+    Connected peers heartbeat each other over otherwise idle links, and
+    any frame counts as a heartbeat; a peer that falls silent while
+    its connection stays open is evicted once the failure detector's
+    phi reaches its threshold.
+    
+    A node given an identity key encrypts every connection: a signed key
+    exchange when a connection opens, or a resumption ticket when it
+    reopens, then authenticated encryption of each frame. Peers' public
+    keys are learned on first contact unless already set in PeerInfo.
     """
     
-    def __init__(self, node_id: str, port: int = 0):
+    def __init__(
+        self,
+        node_id: str,
+        port: int = 0,
+        host: str = "0.0.0.0",
+        pool_config: Optional[PoolConfig] = None,
+        gossip_config: Optional[GossipConfig] = None,
+        routing_config: Optional[RoutingConfig] = None,
+        queue_config: Optional[SendQueueConfig] = None,
+        compression_config: Optional[CompressionConfig] = None,
+        detector_config: Optional[FailureDetectorConfig] = None,
+        telemetry_config: Optional[TelemetryConfig] = None,
+        identity: Optional[NodeIdentity] = None,
+        session_config: Optional[SessionConfig] = None,
+        transport: Optional[Any] = None
+    ):
         """
         Initialize P2P network node.
         
         Args:
             node_id: Unique identifier for this node
             port: Port to listen on (0 for auto)
+            host: Interface to listen on
+            pool_config: Connection pool configuration
+            gossip_config: Gossip broadcast configuration
+            routing_config: Kademlia routing configuration
+            queue_config: Per-peer send queue configuration
+            compression_config: Link compression configuration
+            detector_config: Heartbeat and failure detection configuration
+            telemetry_config: Per-peer telemetry configuration
+            identity: Identity key; when set, every connection is encrypted
+            session_config: Secure session configuration
+            transport: Transport to listen and dial with (TCP if None)
         """
         self.node_id = node_id
         self.port = port
+        self.host = host
         self.peers: Dict[str, PeerInfo] = {}
+        self.handlers: List[MessageHandler] = []
+        self.protocols: Dict[int, ProtocolHandler] = {}
+        
+        self.transport = transport or TcpTransport()
+        self.pool = ConnectionPool(self._dial, self._send_ping, pool_config)
+        self.gossip = GossipProtocol(
+            node_id,
+            send=lambda peer_id, msg: self._send(peer_id, msg, FRAME_GOSSIP),
+            peers=lambda: list(self.peers),
+            deliver=self._deliver,
+            config=gossip_config
+        )
+        self.routing_config = routing_config or RoutingConfig()
+        self.routing = RoutingTable(node_id, self.routing_config.k)
+        self.queue_config = queue_config or SendQueueConfig()
+        self.queues: Dict[str, SendQueue] = {}
+        self.compression_config = compression_config or CompressionConfig()
+        self.detector = FailureDetector(self._send_heartbeat, self._evict, detector_config)
+        self.telemetry = NetworkTelemetry(telemetry_config)
+        self.sessions: Optional[SessionManager] = None
+        if identity:
+            self.sessions = SessionManager(
+                node_id, identity,
+                send=lambda connection, msg: connection.send_parts(self._encode(msg, FRAME_SESSION)),
+                established=self._on_session,
+                known_key=lambda peer_id: getattr(self.peers.get(peer_id), "public_key", None),
+                config=session_config
+            )
+        self._requests: Dict[int, asyncio.Future] = {}
+        self._next_request = 0
+        self._contacts: Dict[str, PeerInfo] = {}
+        self._background: List[asyncio.Task] = []
+        self._tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._listening = False
         
         logger.info(f"P2P Network initialized: {node_id}")
     
-    def connect_peer(self, peer_info: PeerInfo) -> bool:
+    def on_message(self, handler: MessageHandler) -> None:
+        """
+        Register a handler for received messages.
+        
+        Handlers run on the network's event loop and must not block.
+        
+        Args:
+            handler: Called with (peer_id, message)
+        """
+        self.handlers.append(handler)
+    
+    def register_protocol(self, kind: int, handler: ProtocolHandler) -> None:
+        """
+        Route frames of one kind to a protocol instead of message handlers.
+        
+        Args:
+            kind: Frame kind byte reserved for the protocol
+            handler: Coroutine called with (peer_id, message) for each frame
+            
+        Raises:
+            ValueError: If the kind already has a protocol
+        """
+        if kind in self.protocols:
+            raise ValueError(f"Frame kind {kind:#x} already registered")
+        self.protocols[kind] = handler
+    
+    # Coroutine API
+    
+    async def open(self) -> None:
+        """Start listening for peers on the running loop."""
+        if self._listening:
+            return
+        self._loop = asyncio.get_running_loop()
+        self.port = await self.transport.listen(
+            self.host, self.port, self._protocol
+        )
+        self._background = [
+            asyncio.ensure_future(self.pool.maintain()),
+            asyncio.ensure_future(self.gossip.run()),
+            asyncio.ensure_future(self._refresh_loop())
+        ]
+        if self.detector.config.enabled:
+            self._background.append(asyncio.ensure_future(self._detector_loop()))
+        self._listening = True
+    
+    async def close(self) -> None:
+        """Stop listening and close all peer connections."""
+        for task in self._background:
+            task.cancel()
+        self._background = []
+        for queue in self.queues.values():
+            queue.close()
+        await self.transport.close()
+        self.pool.close_all()
+        self._listening = False
+    
+    async def connect(self, peer_info: PeerInfo) -> bool:
         """
         Connect to a peer.
         
@@ -61,35 +242,681 @@ class P2PNetwork:
         Returns:
             True if connected successfully
         """
-        # TODO: Implement actual peer connection
         self.peers[peer_info.peer_id] = peer_info
-        logger.info(f"Connected to peer: {peer_info.peer_id}")
+        if await self._connection(peer_info.peer_id) is None:
+            return False
+        self.routing.add(peer_info)
         return True
     
+    async def send(self, peer_id: str, message: Any) -> bool:
+        """
+        Send message to a peer.
+        
+        Args:
+            peer_id: Target peer ID
+            message: Any message the codec can encode
+            
+        Returns:
+            True if queued for sending; False if the peer is unreachable,
+            or its queue is full under the drop policy
+        """
+        return await self._send(peer_id, message, FRAME_MESSAGE)
+    
+    async def send_all(self, message: Any) -> None:
+        """
+        Send message to all peers concurrently.
+        
+        Args:
+            message: Message to broadcast
+        """
+        await asyncio.gather(
+            *(self.send(peer_id, message) for peer_id in list(self.peers))
+        )
+    
+    async def send_frame(self, peer_id: str, kind: int, message: Any) -> bool:
+        """
+        Send a message for a registered protocol.
+        
+        Args:
+            peer_id: Target peer ID
+            kind: Protocol frame kind
+            message: Message to encode
+            
+        Returns:
+            True if queued for sending
+        """
+        return await self._send(peer_id, message, kind)
+    
+    async def publish(self, message: Any) -> bytes:
+        """
+        Broadcast message to the whole network by gossip.
+        
+        Peers receive it once, with the publishing node as sender, even
+        if it was relayed by other nodes.
+        
+        Args:
+            message: Message to broadcast
+            
+        Returns:
+            Gossip message ID
+        """
+        return await self.gossip.publish(message)
+    
+    async def find_node(self, node_id: str) -> List[PeerInfo]:
+        """
+        Find the nodes closest to a node ID by iterative lookup.
+        
+        Args:
+            node_id: Target node ID
+            
+        Returns:
+            Up to k responsive nodes, closest first; the target itself
+            comes first if it is reachable
+        """
+        key = node_key(node_id)
+        self.routing.mark_lookup(key, asyncio.get_running_loop().time())
+        return await iterative_lookup(
+            self.routing, key, lambda peer: self._query_nodes(peer, key),
+            self.routing_config.alpha
+        )
+    
+    async def bootstrap(self, seeds: List[PeerInfo]) -> int:
+        """
+        Join the network through known nodes.
+        
+        Looks up this node's own ID to populate nearby buckets, then
+        refreshes the farther ones.
+        
+        Args:
+            seeds: Nodes to join through
+            
+        Returns:
+            Number of contacts in the routing table
+        """
+        for seed in seeds:
+            await self.connect(seed)
+        await self.find_node(self.node_id)
+        await self.refresh(force=True)
+        return len(self.routing)
+    
+    async def refresh(self, force: bool = False) -> None:
+        """
+        Look up a random ID in every bucket not recently looked up.
+        
+        Args:
+            force: Refresh every bucket regardless of age
+        """
+        now = asyncio.get_running_loop().time()
+        interval = 0.0 if force else self.routing_config.refresh_interval
+        for index in self.routing.stale_buckets(now, interval):
+            key = self.routing.random_key(index)
+            self.routing.mark_lookup(key, now)
+            await iterative_lookup(
+                self.routing, key, lambda peer: self._query_nodes(peer, key),
+                self.routing_config.alpha
+            )
+    
+    async def wait_writable(self, peer_id: str) -> None:
+        """
+        Wait until a peer's send queue has drained below its low-water mark.
+        
+        Args:
+            peer_id: Peer ID
+        """
+        queue = self.queues.get(peer_id)
+        if queue:
+            await queue.wait_writable()
+    
+    async def wait_queued(self, peer_id: str, limit: int) -> None:
+        """
+        Wait until no more than a given number of bytes are queued for a peer.
+        
+        Args:
+            peer_id: Peer ID
+            limit: Queued bytes to wait for
+        """
+        queue = self.queues.get(peer_id)
+        if queue:
+            await queue.wait_below(limit)
+    
+    def get_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get send queue metrics.
+        
+        Returns:
+            Queue status keyed by peer ID
+        """
+        return {peer_id: queue.get_status() for peer_id, queue in self.queues.items()}
+    
+    def get_compression_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get outbound compression metrics for pooled connections.
+        
+        Returns:
+            Compressor status keyed by peer ID, for compressed links
+        """
+        stats = {}
+        for peer_id, slot in self.pool.slots.items():
+            if slot.connection and slot.connection.compressor:
+                stats[peer_id] = slot.connection.compressor.get_status()
+        return stats
+    
+    def get_peer_health(self) -> Dict[str, float]:
+        """
+        Get the failure detector's suspicion level of each connected peer.
+        
+        Returns:
+            Phi keyed by peer ID; peers are evicted when it reaches the
+            configured threshold
+        """
+        if self._loop is None:
+            return {}
+        # The node's own loop, so this works from the blocking API's thread too
+        now = self._loop.time()
+        return {peer_id: self.detector.phi(peer_id, now) for peer_id in self.detector.peers}
+    
+    def get_peer_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-peer telemetry.
+        
+        Returns:
+            Bytes and messages in and out, send queue depth, reconnects
+            and round-trip latency summary, keyed by peer ID
+        """
+        stats = {}
+        for peer_id, telemetry in self.telemetry.peers.items():
+            status = telemetry.get_status()
+            queue = self.queues.get(peer_id)
+            slot = self.pool.slots.get(peer_id)
+            status["queue_depth"] = queue.depth if queue else 0
+            status["queued_bytes"] = queue.queued_bytes if queue else 0
+            status["reconnects"] = max(slot.connections - 1, 0) if slot else 0
+            stats[peer_id] = status
+        return stats
+    
+    # Blocking API
+    
+    def start(self) -> None:
+        """Start the background event loop and begin listening."""
+        if self._thread and self._thread.is_alive():
+            return
+        
+        loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=loop.run_forever,
+            name=f"p2p-{self.node_id}",
+            daemon=True
+        )
+        self._thread.start()
+        self._loop = loop
+        self._run(self.open())
+    
+    def stop(self) -> None:
+        """Close all connections and stop the background event loop."""
+        if not (self._thread and self._thread.is_alive()):
+            return
+        
+        self._run(self.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._thread = None
+        self._loop = None
+    
+    def connect_peer(self, peer_info: PeerInfo) -> bool:
+        """
+        Connect to a peer.
+        
+        Args:
+            peer_info: Information about peer to connect
+            
+        Returns:
+            True if connected successfully
+        """
+        connected = self._run(self.connect(peer_info))
+        if connected:
+            logger.info(f"Connected to peer: {peer_info.peer_id}")
+        return connected
+    
     def send_message(self, peer_id: str, message: Any) -> bool:
         """
         Send message to a peer.
         
         Args:
             peer_id: Target peer ID
-            message: Message to send
+            message: Any message the codec can encode
             
         Returns:
             True if sent successfully
         """
-        # TODO: Implement actual message sending
-        logger.info(f"Sending message to {peer_id}")
-        return True
+        return self._run(self.send(peer_id, message))
     
-    def broadcast(self, message: Any) -> None:
+    def broadcast(self, message: Any, gossip: bool = False) -> None:
         """
         Broadcast message to all peers.
         
         Args:
             message: Message to broadcast
+            gossip: Relay through the network instead of sending to
+                every known peer directly
+        """
+        if gossip:
+            self._run(self.publish(message))
+        else:
+            self._run(self.send_all(message))
+    
+    # Internals
+    
+    def _run(self, coro) -> Any:
+        """Run a coroutine on the background loop and wait for it."""
+        if not (self._thread and self._thread.is_alive()):
+            self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    def _protocol(self, peer_id: Optional[str] = None) -> FramedConnection:
+        """
+        Create the protocol for a new connection.
+        
+        Args:
+            peer_id: Peer being dialled, so the connection is metered from
+                its first byte; None for inbound connections
+                
+        Returns:
+            Unconnected protocol
+        """
+        if not self.sessions:
+            on_open = self._send_hello
+        elif peer_id is None:
+            on_open = self._await_session
+        else:
+            on_open = None  # _dial runs the handshake
+        connection = FramedConnection(
+            on_frame=self._on_frame,
+            on_close=self._drop,
+            on_open=on_open
+        )
+        if peer_id is not None:
+            connection.peer_id = peer_id
+            self._meter(connection)
+        return connection
+    
+    async def _connection(self, peer_id: str) -> Optional[FramedConnection]:
+        """
+        Get the pooled connection to a peer, connecting if needed.
+        
+        Args:
+            peer_id: Peer ID
+            
+        Returns:
+            Connection, or None if the peer is unknown or unreachable
+        """
+        if self._address(peer_id) is None:
+            logger.warning(f"Unknown peer: {peer_id}")
+            return None
+        return await self.pool.acquire(peer_id)
+    
+    async def _send(self, peer_id: str, message: Any, kind: int) -> bool:
+        """
+        Queue one frame for a peer.
+        
+        Args:
+            peer_id: Target peer ID
+            message: Message to encode
+            kind: Frame kind
+            
+        Returns:
+            True if queued
+        """
+        if await self._connection(peer_id) is None:
+            return False
+        
+        queue = self.queues.get(peer_id)
+        if queue is None:
+            queue = self.queues[peer_id] = SendQueue(
+                lambda: self._connection(peer_id), FRAME_BATCH, self.queue_config
+            )
+        return await queue.put(self._encode(message, kind))
+    
+    async def _query_nodes(self, peer: PeerInfo, key: int) -> Optional[List[PeerInfo]]:
+        """
+        Ask a node for its closest contacts to a key.
+        
+        Args:
+            peer: Node to ask
+            key: Target key
+            
+        Returns:
+            Contacts, or None if the node did not answer in time
+        """
+        self._contacts[peer.peer_id] = peer
+        request_id = self._next_request
+        self._next_request += 1
+        loop = asyncio.get_running_loop()
+        future = self._requests[request_id] = loop.create_future()
+        
+        try:
+            request = {"id": request_id, "key": key.to_bytes(32, "big")}
+            began = loop.time()
+            if not await self._send(peer.peer_id, request, FRAME_FIND_NODE):
+                return None
+            nodes = await asyncio.wait_for(future, self.routing_config.request_timeout)
+            self.telemetry.record_rtt(peer.peer_id, loop.time() - began)
+            return nodes
+        except asyncio.TimeoutError:
+            logger.warning(f"FIND_NODE to {peer.peer_id} timed out")
+            return None
+        finally:
+            self._requests.pop(request_id, None)
+            self._contacts.pop(peer.peer_id, None)
+    
+    def _on_find_node(self, connection: FramedConnection, request: Dict[str, Any]) -> None:
+        """
+        Answer a FIND_NODE request from the routing table.
+        
+        Raises:
+            KeyError, TypeError, ValueError: If the request is malformed
+        """
+        key = request["key"]
+        if not isinstance(key, bytes) or len(key) != 32:
+            raise ValueError("FIND_NODE key must be 32 bytes")
+        if not isinstance(request["id"], int):
+            raise ValueError("FIND_NODE id must be an int")
+        closest = self.routing.closest(int.from_bytes(key, "big"))
+        nodes = [
+            [p.peer_id, p.address, p.port] for p in closest
+            if p.peer_id != connection.peer_id
+        ]
+        connection.send_parts(self._encode({"id": request["id"], "nodes": nodes}, FRAME_NODES))
+    
+    def _on_nodes(self, reply: Dict[str, Any]) -> None:
+        """
+        Complete the FIND_NODE request a reply answers.
+        
+        Raises:
+            KeyError, TypeError, ValueError: If the reply is malformed
+        """
+        future = self._requests.get(reply["id"])
+        if future is None or future.done():
+            return
+        nodes = []
+        for node in reply["nodes"]:
+            peer_id, address, port = node
+            if not (isinstance(peer_id, str) and isinstance(address, str) and isinstance(port, int)):
+                raise ValueError(f"Bad contact in NODES reply: {node!r}")
+            nodes.append(PeerInfo(peer_id, address, port))
+        future.set_result(nodes)
+    
+    async def _refresh_loop(self) -> None:
+        """Refresh stale buckets periodically until cancelled."""
+        while True:
+            await asyncio.sleep(self.routing_config.refresh_interval)
+            await self.refresh()
+    
+    def _address(self, peer_id: str) -> Optional[PeerInfo]:
+        """Find where to reach a peer, routing contact or node being queried."""
+        return (
+            self.peers.get(peer_id) or self.routing.get(peer_id)
+            or self._contacts.get(peer_id)
+        )
+    
+    async def _dial(self, peer_id: str) -> FramedConnection:
         """
-        for peer_id in self.peers:
-            self.send_message(peer_id, message)
+        Open a new connection to a known peer.
+        
+        Args:
+            peer_id: Peer ID
+            
+        Returns:
+            Connected protocol
+            
+        Raises:
+            ConnectionError: If the peer's address is no longer known
+        """
+        peer = self._address(peer_id)
+        if peer is None:
+            raise ConnectionError(f"No address for {peer_id}")
+        connection = await self.transport.connect(
+            peer.address, peer.port, lambda: self._protocol(peer_id)
+        )
+        if self.sessions:
+            try:
+                await self.sessions.initiate(connection, peer_id)
+            except (SessionError, asyncio.TimeoutError) as e:
+                connection.close()
+                raise ConnectionError(f"No secure session with {peer_id}: {e}") from e
+        return connection
+    
+    async def _detector_loop(self) -> None:
+        """Drive heartbeats and failure checks every wheel tick until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.detector.config.tick)
+            self.detector.advance(loop.time())
+    
+    def _send_heartbeat(self, peer_id: str, seq: int) -> bool:
+        """
+        Send a heartbeat on the open connection to a peer, if it has been idle.
+        
+        Returns:
+            False if skipped because the link recently carried other traffic,
+            which the peer counts as a heartbeat instead
+        """
+        slot = self.pool.slots.get(peer_id)
+        connection = self.pool.get(peer_id)
+        if connection is None:
+            return True
+        now = asyncio.get_running_loop().time()
+        if now - slot.last_used < self.detector.config.heartbeat_interval:
+            return False
+        heartbeat = codec.Heartbeat(seq, now)
+        try:
+            connection.send_parts(self._encode(heartbeat, FRAME_HEARTBEAT))
+        except ConnectionError:
+            pass
+        return True
+    
+    def _evict(self, peer_id: str, phi: float) -> None:
+        """Forget a peer the failure detector declared dead."""
+        self.telemetry.forget(peer_id)
+        self.routing.remove(peer_id)
+        self.pool.remove(peer_id)
+        self.peers.pop(peer_id, None)
+        queue = self.queues.pop(peer_id, None)
+        if queue:
+            queue.close()
+    
+    def _send_ping(self, connection: FramedConnection) -> None:
+        """Send a health-check ping."""
+        connection.send_frame(bytes([FRAME_PING]))
+    
+    def _send_hello(self, connection: FramedConnection) -> None:
+        """
+        Identify this node and offer compression as soon as a connection opens.
+        
+        Compression is not offered on secure sessions, whose frames are
+        never compressed (see FramedConnection).
+        """
+        hello = {"node_id": self.node_id, "port": self.port, "compression": []}
+        if self.compression_config.enabled and not self.sessions:
+            hello["compression"] = [ALGORITHM]
+            connection.decompressor = StreamDecompressor(connection.max_frame_size)
+        connection.send_parts(self._encode(hello, FRAME_HELLO))
+    
+    def _await_session(self, connection: FramedConnection) -> None:
+        """Close an inbound connection if its peer does not secure it in time."""
+        self._spawn(self.sessions.accept(connection))
+    
+    def _on_frame(self, connection: FramedConnection, frame: bytes) -> None:
+        """Dispatch a received frame."""
+        kind = frame[0]
+        
+        if kind == FRAME_BATCH:
+            try:
+                messages = split_batch(memoryview(frame)[1:])
+            except (ValueError, struct.error) as e:
+                logger.warning(f"Bad batch frame from {connection.peername}: {e}")
+                connection.close()
+                return
+            for message in messages:
+                self._on_frame(connection, message)
+            return
+        
+        if kind == FRAME_SESSION and self.sessions:
+            try:
+                self.sessions.receive(connection, codec.decode(memoryview(frame)[1:]))
+            except (codec.CodecError, AttributeError) as e:
+                logger.warning(f"Bad session message from {connection.peername}: {e}")
+                connection.close()
+            return
+        if self.sessions and connection.cipher is None:
+            logger.warning(f"Unencrypted frame from {connection.peername}")
+            connection.close()
+            return
+        
+        if kind == FRAME_HELLO:
+            try:
+                self._on_hello(connection, codec.decode(memoryview(frame)[1:]))
+            except (codec.CodecError, KeyError, TypeError) as e:
+                logger.warning(f"Bad hello from {connection.peername}: {e}")
+                connection.close()
+            return
+        
+        if connection.peer_id is None:
+            logger.warning(f"Message before hello from {connection.peername}")
+            connection.close()
+            return
+        
+        self._seen(connection.peer_id)
+        if connection.meter:
+            connection.meter.messages_in += 1
+        if self.detector.config.enabled:
+            self.detector.heartbeat(connection.peer_id, asyncio.get_running_loop().time())
+        
+        if kind == FRAME_PING:
+            connection.send_frame(bytes([FRAME_PONG]))
+            return
+        if kind == FRAME_PONG:
+            return
+        if kind == FRAME_HEARTBEAT:
+            return
+        
+        try:
+            message = codec.decode(memoryview(frame)[1:])
+        except codec.CodecError as e:
+            logger.warning(f"Undecodable message from {connection.peer_id}: {e}")
+            return
+        
+        if kind == FRAME_GOSSIP:
+            self._spawn(self.gossip.receive(connection.peer_id, message))
+            return
+        if kind in (FRAME_FIND_NODE, FRAME_NODES):
+            try:
+                if kind == FRAME_FIND_NODE:
+                    self._on_find_node(connection, message)
+                else:
+                    self._on_nodes(message)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Bad routing message from {connection.peer_id}: {e}")
+            return
+        if kind in self.protocols:
+            self._spawn(self.protocols[kind](connection.peer_id, message))
+            return
+        self._deliver(connection.peer_id, message)
+    
+    def _deliver(self, peer_id: str, message: Any) -> None:
+        """Pass a received message to every handler."""
+        for handler in self.handlers:
+            try:
+                handler(peer_id, message)
+            except Exception as e:
+                logger.error(f"Message handler failed: {e}")
+    
+    def _spawn(self, coro) -> None:
+        """Run a coroutine in the background, logging any failure."""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+    
+    def _task_done(self, task: asyncio.Task) -> None:
+        """Release a finished background task."""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Background task failed: {task.exception()}")
+    
+    def _on_hello(self, connection: FramedConnection, hello: Dict[str, Any]) -> None:
+        """
+        Learn the identity of the node at the other end.
+        
+        The node becomes a peer if it already was one or the routing
+        table admits it; otherwise the connection serves only requests.
+        """
+        peer_id = hello["node_id"]
+        if connection.peer_id is not None and self.sessions and peer_id != connection.peer_id:
+            logger.warning(f"Hello from {peer_id} on session with {connection.peer_id}")
+            connection.close()
+            return
+        connection.peer_id = peer_id
+        # Accepted connections learn their peer here; meter them before
+        # the compressor reads the link's round trips from the meter
+        self._meter(connection)
+        
+        offered = hello.get("compression", [])
+        if self.compression_config.enabled and not self.sessions and negotiate(offered):
+            connection.compressor = StreamCompressor(self.compression_config, connection.meter)
+        
+        peer = self.peers.get(peer_id)
+        if peer is None:
+            address = connection.peername[0] if connection.peername else ""
+            peer = PeerInfo(
+                peer_id=peer_id,
+                address=address,
+                port=hello["port"],
+                public_key=connection.peer_key
+            )
+        if self.routing.add(peer) and peer_id not in self.peers:
+            self.peers[peer_id] = peer
+            logger.info(f"Peer connected: {peer_id}")
+        
+        self.pool.add(peer_id, connection)
+        if self.detector.config.enabled:
+            self.detector.track(peer_id, asyncio.get_running_loop().time())
+        self._seen(peer_id)
+    
+    def _on_session(self, connection: FramedConnection, peer_id: str, public_key: str) -> None:
+        """Record the authenticated peer of a newly encrypted connection and say hello."""
+        connection.peer_id = peer_id
+        connection.peer_key = public_key
+        if peer_id in self.peers:
+            self.peers[peer_id].public_key = public_key
+        self._send_hello(connection)
+    
+    def _meter(self, connection: FramedConnection) -> None:
+        """Count a connection's traffic in its peer's telemetry."""
+        if self.telemetry.config.enabled and connection.meter is None:
+            connection.meter = self.telemetry.peer(connection.peer_id)
+    
+    def _seen(self, peer_id: str) -> None:
+        """Record traffic from a peer."""
+        peer = self.peers.get(peer_id)
+        if peer:
+            peer.last_seen = time.time()
+        self.pool.touch(peer_id)
+    
+    def _drop(self, connection: FramedConnection) -> None:
+        """Forget a closed connection."""
+        connection.close()
+        self.pool.discard(connection)
+        if self.sessions:
+            self.sessions.discard(connection)
+        if connection.peer_id and self.pool.get(connection.peer_id) is None:
+            # A closed link is a definite signal; stop heartbeating until
+            # the pool reconnects
+            self.detector.untrack(connection.peer_id)
+    
+    @staticmethod
+    def _encode(message: Any, kind: int = FRAME_MESSAGE) -> List[codec.Buffer]:
+        """Encode a frame as buffers for a zero-copy send."""
+        return [bytes([kind]), *codec.encode_parts(message)]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,279 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Peer Connection Pool
+
+Keeps persistent connections to peers, with idle timeouts, health checks
+and jittered exponential backoff between reconnect attempts.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, Dict, Optional, Set
+from dataclasses import dataclass, field
+
+from .transport import FramedConnection
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolConfig:
+    """Configuration for the connection pool"""
+    idle_timeout: float = 300.0  # Close connections unused for this long
+    health_interval: float = 30.0  # Ping connections silent for this long
+    health_timeout: float = 10.0  # Close if still silent this long after a ping
+    backoff_base: float = 0.5
+    backoff_max: float = 60.0
+    maintenance_interval: float = 5.0
+
+
+@dataclass
+class PeerSlot:
+    """Pool state for one peer"""
+    connection: Optional[FramedConnection] = None
+    last_used: float = 0.0
+    last_received: float = 0.0
+    ping_sent: Optional[float] = None
+    failures: int = 0
+    retry_at: float = 0.0
+    reconnect: bool = False
+    connections: int = 0  # Connections attached over the slot's lifetime
+    pending: Optional[asyncio.Future] = field(default=None, repr=False)
+
+
+class ConnectionPool:
+    """
+    Per-peer pool of persistent connections.
+    
+    Each peer has at most one pooled connection, reused for every send,
+    so steady-state traffic never pays for a handshake. Concurrent
+    acquires share a single connection attempt. After a failure, further
+    attempts wait out a jittered exponential backoff; connections that
+    drop while in use are re-established in the background.
+    """
+    
+    def __init__(
+        self,
+        connect: Callable[[str], Awaitable[FramedConnection]],
+        ping: Callable[[FramedConnection], None],
+        config: Optional[PoolConfig] = None
+    ):
+        """
+        Initialize pool.
+        
+        Args:
+            connect: Opens a new connection to a peer ID
+            ping: Sends a health-check ping on a connection
+            config: Pool configuration (uses defaults if None)
+        """
+        self.config = config or PoolConfig()
+        self._connect = connect
+        self._ping = ping
+        self.slots: Dict[str, PeerSlot] = {}
+        self.reconnects = 0
+        self._tasks: Set[asyncio.Task] = set()
+    
+    def _now(self) -> float:
+        """Current loop time."""
+        return asyncio.get_running_loop().time()
+    
+    def _slot(self, peer_id: str) -> PeerSlot:
+        """Get or create the slot for a peer."""
+        slot = self.slots.get(peer_id)
+        if slot is None:
+            slot = self.slots[peer_id] = PeerSlot()
+        return slot
+    
+    def get(self, peer_id: str) -> Optional[FramedConnection]:
+        """
+        Get the open pooled connection to a peer, without connecting.
+        
+        Args:
+            peer_id: Peer ID
+            
+        Returns:
+            Connection if one is open
+        """
+        slot = self.slots.get(peer_id)
+        if slot and slot.connection and not slot.connection.is_closed:
+            return slot.connection
+        return None
+    
+    async def acquire(self, peer_id: str) -> Optional[FramedConnection]:
+        """
+        Get a connection to a peer, connecting if needed.
+        
+        Args:
+            peer_id: Peer ID
+            
+        Returns:
+            Connection, or None if unreachable or backing off
+        """
+        slot = self._slot(peer_id)
+        now = self._now()
+        slot.last_used = now
+        
+        if slot.connection and not slot.connection.is_closed:
+            return slot.connection
+        
+        if slot.pending:
+            return await asyncio.shield(slot.pending)
+        
+        if now < slot.retry_at:
+            return None
+        
+        return await self._open(peer_id, slot)
+    
+    def add(self, peer_id: str, connection: FramedConnection) -> None:
+        """
+        Pool an inbound connection if the peer has no open one.
+        
+        Args:
+            peer_id: Peer ID
+            connection: Connection accepted from the peer
+        """
+        slot = self._slot(peer_id)
+        if slot.connection is None or slot.connection.is_closed:
+            self._attach(slot, connection)
+            slot.last_used = self._now()
+    
+    def touch(self, peer_id: str) -> None:
+        """
+        Record traffic received from a peer.
+        
+        Args:
+            peer_id: Peer ID
+        """
+        slot = self.slots.get(peer_id)
+        if slot:
+            slot.last_received = self._now()
+            slot.ping_sent = None
+    
+    def discard(self, connection: FramedConnection) -> None:
+        """
+        Remove a closed connection from the pool.
+        
+        A connection that was still in use is re-established in the
+        background on the next sweep.
+        
+        Args:
+            connection: Connection that closed
+        """
+        slot = self.slots.get(connection.peer_id) if connection.peer_id else None
+        if slot is None or slot.connection is not connection:
+            return
+        
+        slot.connection = None
+        slot.reconnect = self._now() - slot.last_used < self.config.idle_timeout
+    
+    async def maintain(self) -> None:
+        """Run periodic maintenance until cancelled."""
+        while True:
+            await asyncio.sleep(self.config.maintenance_interval)
+            self.sweep()
+    
+    def sweep(self) -> None:
+        """Close idle and unhealthy connections, and start due reconnects."""
+        now = self._now()
+        cfg = self.config
+        
+        for peer_id, slot in list(self.slots.items()):
+            connection = slot.connection
+            if connection is None or connection.is_closed:
+                if (slot.reconnect and not slot.pending and now >= slot.retry_at
+                        and now - slot.last_used < cfg.idle_timeout):
+                    self.reconnects += 1
+                    task = asyncio.ensure_future(self._open(peer_id, slot))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                continue
+            
+            if now - slot.last_used > cfg.idle_timeout:
+                logger.debug(f"Closing idle connection to {peer_id}")
+                slot.connection = None
+                connection.close()
+            elif slot.ping_sent is not None and now - slot.ping_sent > cfg.health_timeout:
+                logger.warning(f"Peer {peer_id} failed health check")
+                connection.close()
+            elif slot.ping_sent is None and now - slot.last_received > cfg.health_interval:
+                slot.ping_sent = now
+                try:
+                    self._ping(connection)
+                except ConnectionError:
+                    connection.close()
+    
+    def remove(self, peer_id: str) -> None:
+        """
+        Forget a peer, closing its connection without reconnecting.
+        
+        Args:
+            peer_id: Peer ID
+        """
+        slot = self.slots.pop(peer_id, None)
+        if slot and slot.connection:
+            slot.connection.close()
+    
+    def close_all(self) -> None:
+        """Close every pooled connection."""
+        for slot in self.slots.values():
+            slot.reconnect = False
+            if slot.connection:
+                slot.connection.close()
+                slot.connection = None
+    
+    async def _open(self, peer_id: str, slot: PeerSlot) -> Optional[FramedConnection]:
+        """
+        Make one connection attempt, shared by concurrent callers.
+        
+        Args:
+            peer_id: Peer ID
+            slot: The peer's slot
+            
+        Returns:
+            Connection, or None if the attempt failed
+        """
+        pending = slot.pending = asyncio.get_running_loop().create_future()
+        connection = None
+        try:
+            connection = await self._connect(peer_id)
+            self._attach(slot, connection)
+        except (OSError, asyncio.TimeoutError) as e:
+            self._failed(peer_id, slot, e)
+        finally:
+            slot.pending = None
+            pending.set_result(connection)
+        return connection
+    
+    def _attach(self, slot: PeerSlot, connection: FramedConnection) -> None:
+        """Make a connection the pooled one for its slot."""
+        if connection is not slot.connection:
+            slot.connections += 1
+        slot.connection = connection
+        slot.reconnect = False
+        slot.failures = 0
+        slot.retry_at = 0.0
+        slot.ping_sent = None
+        slot.last_received = self._now()
+    
+    def _failed(self, peer_id: str, slot: PeerSlot, error: Exception) -> None:
+        """Record a failed connection attempt."""
+        slot.failures += 1
+        self._schedule_retry(slot)
+        logger.warning(
+            f"Cannot connect to {peer_id} (attempt {slot.failures}): {error}"
+        )
+    
+    def _schedule_retry(self, slot: PeerSlot) -> None:
+        """Set the earliest next attempt using jittered exponential backoff."""
+        delay = min(
+            self.config.backoff_max,
+            self.config.backoff_base * 2 ** max(slot.failures - 1, 0)
+        )
+        # Equal jitter: keep half the delay, randomize the rest
+        slot.retry_at = self._now() + delay / 2 + random.uniform(0, delay / 2)
@@ -0,0 +1,290 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Kademlia Routing
+
+Implements an XOR-distance k-bucket routing table and iterative node lookup.
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Set
+from dataclasses import dataclass
+
+if TYPE_CHECKING:
+    from .p2p import PeerInfo
+
+logger = logging.getLogger(__name__)
+
+KEY_BITS = 256
+
+
+@dataclass
+class RoutingConfig:
+    """Configuration for Kademlia routing"""
+    k: int = 20  # Bucket size and lookup result size
+    alpha: int = 3  # Parallel queries per lookup round
+    refresh_interval: float = 3600.0  # Refresh buckets not looked up for this long
+    request_timeout: float = 5.0
+
+
+@lru_cache(maxsize=65536)
+def node_key(node_id: str) -> int:
+    """
+    Map a node ID onto the 256-bit key space.
+    
+    Args:
+        node_id: Node ID
+        
+    Returns:
+        SHA-256 of the ID as an integer
+    """
+    return int.from_bytes(hashlib.sha256(node_id.encode()).digest(), "big")
+
+
+def distance(a: int, b: int) -> int:
+    """XOR distance between two keys."""
+    return a ^ b
+
+
+class KBucket:
+    """
+    Contacts whose distance from the local node shares one bit length.
+    
+    Contacts are kept least recently seen first. A full bucket keeps its
+    existing contacts, which have proven they stay up, and holds new ones
+    in a replacement cache until a slot frees.
+    """
+    
+    def __init__(self, k: int):
+        """
+        Initialize bucket.
+        
+        Args:
+            k: Maximum number of contacts
+        """
+        self.k = k
+        self.contacts: "OrderedDict[str, PeerInfo]" = OrderedDict()
+        self.replacements: "OrderedDict[str, PeerInfo]" = OrderedDict()
+        self.last_lookup = 0.0
+    
+    def add(self, peer: "PeerInfo") -> bool:
+        """
+        Add or refresh a contact.
+        
+        Args:
+            peer: Contact
+            
+        Returns:
+            True if the contact is in the bucket, False if it was cached
+            as a replacement
+        """
+        if peer.peer_id in self.contacts:
+            self.contacts[peer.peer_id] = peer
+            self.contacts.move_to_end(peer.peer_id)
+            return True
+        
+        if len(self.contacts) < self.k:
+            self.contacts[peer.peer_id] = peer
+            return True
+        
+        self.replacements.pop(peer.peer_id, None)
+        self.replacements[peer.peer_id] = peer
+        if len(self.replacements) > self.k:
+            self.replacements.popitem(last=False)
+        return False
+    
+    def remove(self, peer_id: str) -> bool:
+        """
+        Remove a contact, promoting the newest replacement.
+        
+        Args:
+            peer_id: Contact to remove
+            
+        Returns:
+            True if the contact was present
+        """
+        self.replacements.pop(peer_id, None)
+        if self.contacts.pop(peer_id, None) is None:
+            return False
+        if self.replacements:
+            _, replacement = self.replacements.popitem()
+            self.contacts[replacement.peer_id] = replacement
+        return True
+    
+    def __len__(self) -> int:
+        return len(self.contacts)
+
+
+class RoutingTable:
+    """
+    Kademlia routing table.
+    
+    Bucket i holds contacts at XOR distance [2^i, 2^(i+1)) from the local
+    node, at most k each. Far buckets cover most of the network but hold
+    only k contacts, so a node tracks O(k log N) contacts in an N-node
+    network and each lookup hop halves the remaining distance.
+    """
+    
+    def __init__(self, node_id: str, k: int = 20):
+        """
+        Initialize routing table.
+        
+        Args:
+            node_id: Local node ID
+            k: Bucket size and lookup result size
+        """
+        self.node_id = node_id
+        self.key = node_key(node_id)
+        self.k = k
+        self.buckets = [KBucket(k) for _ in range(KEY_BITS)]
+    
+    def bucket_index(self, key: int) -> int:
+        """Index of the bucket covering a key."""
+        return distance(self.key, key).bit_length() - 1
+    
+    def add(self, peer: "PeerInfo") -> bool:
+        """
+        Record a contact.
+        
+        Args:
+            peer: Contact
+            
+        Returns:
+            True if the contact is in the table
+        """
+        if peer.peer_id == self.node_id:
+            return False
+        return self.buckets[self.bucket_index(node_key(peer.peer_id))].add(peer)
+    
+    def remove(self, peer_id: str) -> bool:
+        """
+        Remove an unresponsive contact.
+        
+        Args:
+            peer_id: Contact to remove
+            
+        Returns:
+            True if the contact was in the table
+        """
+        if peer_id == self.node_id:
+            return False
+        return self.buckets[self.bucket_index(node_key(peer_id))].remove(peer_id)
+    
+    def get(self, peer_id: str) -> Optional["PeerInfo"]:
+        """Look up a contact by ID."""
+        if peer_id == self.node_id:
+            return None
+        return self.buckets[self.bucket_index(node_key(peer_id))].contacts.get(peer_id)
+    
+    def closest(self, key: int, count: Optional[int] = None) -> List["PeerInfo"]:
+        """
+        Find the known contacts closest to a key.
+        
+        Args:
+            key: Target key
+            count: Number of contacts (defaults to k)
+            
+        Returns:
+            Contacts ordered by distance to the key
+        """
+        contacts = [p for bucket in self.buckets for p in bucket.contacts.values()]
+        contacts.sort(key=lambda p: distance(node_key(p.peer_id), key))
+        return contacts[:count or self.k]
+    
+    def mark_lookup(self, key: int, now: float) -> None:
+        """Record that a lookup refreshed the bucket covering a key."""
+        if key != self.key:
+            self.buckets[self.bucket_index(key)].last_lookup = now
+    
+    def stale_buckets(self, now: float, interval: float) -> List[int]:
+        """
+        Find buckets that need refreshing.
+        
+        Buckets closer than the nearest known contact are skipped: they
+        cover tiny key ranges that are almost surely empty, which leaves
+        O(log N) buckets to refresh.
+        
+        Args:
+            now: Current time
+            interval: Refresh buckets not looked up for this long
+            
+        Returns:
+            Bucket indexes
+        """
+        occupied = [i for i, bucket in enumerate(self.buckets) if bucket.contacts]
+        if not occupied:
+            return []
+        return [
+            i for i in range(occupied[0], KEY_BITS)
+            if now - self.buckets[i].last_lookup >= interval
+        ]
+    
+    def random_key(self, index: int) -> int:
+        """Random key falling into bucket index."""
+        return self.key ^ ((1 << index) | random.getrandbits(index))
+    
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self.buckets)
+
+
+async def iterative_lookup(
+    table: RoutingTable,
+    key: int,
+    query: Callable[["PeerInfo"], Awaitable[Optional[List["PeerInfo"]]]],
+    alpha: int = 3
+) -> List["PeerInfo"]:
+    """
+    Find the k nodes closest to a key.
+    
+    Queries the alpha closest unqueried candidates in parallel, merging
+    the contacts they return, until the k closest candidates have all
+    answered. Each hop roughly halves the distance to the key, so a
+    lookup takes O(log N) rounds.
+    
+    Args:
+        table: Local routing table, updated with every responsive node
+        key: Target key
+        query: Asks a node for its closest contacts to the key; returns
+            None if the node did not answer
+        alpha: Queries in flight per round
+        
+    Returns:
+        Up to k responsive nodes, closest first
+    """
+    candidates: Dict[str, "PeerInfo"] = {p.peer_id: p for p in table.closest(key)}
+    queried: Set[str] = {table.node_id}
+    failed: Set[str] = set()
+    
+    def shortlist() -> List["PeerInfo"]:
+        """Closest candidates that have not failed."""
+        alive = [p for pid, p in candidates.items() if pid not in failed]
+        alive.sort(key=lambda p: distance(node_key(p.peer_id), key))
+        return alive[:table.k]
+    
+    while True:
+        batch = [p for p in shortlist() if p.peer_id not in queried][:alpha]
+        if not batch:
+            break
+        queried.update(p.peer_id for p in batch)
+        
+        results = await asyncio.gather(*(query(p) for p in batch))
+        for peer, found in zip(batch, results):
+            if found is None:
+                failed.add(peer.peer_id)
+                table.remove(peer.peer_id)
+                continue
+            table.add(peer)
+            for contact in found:
+                if contact.peer_id != table.node_id:
+                    candidates.setdefault(contact.peer_id, contact)
+    
+    return [p for p in shortlist() if p.peer_id in queried]
@@ -0,0 +1,343 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Multiplexed RPC
+
+Implements request/response calls between peers as streams multiplexed
+over each peer's pooled connection.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+from dataclasses import dataclass
+
+from . import codec
+from .p2p import FRAME_RPC, P2PNetwork
+
+logger = logging.getLogger(__name__)
+
+RpcHandler = Callable[[str, Any], Awaitable[Any]]
+
+
+@dataclass
+class RpcConfig:
+    """Configuration for multiplexed RPC"""
+    request_timeout: float = 10.0  # Default seconds to wait for a response
+    chunk_size: int = 64 * 1024  # Largest piece of a request or response per frame
+    max_queued: int = 128 * 1024  # Send queue bytes above which streams wait their turn
+    max_message_size: int = 64 * 1024 * 1024  # Largest request or response accepted
+
+
+class RpcError(Exception):
+    """Raised when a call is rejected or fails at the peer, or cannot be sent."""
+
+
+class _Stream:
+    """A request, response or cancel being sent to a peer in chunks."""
+    
+    __slots__ = ("id", "kind", "method", "data", "offset")
+    
+    def __init__(self, stream_id: int, kind: str, data: bytes, method: Optional[str] = None):
+        """
+        Initialize stream.
+        
+        Args:
+            stream_id: ID of the call the stream belongs to
+            kind: Message type
+            data: Encoded body
+            method: Method name, for requests
+        """
+        self.id = stream_id
+        self.kind = kind
+        self.method = method
+        self.data = memoryview(data)
+        self.offset = 0
+
+
+class RpcProtocol:
+    """
+    Request/response calls multiplexed over peer connections.
+    
+    Every call is a stream with its own ID, so any number of calls to a
+    peer share its one pooled connection and complete in any order.
+    Requests and responses are split into chunk_size frames, and one
+    writer per peer sends a chunk from each active stream in turn,
+    holding back while the peer's send queue holds more than max_queued
+    bytes. A small call made during a large transfer therefore waits
+    behind a few chunks rather than the whole transfer.
+    
+    A call that times out or is cancelled tells the peer, which cancels
+    the handler or stops sending its response.
+    """
+    
+    def __init__(self, network: P2PNetwork, config: Optional[RpcConfig] = None):
+        """
+        Initialize RPC protocol.
+        
+        Args:
+            network: Network to call peers over
+            config: RPC configuration (uses defaults if None)
+        """
+        self.network = network
+        self.config = config or RpcConfig()
+        self.methods: Dict[str, RpcHandler] = {}
+        # Calls awaiting a response: (peer, stream ID) -> future
+        self._calls: Dict[Tuple[str, int], asyncio.Future] = {}
+        # Partly received messages: (peer, stream ID, type) -> body so far,
+        # or None while discarding an oversized message
+        self._incoming: Dict[Tuple[str, int, str], Optional[bytearray]] = {}
+        # Handlers running for requests from peers: (peer, stream ID) -> task
+        self._handlers: Dict[Tuple[str, int], asyncio.Task] = {}
+        # Streams waiting to be sent, and the task sending them, per peer
+        self._outgoing: Dict[str, Deque[_Stream]] = {}
+        self._writers: Dict[str, asyncio.Task] = {}
+        self._next_stream = 0
+        self.stats = {
+            "calls": 0,
+            "served": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "cancelled": 0,
+            "cancels_received": 0,
+            "chunks_sent": 0,
+            "chunks_received": 0
+        }
+        network.register_protocol(FRAME_RPC, self._on_message)
+    
+    def register(self, method: str, handler: RpcHandler) -> None:
+        """
+        Serve a method to peers.
+        
+        Args:
+            method: Method name
+            handler: Coroutine called with (peer_id, params) that returns
+                the result
+                
+        Raises:
+            ValueError: If the method is already registered
+        """
+        if method in self.methods:
+            raise ValueError(f"RPC method already registered: {method}")
+        self.methods[method] = handler
+    
+    async def call(
+        self,
+        peer: str,
+        method: str,
+        params: Any = None,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Call a method on a peer and wait for its result.
+        
+        Cancelling the awaiting task cancels the call at the peer too.
+        
+        Args:
+            peer: Peer to call
+            method: Method name
+            params: Parameters, in any form the codec can encode
+            timeout: Seconds to wait (uses the configured default if None)
+            
+        Returns:
+            The handler's result
+            
+        Raises:
+            RpcError: If the request could not be sent, the peer has no such
+                method or the handler failed
+            asyncio.TimeoutError: If no response arrived in time
+        """
+        stream_id = self._next_stream
+        self._next_stream += 1
+        key = (peer, stream_id)
+        loop = asyncio.get_running_loop()
+        future = self._calls[key] = loop.create_future()
+        self.stats["calls"] += 1
+        if timeout is None:
+            timeout = self.config.request_timeout
+        
+        try:
+            began = loop.time()
+            self._enqueue(peer, _Stream(stream_id, "request", codec.encode(params), method))
+            result = await asyncio.wait_for(future, timeout)
+            self.network.telemetry.record_rtt(peer, loop.time() - began)
+            return result
+        except asyncio.TimeoutError:
+            logger.warning(f"RPC {method} to {peer} timed out")
+            self.stats["timeouts"] += 1
+            self._abandon(peer, stream_id)
+            raise
+        except asyncio.CancelledError:
+            self.stats["cancelled"] += 1
+            self._abandon(peer, stream_id)
+            raise
+        finally:
+            self._calls.pop(key, None)
+            self._incoming.pop((peer, stream_id, "response"), None)
+            self._incoming.pop((peer, stream_id, "error"), None)
+    
+    def close(self) -> None:
+        """Stop sending and cancel running handlers."""
+        for task in [*self._writers.values(), *self._handlers.values()]:
+            task.cancel()
+        self._writers.clear()
+        self._handlers.clear()
+        self._outgoing.clear()
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get RPC status.
+        
+        Returns:
+            Call counters and outstanding call, handler and stream counts
+        """
+        return dict(
+            self.stats,
+            inflight=len(self._calls),
+            serving=len(self._handlers),
+            sending=sum(len(streams) for streams in self._outgoing.values())
+        )
+    
+    # Sending
+    
+    def _enqueue(self, peer: str, stream: _Stream) -> None:
+        """Queue a stream for a peer, starting its writer if idle."""
+        self._outgoing.setdefault(peer, deque()).append(stream)
+        writer = self._writers.get(peer)
+        if writer is None or writer.done():
+            self._writers[peer] = asyncio.ensure_future(self._write_loop(peer))
+    
+    async def _write_loop(self, peer: str) -> None:
+        """Send one chunk from each active stream in turn until all are sent."""
+        streams = self._outgoing[peer]
+        chunk_size = self.config.chunk_size
+        while streams:
+            await self.network.wait_queued(peer, self.config.max_queued)
+            if not streams:
+                break
+            
+            stream = streams.popleft()
+            chunk = stream.data[stream.offset:stream.offset + chunk_size]
+            stream.offset += len(chunk)
+            end = stream.offset >= len(stream.data)
+            if not end:
+                streams.append(stream)
+            
+            frame = {"type": stream.kind, "id": stream.id, "data": chunk, "end": end}
+            if stream.method is not None:
+                frame["method"] = stream.method
+            if not await self.network.send_frame(peer, FRAME_RPC, frame):
+                self._unreachable(peer)
+                return
+            self.stats["chunks_sent"] += 1
+    
+    def _unreachable(self, peer: str) -> None:
+        """Fail every call to a peer that could not be sent to."""
+        self._outgoing.pop(peer, None)
+        for (target, _), future in self._calls.items():
+            if target == peer and not future.done():
+                future.set_exception(RpcError(f"Peer {peer} is unreachable"))
+    
+    def _abandon(self, peer: str, stream_id: int) -> None:
+        """Withdraw a call, telling the peer unless it never saw the request."""
+        streams = self._outgoing.get(peer, ())
+        for stream in streams:
+            if stream.id == stream_id and stream.kind == "request":
+                streams.remove(stream)
+                if stream.offset == 0:
+                    return
+                break
+        self._enqueue(peer, _Stream(stream_id, "cancel", b""))
+    
+    # Receiving
+    
+    async def _on_message(self, peer: str, message: Any) -> None:
+        """Collect chunks of RPC messages and act on complete ones."""
+        kind = message.get("type")
+        stream_id = message.get("id")
+        if kind == "cancel":
+            self._on_cancel(peer, stream_id)
+            return
+        if kind not in ("request", "response", "error"):
+            logger.warning(f"Unknown RPC message from {peer}: {kind}")
+            return
+        if kind != "request" and (peer, stream_id) not in self._calls:
+            # Reply to a call that already timed out or was cancelled
+            return
+        
+        self.stats["chunks_received"] += 1
+        key = (peer, stream_id, kind)
+        body = self._incoming.setdefault(key, bytearray())
+        if body is not None:
+            body.extend(message["data"])
+            if len(body) > self.config.max_message_size:
+                error = RpcError(f"RPC {kind} exceeds {self.config.max_message_size} bytes")
+                self._reject(peer, stream_id, kind, error)
+                body = self._incoming[key] = None
+        if not message["end"]:
+            return
+        del self._incoming[key]
+        if body is None:
+            return
+        
+        try:
+            value = codec.decode(body)
+        except codec.CodecError as e:
+            self._reject(peer, stream_id, kind, RpcError(f"Undecodable RPC {kind}: {e}"))
+            return
+        
+        if kind == "request":
+            task = asyncio.ensure_future(self._serve(peer, stream_id, message.get("method"), value))
+            self._handlers[(peer, stream_id)] = task
+            return
+        future = self._calls[(peer, stream_id)]
+        if not future.done():
+            if kind == "response":
+                future.set_result(value)
+            else:
+                future.set_exception(RpcError(str(value)))
+    
+    def _on_cancel(self, peer: str, stream_id: int) -> None:
+        """Stop work on a request its caller withdrew."""
+        self.stats["cancels_received"] += 1
+        self._incoming.pop((peer, stream_id, "request"), None)
+        task = self._handlers.pop((peer, stream_id), None)
+        if task:
+            task.cancel()
+        streams = self._outgoing.get(peer, ())
+        for stream in streams:
+            if stream.id == stream_id and stream.kind != "request":
+                streams.remove(stream)
+                break
+    
+    def _reject(self, peer: str, stream_id: int, kind: str, error: RpcError) -> None:
+        """Answer a bad request with an error, or fail the call a bad reply was for."""
+        logger.warning(f"Discarding RPC {kind} from {peer}: {error}")
+        if kind == "request":
+            self._enqueue(peer, _Stream(stream_id, "error", codec.encode(str(error))))
+            return
+        future = self._calls[(peer, stream_id)]
+        if not future.done():
+            future.set_exception(error)
+    
+    async def _serve(self, peer: str, stream_id: int, method: str, params: Any) -> None:
+        """Run the handler for a request and send back its result or error."""
+        key = (peer, stream_id)
+        try:
+            handler = self.methods.get(method)
+            if handler is None:
+                raise RpcError(f"Unknown RPC method: {method}")
+            response = _Stream(stream_id, "response", codec.encode(await handler(peer, params)))
+            self.stats["served"] += 1
+        except Exception as e:
+            logger.warning(f"RPC {method} from {peer} failed: {e}")
+            self.stats["errors"] += 1
+            response = _Stream(stream_id, "error", codec.encode(str(e)))
+        finally:
+            self._handlers.pop(key, None)
+        self._enqueue(peer, response)
@@ -0,0 +1,254 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Per-Peer Send Queues
+
+Implements bounded outbound queues with watermark backpressure and
+coalescing of small messages into batch frames.
+"""
+
+import asyncio
+import logging
+import struct
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+
+from .transport import Buffer, FramedConnection
+
+logger = logging.getLogger(__name__)
+
+POLICY_BLOCK = "block"
+POLICY_DROP = "drop"
+
+# Each message in a batch frame is a 4-byte length followed by the message
+BATCH_ITEM_HEADER = struct.Struct("!I")
+
+
+@dataclass
+class SendQueueConfig:
+    """Configuration for per-peer send queues"""
+    high_water: int = 4 * 1024 * 1024  # Queued bytes at which senders block or drop
+    low_water: int = 1024 * 1024  # Queued bytes at which blocked senders resume
+    policy: str = POLICY_BLOCK  # What put() does above the high-water mark
+    coalesce_window: float = 0.001  # Seconds to wait for more small messages
+    coalesce_max_bytes: int = 64 * 1024  # Largest batch frame
+
+
+def split_batch(body: Buffer) -> List[memoryview]:
+    """
+    Split a batch frame body into its messages.
+    
+    Args:
+        body: Batch frame body, without the frame kind
+        
+    Returns:
+        Views of each message, in order
+        
+    Raises:
+        ValueError: If the body is truncated
+    """
+    view = memoryview(body)
+    messages = []
+    pos = 0
+    while pos < len(view):
+        (length,) = BATCH_ITEM_HEADER.unpack_from(view, pos)
+        pos += BATCH_ITEM_HEADER.size
+        if pos + length > len(view):
+            raise ValueError("Truncated batch frame")
+        messages.append(view[pos:pos + length])
+        pos += length
+    return messages
+
+
+class SendQueue:
+    """
+    Bounded outbound queue for one peer.
+    
+    Messages are written in order by a background task that awaits the
+    connection's drain, so a slow peer fills its own queue instead of
+    stalling the sender. Once queued bytes reach the high-water mark,
+    put() either waits until the queue drains to the low-water mark
+    (block policy) or rejects the message (drop policy).
+    
+    Messages smaller than coalesce_max_bytes are packed together into
+    batch frames. When a lone small message is queued, the writer waits
+    up to coalesce_window for more before sending.
+    """
+    
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Optional[FramedConnection]]],
+        batch_kind: int,
+        config: Optional[SendQueueConfig] = None
+    ):
+        """
+        Initialize send queue.
+        
+        Args:
+            connect: Returns the connection to write to, or None if the
+                peer is unreachable
+            batch_kind: Frame kind byte that marks a batch frame
+            config: Queue configuration (uses defaults if None)
+            
+        Raises:
+            ValueError: If the configured policy is unknown
+        """
+        self.config = config or SendQueueConfig()
+        if self.config.policy not in (POLICY_BLOCK, POLICY_DROP):
+            raise ValueError(f"Unknown send queue policy: {self.config.policy}")
+        
+        self._connect = connect
+        self._batch_prefix = bytes([batch_kind])
+        self._items: Deque[Tuple[List[Buffer], int]] = deque()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._progress = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        
+        self.queued_bytes = 0
+        self.max_depth = 0
+        self.messages_sent = 0
+        self.frames_sent = 0
+        self.dropped = 0
+    
+    @property
+    def depth(self) -> int:
+        """Messages waiting to be written."""
+        return len(self._items)
+    
+    @property
+    def is_congested(self) -> bool:
+        """Whether the queue is above its high-water mark and not yet drained."""
+        return not self._writable.is_set()
+    
+    async def wait_writable(self) -> None:
+        """Wait until the queue has drained below its low-water mark."""
+        await self._writable.wait()
+    
+    async def wait_below(self, limit: int) -> None:
+        """
+        Wait until no more than a given number of bytes are queued.
+        
+        Args:
+            limit: Queued bytes to wait for
+        """
+        while self.queued_bytes > limit:
+            self._progress.clear()
+            await self._progress.wait()
+    
+    async def put(self, parts: List[Buffer]) -> bool:
+        """
+        Queue one encoded frame.
+        
+        Args:
+            parts: Frame payload buffers
+            
+        Returns:
+            True if queued, False if dropped under the drop policy
+        """
+        while self.queued_bytes >= self.config.high_water:
+            if self.config.policy == POLICY_DROP:
+                self.dropped += 1
+                return False
+            await self._writable.wait()
+        
+        size = sum(len(part) for part in parts)
+        self._items.append((parts, size))
+        self.queued_bytes += size
+        self.max_depth = max(self.max_depth, len(self._items))
+        if self.queued_bytes >= self.config.high_water:
+            self._writable.clear()
+        
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return True
+    
+    def close(self) -> None:
+        """Stop writing and discard queued messages."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        self._discard()
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get queue status.
+        
+        Returns:
+            Depth, size and throughput counters
+        """
+        return {
+            "depth": self.depth,
+            "queued_bytes": self.queued_bytes,
+            "max_depth": self.max_depth,
+            "congested": self.is_congested,
+            "messages_sent": self.messages_sent,
+            "frames_sent": self.frames_sent,
+            "dropped": self.dropped
+        }
+    
+    async def _run(self) -> None:
+        """Write queued messages until the queue is empty."""
+        while self._items:
+            connection = await self._connect()
+            if connection is None:
+                logger.warning(f"Discarding {self.depth} queued messages for unreachable peer")
+                self._discard()
+                return
+            
+            batch = await self._next_batch()
+            try:
+                connection.send_parts(self._frame(batch), len(batch))
+                await connection.drain()
+            except ConnectionError as e:
+                logger.warning(f"Lost {len(batch)} queued messages: {e}")
+                self.dropped += len(batch)
+            else:
+                self.messages_sent += len(batch)
+                self.frames_sent += 1
+            self._release(sum(size for _, size in batch))
+    
+    async def _next_batch(self) -> List[Tuple[List[Buffer], int]]:
+        """Take the next message, or run of small messages, off the queue."""
+        cfg = self.config
+        lone_small = len(self._items) == 1 and self._items[0][1] < cfg.coalesce_max_bytes
+        if lone_small and cfg.coalesce_window > 0:
+            await asyncio.sleep(cfg.coalesce_window)
+        
+        batch = [self._items.popleft()]
+        total = batch[0][1]
+        while (self._items and total < cfg.coalesce_max_bytes
+                and total + self._items[0][1] <= cfg.coalesce_max_bytes):
+            item = self._items.popleft()
+            batch.append(item)
+            total += item[1]
+        return batch
+    
+    def _frame(self, batch: List[Tuple[List[Buffer], int]]) -> List[Buffer]:
+        """Frame parts for one message or a batch of messages."""
+        if len(batch) == 1:
+            return batch[0][0]
+        
+        parts: List[Buffer] = [self._batch_prefix]
+        for message, size in batch:
+            parts.append(BATCH_ITEM_HEADER.pack(size))
+            parts.extend(message)
+        return parts
+    
+    def _release(self, size: int) -> None:
+        """Account for written bytes, waking blocked senders at low water."""
+        self.queued_bytes -= size
+        self._progress.set()
+        if self.queued_bytes <= self.config.low_water:
+            self._writable.set()
+    
+    def _discard(self) -> None:
+        """Drop every queued message."""
+        self.dropped += len(self._items)
+        self._items.clear()
+        self._release(self.queued_bytes)
@@ -0,0 +1,590 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Secure Sessions
+
+Implements authenticated key exchange, per-frame authenticated
+encryption and session resumption tickets for P2P connections.
+"""
+
+import asyncio
+import logging
+import os
+import struct
+from typing import Any, Callable, Dict, Optional, Tuple
+from dataclasses import dataclass
+
+from . import codec
+from .transport import FramedConnection
+
+try:
+    from cryptography.exceptions import InvalidSignature, InvalidTag
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PrivateKey, Ed25519PublicKey
+    )
+    from cryptography.hazmat.primitives.asymmetric.x25519 import (
+        X25519PrivateKey, X25519PublicKey
+    )
+    from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+    CRYPTO_AVAILABLE = True
+except ImportError:
+    CRYPTO_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL = b"maya-p2p/1"
+# 96-bit AEAD nonce: 4 zero bytes and a 64-bit per-direction frame counter
+NONCE = struct.Struct("!IQ")
+TICKET_NONCE_SIZE = 12
+
+
+@dataclass
+class SessionConfig:
+    """Configuration for secure sessions"""
+    handshake_timeout: float = 10.0  # Seconds to wait for the peer's handshake
+    ticket_lifetime: float = 3600.0  # Seconds a resumption ticket stays valid
+    require_known_keys: bool = False  # Refuse peers without a known public key
+
+
+class SessionError(Exception):
+    """Raised when a session handshake fails."""
+
+
+def _require_crypto() -> None:
+    """Fail clearly when the optional cryptography package is missing."""
+    if not CRYPTO_AVAILABLE:
+        raise RuntimeError("Secure sessions need the 'cryptography' package")
+
+
+def _raw(public_key: Any) -> bytes:
+    """Raw bytes of an Ed25519 or X25519 public key."""
+    return public_key.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+
+
+def _derive(secret: bytes, salt: bytes, info: bytes) -> Tuple[bytes, bytes, bytes]:
+    """
+    Derive session keys from a shared secret.
+    
+    Returns:
+        (initiator-to-responder key, responder-to-initiator key,
+        resumption secret)
+    """
+    okm = HKDF(algorithm=hashes.SHA256(), length=96, salt=salt, info=PROTOCOL + info).derive(secret)
+    return okm[:32], okm[32:64], okm[64:]
+
+
+class NodeIdentity:
+    """
+    Long-term Ed25519 identity of a node.
+    
+    The public key is what PeerInfo.public_key holds, as hex. It signs
+    the node's half of each full handshake and nothing else.
+    """
+    
+    def __init__(self, private_key: Optional[bytes] = None):
+        """
+        Initialize identity.
+        
+        Args:
+            private_key: 32-byte raw private key (generated if None)
+            
+        Raises:
+            RuntimeError: If the cryptography package is not installed
+        """
+        _require_crypto()
+        if private_key is None:
+            self._key = Ed25519PrivateKey.generate()
+        else:
+            self._key = Ed25519PrivateKey.from_private_bytes(private_key)
+        self.public_bytes = _raw(self._key.public_key())
+    
+    @property
+    def public_key(self) -> str:
+        """Public key as hex, as stored in PeerInfo.public_key."""
+        return self.public_bytes.hex()
+    
+    def private_bytes(self) -> bytes:
+        """
+        Export the private key for storage.
+        
+        Returns:
+            32-byte raw private key
+        """
+        return self._key.private_bytes(
+            serialization.Encoding.Raw,
+            serialization.PrivateFormat.Raw,
+            serialization.NoEncryption()
+        )
+    
+    def sign(self, data: bytes) -> bytes:
+        """
+        Sign data.
+        
+        Args:
+            data: Data to sign
+            
+        Returns:
+            64-byte signature
+        """
+        return self._key.sign(data)
+    
+    @staticmethod
+    def verify(public_key: bytes, signature: bytes, data: bytes) -> bool:
+        """
+        Check a signature.
+        
+        Args:
+            public_key: 32-byte raw public key
+            signature: Signature to check
+            data: Signed data
+            
+        Returns:
+            True if the signature is valid
+        """
+        try:
+            Ed25519PublicKey.from_public_bytes(public_key).verify(signature, data)
+            return True
+        except (InvalidSignature, ValueError):
+            return False
+
+
+class FrameCipher:
+    """
+    ChaCha20-Poly1305 encryption of one connection's frames.
+    
+    Each direction has its own key and a frame counter as its nonce.
+    The stream is ordered and reliable, so counters never travel on the
+    wire and a replayed, dropped or reordered frame fails to decrypt.
+    """
+    
+    __slots__ = ("_send", "_receive", "_sent", "_received")
+    
+    def __init__(self, send_key: bytes, receive_key: bytes):
+        """
+        Initialize cipher.
+        
+        Args:
+            send_key: 32-byte key for outgoing frames
+            receive_key: 32-byte key for incoming frames
+        """
+        self._send = ChaCha20Poly1305(send_key)
+        self._receive = ChaCha20Poly1305(receive_key)
+        self._sent = 0
+        self._received = 0
+    
+    def encrypt(self, payload: bytes) -> bytes:
+        """
+        Encrypt the next outgoing frame.
+        
+        Args:
+            payload: Frame payload
+            
+        Returns:
+            Ciphertext with a 16-byte tag
+        """
+        nonce = NONCE.pack(0, self._sent)
+        self._sent += 1
+        return self._send.encrypt(nonce, payload, None)
+    
+    def decrypt(self, payload: bytes) -> bytes:
+        """
+        Decrypt the next incoming frame.
+        
+        Args:
+            payload: Ciphertext with tag
+            
+        Returns:
+            Frame payload
+            
+        Raises:
+            ValueError: If the frame fails authentication
+        """
+        nonce = NONCE.pack(0, self._received)
+        try:
+            plaintext = self._receive.decrypt(nonce, payload, None)
+        except InvalidTag:
+            raise ValueError("Frame failed authentication") from None
+        self._received += 1
+        return plaintext
+
+
+class _Handshake:
+    """Initiator state while waiting for the responder's accept."""
+    
+    __slots__ = ("peer_id", "nonce", "ephemeral", "ticket", "ready")
+    
+    def __init__(self, peer_id: str, ready: asyncio.Future):
+        """Initialize state for a connection to a peer."""
+        self.peer_id = peer_id
+        self.nonce = os.urandom(16)
+        self.ephemeral: Optional[Any] = None
+        self.ticket: Optional[Tuple[bytes, bytes, float, str]] = None
+        self.ready = ready
+
+
+class SessionManager:
+    """
+    Sets up encrypted sessions on new connections.
+    
+    A full handshake is one message each way. The dialling node sends an
+    ephemeral X25519 key and a nonce, signed with its identity key; the
+    accepting node answers with its own, signing both halves. Both
+    derive per-direction ChaCha20-Poly1305 keys from the Diffie-Hellman
+    secret, bound to both identities and ephemeral keys. From then on
+    every frame is encrypted by a FrameCipher, so the public-key work is
+    two signatures, two verifications and one exchange per connection.
+    
+    After a handshake the accepting node issues a resumption ticket: the
+    session's resumption secret and the dialler's identity, sealed under
+    a key only the issuer holds. A reconnect presents the ticket with a
+    fresh nonce and both sides derive new keys from the secret, with no
+    public-key operation at all. Tickets are single-use: the issuer
+    remembers each redeemed ticket until it expires and refuses repeats,
+    so a captured ticket cannot be replayed. They expire after
+    ticket_lifetime and die with the issuing process; a rejected ticket
+    falls back to a full handshake. Resumed sessions are not forward
+    secret with respect to the ticket key.
+    """
+    
+    def __init__(
+        self,
+        node_id: str,
+        identity: NodeIdentity,
+        send: Callable[[FramedConnection, Dict[str, Any]], None],
+        established: Callable[[FramedConnection, str, str], None],
+        known_key: Callable[[str], Optional[str]],
+        config: Optional[SessionConfig] = None
+    ):
+        """
+        Initialize session manager.
+        
+        Args:
+            node_id: This node's ID
+            identity: This node's identity key
+            send: Sends a session message on a connection
+            established: Called with (connection, peer_id, public key hex)
+                once a connection is encrypted
+            known_key: Returns the expected public key of a peer, if known
+            config: Session configuration (uses defaults if None)
+            
+        Raises:
+            RuntimeError: If the cryptography package is not installed
+        """
+        _require_crypto()
+        self.node_id = node_id
+        self.identity = identity
+        self.config = config or SessionConfig()
+        self._send = send
+        self._established = established
+        self._known_key = known_key
+        self._ticket_cipher = ChaCha20Poly1305(ChaCha20Poly1305.generate_key())
+        # Tickets issued to us: peer -> (ticket, secret, expiry, peer key)
+        self.tickets: Dict[str, Tuple[bytes, bytes, float, str]] = {}
+        self._pending: Dict[FramedConnection, _Handshake] = {}
+        # Connections peers opened to us that are not yet secured
+        self._accepting: Dict[FramedConnection, asyncio.Future] = {}
+        # Sessions we dialled whose ticket has not arrived: (secret, peer key)
+        self._resumable: Dict[FramedConnection, Tuple[bytes, str]] = {}
+        # Tickets already redeemed here, by nonce, with their expiry, in
+        # redemption order; pruned from the front once expired
+        self._redeemed: Dict[bytes, float] = {}
+        self.stats = {
+            "full_handshakes": 0,
+            "resumed": 0,
+            "tickets_issued": 0,
+            "tickets_rejected": 0,
+            "failures": 0
+        }
+    
+    async def initiate(self, connection: FramedConnection, peer_id: str) -> None:
+        """
+        Secure a connection this node opened.
+        
+        Args:
+            connection: New outbound connection
+            peer_id: Peer the connection was opened to
+            
+        Raises:
+            SessionError: If the handshake failed
+            asyncio.TimeoutError: If the peer did not complete it in time
+        """
+        ready = asyncio.get_running_loop().create_future()
+        state = self._pending[connection] = _Handshake(peer_id, ready)
+        ticket = self.tickets.pop(peer_id, None)
+        if ticket and ticket[2] > self._now():
+            state.ticket = ticket
+            self._send(connection, {
+                "type": "init", "node_id": self.node_id, "nonce": state.nonce, "ticket": ticket[0]
+            })
+        else:
+            self._send_full_init(connection, state)
+        try:
+            await asyncio.wait_for(ready, self.config.handshake_timeout)
+        finally:
+            self._pending.pop(connection, None)
+    
+    async def accept(self, connection: FramedConnection) -> None:
+        """
+        Wait for the peer to secure a connection it opened to this node.
+        
+        Closes the connection if no handshake completes within
+        handshake_timeout, so a silent peer cannot hold it open.
+        
+        Args:
+            connection: New inbound connection
+        """
+        ready = self._accepting[connection] = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(ready, self.config.handshake_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Session handshake with {connection.peername} timed out")
+            self.stats["failures"] += 1
+            connection.close()
+        except SessionError:
+            # Already counted and closed by receive, or closed by the peer
+            pass
+        finally:
+            self._accepting.pop(connection, None)
+    
+    def receive(self, connection: FramedConnection, message: Dict[str, Any]) -> None:
+        """
+        Handle a session frame from a peer.
+        
+        Args:
+            connection: Connection it arrived on
+            message: Decoded session message
+        """
+        kind = message.get("type")
+        try:
+            if kind == "init":
+                self._on_init(connection, message)
+            elif kind == "accept":
+                self._on_accept(connection, message)
+            elif kind == "retry":
+                self._on_retry(connection)
+            elif kind == "ticket":
+                self._on_ticket(connection, message)
+            else:
+                raise SessionError(f"Unknown session message: {kind}")
+        except (SessionError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Session handshake with {connection.peername} failed: {e}")
+            self.stats["failures"] += 1
+            state = self._pending.get(connection)
+            if state and not state.ready.done():
+                state.ready.set_exception(SessionError(str(e)))
+            accepting = self._accepting.get(connection)
+            if accepting and not accepting.done():
+                accepting.set_exception(SessionError(str(e)))
+            connection.close()
+    
+    def discard(self, connection: FramedConnection) -> None:
+        """
+        Forget a closed connection, failing its handshake if unfinished.
+        
+        Args:
+            connection: Connection that closed
+        """
+        self._resumable.pop(connection, None)
+        state = self._pending.get(connection)
+        if state and not state.ready.done():
+            state.ready.set_exception(SessionError("Connection closed during handshake"))
+        accepting = self._accepting.get(connection)
+        if accepting and not accepting.done():
+            accepting.set_exception(SessionError("Connection closed during handshake"))
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get session counters.
+        
+        Returns:
+            Handshake, resumption and ticket counts
+        """
+        return dict(self.stats, tickets_held=len(self.tickets))
+    
+    # Initiator
+    
+    def _send_full_init(self, connection: FramedConnection, state: _Handshake) -> None:
+        """Start a full handshake with a fresh ephemeral key."""
+        state.ephemeral = X25519PrivateKey.generate()
+        ephemeral = _raw(state.ephemeral.public_key())
+        self._send(connection, {
+            "type": "init",
+            "node_id": self.node_id,
+            "nonce": state.nonce,
+            "ephemeral": ephemeral,
+            "key": self.identity.public_bytes,
+            "sig": self.identity.sign(b"init" + ephemeral + state.nonce + self.node_id.encode())
+        })
+    
+    def _on_accept(self, connection: FramedConnection, accept: Dict[str, Any]) -> None:
+        """Finish a handshake this node started."""
+        state = self._pending.get(connection)
+        if state is None or connection.cipher is not None:
+            raise SessionError("Unexpected accept")
+        if accept["node_id"] != state.peer_id:
+            raise SessionError(f"Expected {state.peer_id}, reached {accept['node_id']}")
+        ids = self.node_id.encode() + b"\0" + state.peer_id.encode()
+        
+        if state.ephemeral is None:
+            # Resumed: the ticket holder already knows the peer's identity
+            _, secret, _, peer_key = state.ticket
+            send_key, receive_key, resumption = _derive(
+                secret, state.nonce + accept["nonce"], b"resume" + ids
+            )
+            self.stats["resumed"] += 1
+        else:
+            ours = _raw(state.ephemeral.public_key())
+            theirs = accept["ephemeral"]
+            signed = b"accept" + theirs + accept["nonce"] + ours + state.nonce + accept["node_id"].encode()
+            peer_key = self._check_identity(state.peer_id, accept["key"], accept["sig"], signed)
+            secret = state.ephemeral.exchange(X25519PublicKey.from_public_bytes(theirs))
+            send_key, receive_key, resumption = _derive(
+                secret, state.nonce + accept["nonce"],
+                b"full" + ids + ours + theirs + self.identity.public_bytes + accept["key"]
+            )
+            self.stats["full_handshakes"] += 1
+        
+        connection.cipher = FrameCipher(send_key, receive_key)
+        self._resumable[connection] = (resumption, peer_key)
+        self._established(connection, state.peer_id, peer_key)
+        state.ready.set_result(None)
+    
+    def _on_retry(self, connection: FramedConnection) -> None:
+        """Fall back to a full handshake after a rejected ticket."""
+        state = self._pending.get(connection)
+        if state is None or state.ephemeral is not None:
+            raise SessionError("Unexpected retry")
+        state.ticket = None
+        self._send_full_init(connection, state)
+    
+    def _on_ticket(self, connection: FramedConnection, message: Dict[str, Any]) -> None:
+        """Store a resumption ticket for the next connection to a peer."""
+        resumable = self._resumable.pop(connection, None)
+        if resumable is None:
+            raise SessionError("Unexpected ticket")
+        secret, peer_key = resumable
+        expires = self._now() + min(message["lifetime"], self.config.ticket_lifetime)
+        self.tickets[connection.peer_id] = (message["ticket"], secret, expires, peer_key)
+    
+    # Responder
+    
+    def _on_init(self, connection: FramedConnection, init: Dict[str, Any]) -> None:
+        """Answer a handshake from a connecting peer."""
+        if connection.cipher is not None or connection in self._pending:
+            raise SessionError("Unexpected init")
+        peer_id = init["node_id"]
+        nonce = os.urandom(16)
+        ids = peer_id.encode() + b"\0" + self.node_id.encode()
+        
+        if "ticket" in init:
+            ticket = self._open_ticket(init["ticket"], peer_id)
+            if ticket is None:
+                self.stats["tickets_rejected"] += 1
+                self._send(connection, {"type": "retry"})
+                return
+            secret, peer_key = ticket
+            receive_key, send_key, resumption = _derive(
+                secret, init["nonce"] + nonce, b"resume" + ids
+            )
+            self._send(connection, {"type": "accept", "node_id": self.node_id, "nonce": nonce})
+            self.stats["resumed"] += 1
+        else:
+            theirs = init["ephemeral"]
+            signed = b"init" + theirs + init["nonce"] + peer_id.encode()
+            peer_key = self._check_identity(peer_id, init["key"], init["sig"], signed)
+            ephemeral = X25519PrivateKey.generate()
+            ours = _raw(ephemeral.public_key())
+            secret = ephemeral.exchange(X25519PublicKey.from_public_bytes(theirs))
+            receive_key, send_key, resumption = _derive(
+                secret, init["nonce"] + nonce,
+                b"full" + ids + theirs + ours + init["key"] + self.identity.public_bytes
+            )
+            signed = b"accept" + ours + nonce + theirs + init["nonce"] + self.node_id.encode()
+            self._send(connection, {
+                "type": "accept",
+                "node_id": self.node_id,
+                "nonce": nonce,
+                "ephemeral": ours,
+                "key": self.identity.public_bytes,
+                "sig": self.identity.sign(signed)
+            })
+            self.stats["full_handshakes"] += 1
+        
+        connection.cipher = FrameCipher(send_key, receive_key)
+        self._established(connection, peer_id, peer_key)
+        self._issue_ticket(connection, peer_id, peer_key, resumption)
+        accepting = self._accepting.get(connection)
+        if accepting and not accepting.done():
+            accepting.set_result(None)
+    
+    def _issue_ticket(
+        self,
+        connection: FramedConnection,
+        peer_id: str,
+        peer_key: str,
+        secret: bytes
+    ) -> None:
+        """Send the peer a ticket for resuming this session."""
+        lifetime = self.config.ticket_lifetime
+        sealed = codec.encode({
+            "node_id": peer_id, "key": peer_key, "secret": secret, "expires": self._now() + lifetime
+        })
+        nonce = os.urandom(TICKET_NONCE_SIZE)
+        ticket = nonce + self._ticket_cipher.encrypt(nonce, sealed, PROTOCOL)
+        self._send(connection, {"type": "ticket", "ticket": ticket, "lifetime": lifetime})
+        self.stats["tickets_issued"] += 1
+    
+    def _open_ticket(self, ticket: bytes, peer_id: str) -> Optional[Tuple[bytes, str]]:
+        """Redeem a ticket this node issued; None if forged, expired, reused or not the peer's."""
+        nonce, sealed = ticket[:TICKET_NONCE_SIZE], ticket[TICKET_NONCE_SIZE:]
+        try:
+            contents = codec.decode(self._ticket_cipher.decrypt(nonce, sealed, PROTOCOL))
+        except (InvalidTag, ValueError, codec.CodecError):
+            return None
+        now = self._now()
+        if contents["node_id"] != peer_id or contents["expires"] <= now:
+            return None
+        
+        redeemed = self._redeemed
+        while redeemed:
+            oldest, expires = next(iter(redeemed.items()))
+            if expires > now:
+                break
+            del redeemed[oldest]
+        if nonce in redeemed:
+            return None
+        redeemed[nonce] = contents["expires"]
+        return contents["secret"], contents["key"]
+    
+    # Shared
+    
+    def _check_identity(self, peer_id: str, key: bytes, signature: bytes, signed: bytes) -> str:
+        """
+        Verify a handshake signature and the key it was made with.
+        
+        Returns:
+            The peer's public key as hex
+            
+        Raises:
+            SessionError: If the signature is bad or the key is not the
+                one expected for the peer
+        """
+        if not NodeIdentity.verify(key, signature, signed):
+            raise SessionError(f"Bad handshake signature from {peer_id}")
+        expected = self._known_key(peer_id)
+        if expected is None and self.config.require_known_keys:
+            raise SessionError(f"No known public key for {peer_id}")
+        if expected is not None and expected != key.hex():
+            raise SessionError(f"Public key mismatch for {peer_id}")
+        return key.hex()
+    
+    @staticmethod
+    def _now() -> float:
+        """Current loop time."""
+        return asyncio.get_running_loop().time()
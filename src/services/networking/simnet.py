@@ -0,0 +1,506 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Simulated Network
+
+Implements an in-process network with a virtual clock for running many
+P2P nodes in one process, faster than real time.
+"""
+
+import asyncio
+import logging
+import random
+import selectors
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass
+
+from .compression import CompressionConfig
+from .p2p import P2PNetwork
+from .transport import Buffer, FramedConnection, ProtocolFactory
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SimConfig:
+    """Configuration for the simulated network"""
+    latency: float = 0.05  # One-way delay in seconds
+    jitter: float = 0.0  # Extra uniform random delay, up to this many seconds
+    loss: float = 0.0  # Chance that a packet is lost and retransmitted
+    retransmit_timeout: float = 0.2  # Delay added per lost packet
+    bandwidth: Optional[float] = None  # Bytes per second per link direction
+    send_buffer: int = 64 * 1024  # Unsent bytes at which a bandwidth-limited writer pauses
+    seed: int = 0  # Seed for jitter and loss
+
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """Selector that advances the virtual clock instead of sleeping."""
+    
+    def __init__(self, loop: "VirtualEventLoop"):
+        """Initialize selector for a loop."""
+        super().__init__()
+        self._loop = loop
+    
+    def select(self, timeout: Optional[float] = None) -> List[Tuple[Any, int]]:
+        """Poll real I/O without blocking, then jump to the next timer."""
+        if timeout is None:
+            # Nothing scheduled: wait for a thread-safe callback
+            return super().select(None)
+        events = super().select(0)
+        if not events and timeout > 0:
+            self._loop.advance(timeout)
+        return events
+
+
+class VirtualEventLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop running on a virtual clock.
+    
+    Whenever every task is waiting, the clock jumps straight to the next
+    scheduled timer, so sleeps, timeouts and simulated network delays
+    take no wall-clock time. Code that reads time from the loop, as all
+    of the networking services do, behaves exactly as on a real loop.
+    """
+    
+    def __init__(self, start: float = 0.0):
+        """
+        Initialize loop.
+        
+        Args:
+            start: Initial virtual time in seconds
+        """
+        self._now = start
+        super().__init__(_VirtualSelector(self))
+    
+    def time(self) -> float:
+        """Current virtual time."""
+        return self._now
+    
+    def advance(self, seconds: float) -> None:
+        """Move the virtual clock forward."""
+        self._now += seconds
+
+
+class _SimLink(asyncio.Transport):
+    """One end of a simulated stream connection."""
+    
+    def __init__(
+        self,
+        net: "SimNetwork",
+        local: Tuple[str, int],
+        remote: Tuple[str, int],
+        protocol: FramedConnection
+    ):
+        """Initialize one end; the caller links the two ends."""
+        super().__init__()
+        self.net = net
+        self.local = local
+        self.remote = remote
+        self.protocol = protocol
+        self.peer: Optional["_SimLink"] = None
+        # Virtual times when this direction's link is next free and when
+        # the last byte sent arrives, which keeps delivery in order
+        self._busy_until = 0.0
+        self._last_arrival = 0.0
+        # Writes from the peer not yet delivered: (arrival time, data),
+        # where None data is the peer closing
+        self._inbox: Deque[Tuple[float, Optional[bytes]]] = deque()
+        self._closing = False
+        self._lost = False
+        self._paused = False
+    
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        """Report simulated socket addresses."""
+        if name == "peername":
+            return self.remote
+        if name == "sockname":
+            return self.local
+        return default
+    
+    def is_closing(self) -> bool:
+        """Whether the link is closed or closing."""
+        return self._closing
+    
+    def get_write_buffer_size(self) -> int:
+        """Bytes written but not yet serialized onto a bandwidth-limited link."""
+        bandwidth = self.net.config.bandwidth
+        if not bandwidth:
+            return 0
+        return max(0, int((self._busy_until - self.net._loop().time()) * bandwidth))
+    
+    def write(self, data: Buffer) -> None:
+        """Send bytes to the other end."""
+        self.writelines([data])
+    
+    def writelines(self, parts: List[Buffer]) -> None:
+        """Send buffers to the other end as one write."""
+        if self._closing:
+            return
+        data = b"".join(parts)
+        arrival = self.net._arrival(self, len(data))
+        self.peer._deliver_at(arrival, data)
+        if not self._paused and self.get_write_buffer_size() > self.net.config.send_buffer:
+            # Like a full socket buffer: stop writers until the link catches up
+            self._paused = True
+            self.protocol.pause_writing()
+            self._schedule_resume()
+    
+    def close(self) -> None:
+        """Close both ends, the remote one after data in flight arrives."""
+        if self._closing:
+            return
+        self._closing = True
+        # The peer sees the close after any data still in flight
+        self.peer._deliver_at(self.net._arrival(self, 0), None)
+        self.net._loop().call_soon(self._disconnect)
+    
+    def abort(self) -> None:
+        """Close the link."""
+        self.close()
+    
+    def _deliver_at(self, arrival: float, data: Optional[bytes]) -> None:
+        """
+        Queue bytes to arrive at a virtual time.
+        
+        Timers due at the same time may run in any order, so writes go
+        through one inbox per link end to keep the stream in order.
+        """
+        self._inbox.append((arrival, data))
+        if len(self._inbox) == 1:
+            self.net._loop().call_at(arrival, self._receive)
+    
+    def _receive(self) -> None:
+        """Hand every write that has arrived to the protocol."""
+        now = self.net._loop().time()
+        while self._inbox and self._inbox[0][0] <= now:
+            _, data = self._inbox.popleft()
+            if data is None:
+                self._disconnect()
+            elif not self._lost:
+                self.protocol.data_received(data)
+        if self._inbox:
+            self.net._loop().call_at(self._inbox[0][0], self._receive)
+    
+    def _drained_at(self) -> float:
+        """Virtual time at which the unsent backlog will have halved."""
+        return self._busy_until - self.net.config.send_buffer / 2 / self.net.config.bandwidth
+    
+    def _schedule_resume(self) -> None:
+        """Resume the writer when the backlog has halved."""
+        self.net._loop().call_at(self._drained_at(), self._resume)
+    
+    def _resume(self) -> None:
+        """Resume a paused writer, unless writes since pausing refilled the link."""
+        if not self._paused or self._lost:
+            return
+        if self._drained_at() > self.net._loop().time() + 1e-9:
+            self._schedule_resume()
+            return
+        self._paused = False
+        self.protocol.resume_writing()
+    
+    def _disconnect(self) -> None:
+        """Report the connection lost, once."""
+        if self._lost:
+            return
+        self._lost = True
+        self._closing = True
+        self.net._links.discard(self)
+        self.protocol.connection_lost(None)
+
+
+class SimNetwork:
+    """
+    Simulated network fabric shared by virtual nodes.
+    
+    Each node gets a SimTransport with its own address. Connections are
+    reliable ordered streams like TCP: every write arrives after the
+    link latency plus jitter and, with a bandwidth limit, the time to
+    serialize it behind earlier writes, pausing writers while more than
+    send_buffer bytes wait to be serialized. Packet loss shows up as
+    retransmission delay rather than missing bytes. A partition closes
+    the connections that cross it and refuses new ones until healed.
+    
+    Run the nodes on a VirtualEventLoop to simulate faster than real
+    time; on a normal loop the delays are real.
+    """
+    
+    def __init__(self, config: Optional[SimConfig] = None):
+        """
+        Initialize network.
+        
+        Args:
+            config: Network conditions (uses defaults if None)
+        """
+        self.config = config or SimConfig()
+        self.random = random.Random(self.config.seed)
+        self._listeners: Dict[Tuple[str, int], ProtocolFactory] = {}
+        self._links: Set[_SimLink] = set()
+        self._link_overrides: Dict[frozenset, Dict[str, float]] = {}
+        self._groups: Dict[str, int] = {}
+        self._next_address = 1
+        self._next_port = 40000
+        self.stats = {
+            "connections": 0,
+            "refused": 0,
+            "writes": 0,
+            "bytes": 0,
+            "retransmits": 0,
+            "severed": 0
+        }
+    
+    def transport(self) -> "SimTransport":
+        """
+        Create a transport with a fresh address.
+        
+        Returns:
+            Transport for one node
+        """
+        n = self._next_address
+        self._next_address += 1
+        return SimTransport(self, f"10.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}")
+    
+    def create_node(self, node_id: str, **kwargs: Any) -> P2PNetwork:
+        """
+        Create a P2P node attached to this network.
+        
+        Link compression is off unless a compression config is given,
+        since it only costs memory and CPU in simulation.
+        
+        Args:
+            node_id: Node ID
+            **kwargs: Further P2PNetwork arguments
+            
+        Returns:
+            Unopened node
+        """
+        transport = self.transport()
+        kwargs.setdefault("compression_config", CompressionConfig(enabled=False))
+        return P2PNetwork(node_id, host=transport.address, transport=transport, **kwargs)
+    
+    def set_link(
+        self,
+        a: str,
+        b: str,
+        latency: Optional[float] = None,
+        loss: Optional[float] = None
+    ) -> None:
+        """
+        Override conditions between two addresses, in both directions.
+        
+        Args:
+            a: First address
+            b: Second address
+            latency: One-way delay in seconds (None keeps the default)
+            loss: Loss probability (None keeps the default)
+        """
+        override = self._link_overrides.setdefault(frozenset((a, b)), {})
+        if latency is not None:
+            override["latency"] = latency
+        if loss is not None:
+            override["loss"] = loss
+    
+    def partition(self, *groups: List[str]) -> None:
+        """
+        Split the network so only addresses in the same group can talk.
+        
+        Addresses not listed form one more group. Connections between
+        groups are closed.
+        
+        Args:
+            *groups: Lists of addresses
+        """
+        self._groups = {
+            address: i + 1 for i, group in enumerate(groups) for address in group
+        }
+        for link in list(self._links):
+            if not self.reachable(link.local[0], link.remote[0]):
+                self.stats["severed"] += 1
+                link.close()
+    
+    def heal(self) -> None:
+        """Remove all partitions."""
+        self._groups = {}
+    
+    def reachable(self, a: str, b: str) -> bool:
+        """
+        Check whether two addresses are on the same side of a partition.
+        
+        Args:
+            a: First address
+            b: Second address
+            
+        Returns:
+            True if they can connect
+        """
+        return self._groups.get(a, 0) == self._groups.get(b, 0)
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get network counters.
+        
+        Returns:
+            Traffic counters and the number of open links
+        """
+        return dict(self.stats, links=len(self._links) // 2)
+    
+    # Transport support
+    
+    def _listen(self, address: str, port: int, factory: ProtocolFactory) -> int:
+        """Register a listener, assigning a port if 0."""
+        if port == 0:
+            port = self._next_port
+            self._next_port += 1
+        if (address, port) in self._listeners:
+            raise OSError(f"Address in use: {address}:{port}")
+        self._listeners[(address, port)] = factory
+        return port
+    
+    def _unlisten(self, address: str, port: int) -> None:
+        """Remove a listener and close its node's links."""
+        self._listeners.pop((address, port), None)
+        for link in list(self._links):
+            if link.local[0] == address:
+                link.close()
+    
+    async def _connect(
+        self,
+        address: str,
+        host: str,
+        port: int,
+        factory: ProtocolFactory,
+        timeout: float
+    ) -> FramedConnection:
+        """Open a stream from address to a listener after one round trip."""
+        loop = self._loop()
+        listener = self._listeners.get((host, port))
+        if not self.reachable(address, host):
+            # Unanswered connection attempts fail only when they time out
+            await asyncio.sleep(timeout)
+            self.stats["refused"] += 1
+            raise asyncio.TimeoutError(f"Connect to {host}:{port} timed out")
+        
+        delay = self._delay(address, host) + self._delay(host, address)
+        await asyncio.sleep(delay)
+        if listener is None or not self.reachable(address, host):
+            self.stats["refused"] += 1
+            raise ConnectionRefusedError(f"Connection refused by {host}:{port}")
+        
+        local = (address, self._next_port)
+        self._next_port += 1
+        client = factory()
+        server = listener()
+        a = _SimLink(self, local, (host, port), client)
+        b = _SimLink(self, (host, port), local, server)
+        a.peer, b.peer = b, a
+        a._last_arrival = b._last_arrival = loop.time()
+        self._links.update((a, b))
+        self.stats["connections"] += 1
+        
+        server.connection_made(b)
+        client.connection_made(a)
+        return client
+    
+    def _delay(self, src: str, dst: str) -> float:
+        """One-way propagation delay for one packet, including retransmits."""
+        cfg = self.config
+        override = self._link_overrides.get(frozenset((src, dst)), {})
+        delay = override.get("latency", cfg.latency)
+        if cfg.jitter:
+            delay += self.random.uniform(0, cfg.jitter)
+        loss = override.get("loss", cfg.loss)
+        while loss and self.random.random() < loss:
+            self.stats["retransmits"] += 1
+            delay += cfg.retransmit_timeout
+        return delay
+    
+    def _arrival(self, link: _SimLink, size: int) -> float:
+        """Virtual time at which a write on a link reaches the other end."""
+        now = self._loop().time()
+        sent = now
+        if self.config.bandwidth and size:
+            sent = max(now, link._busy_until) + size / self.config.bandwidth
+            link._busy_until = sent
+        arrival = max(sent + self._delay(link.local[0], link.remote[0]), link._last_arrival)
+        link._last_arrival = arrival
+        if size:
+            self.stats["writes"] += 1
+            self.stats["bytes"] += size
+        return arrival
+    
+    @staticmethod
+    def _loop() -> asyncio.AbstractEventLoop:
+        """The loop the simulation runs on."""
+        return asyncio.get_running_loop()
+
+
+class SimTransport:
+    """
+    Transport for one node on a SimNetwork.
+    
+    Has the same interface as TcpTransport, so it can be passed to
+    P2PNetwork in its place.
+    """
+    
+    def __init__(self, net: SimNetwork, address: str):
+        """
+        Initialize transport.
+        
+        Args:
+            net: Network to attach to
+            address: This node's address
+        """
+        self.net = net
+        self.address = address
+        self._port: Optional[int] = None
+    
+    async def listen(self, host: str, port: int, factory: ProtocolFactory) -> int:
+        """
+        Start accepting connections on this node's address.
+        
+        Args:
+            host: Ignored; nodes listen on their own address
+            port: Port to listen on (0 for auto)
+            factory: Creates the protocol for each accepted connection
+            
+        Returns:
+            Bound port
+        """
+        self._port = self.net._listen(self.address, port, factory)
+        return self._port
+    
+    async def connect(
+        self,
+        host: str,
+        port: int,
+        factory: ProtocolFactory,
+        timeout: float = 10.0
+    ) -> FramedConnection:
+        """
+        Open a connection to another node.
+        
+        Args:
+            host: Remote address
+            port: Remote port
+            factory: Creates the protocol for the connection
+            timeout: Seconds to wait for an unreachable node
+            
+        Returns:
+            Connected protocol
+            
+        Raises:
+            ConnectionRefusedError: If nothing listens there
+            asyncio.TimeoutError: If a partition blocks the connection
+        """
+        return await self.net._connect(self.address, host, port, factory, timeout)
+    
+    async def close(self) -> None:
+        """Stop accepting connections and close this node's links."""
+        if self._port is not None:
+            self.net._unlisten(self.address, self._port)
+            self._port = None
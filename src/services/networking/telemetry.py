@@ -0,0 +1,263 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Network Telemetry
+
+Implements per-peer traffic counters and log-linear latency histograms
+cheap enough to keep enabled in production.
+"""
+
+import math
+from array import array
+from typing import Any, Dict, Optional
+from dataclasses import dataclass
+
+
+@dataclass
+class TelemetryConfig:
+    """Configuration for network telemetry"""
+    enabled: bool = True
+    precision_bits: int = 6  # Histogram buckets are at most 2^-(bits-1) of their value wide
+    max_latency: float = 60.0  # Seconds; slower round trips are recorded as this
+    resolution: float = 1e-6  # Seconds per histogram unit
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+    
+    Values are counted in whole resolution units. Values below
+    2^precision_bits units get a bucket each; above that, each power of
+    two is split into 2^(precision_bits - 1) equal buckets, so a bucket
+    is never wider than a fixed fraction of its values. Percentiles
+    therefore have bounded relative error from microseconds to minutes
+    in a few kilobytes, and recording is a bit length and an increment.
+    """
+    
+    def __init__(self, config: Optional[TelemetryConfig] = None):
+        """
+        Initialize an empty histogram.
+        
+        Args:
+            config: Precision and range (uses defaults if None)
+        """
+        self.config = config or TelemetryConfig()
+        self._bits = self.config.precision_bits
+        self._sub = 1 << self._bits
+        self._half = self._sub >> 1
+        top = self._index(int(self.config.max_latency / self.config.resolution))
+        self.counts = array("Q", bytes(8 * (top + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+    
+    def record(self, seconds: float) -> None:
+        """
+        Record one latency.
+        
+        Args:
+            seconds: Latency in seconds
+        """
+        units = int(seconds / self.config.resolution) if seconds > 0 else 0
+        self.counts[min(self._index(units), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+    
+    def percentile(self, q: float) -> float:
+        """
+        Latency at or below which a given percentage of samples fall.
+        
+        Args:
+            q: Percentage, 0 to 100
+            
+        Returns:
+            Upper bound of the matching bucket in seconds, capped at the
+            largest sample; 0.0 if empty
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._upper(index) * self.config.resolution, self.max)
+        return self.max
+    
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add another histogram's samples to this one.
+        
+        Args:
+            other: Histogram with the same configuration
+            
+        Raises:
+            ValueError: If the bucket layouts differ
+        """
+        if len(other.counts) != len(self.counts) or other._bits != self._bits:
+            raise ValueError("Cannot merge histograms with different layouts")
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    def get_status(self) -> Dict[str, float]:
+        """
+        Summarize the distribution.
+        
+        Returns:
+            Sample count, and mean, percentiles and max in seconds
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+            "max": self.max
+        }
+    
+    def _index(self, units: int) -> int:
+        """Bucket for a value in resolution units."""
+        if units < self._sub:
+            return units
+        shift = units.bit_length() - self._bits
+        return self._sub + (shift - 1) * self._half + (units >> shift) - self._half
+    
+    def _upper(self, index: int) -> int:
+        """Largest value, in resolution units, that falls in a bucket."""
+        if index < self._sub:
+            return index
+        shift, offset = divmod(index - self._sub, self._half)
+        return ((offset + self._half + 1) << (shift + 1)) - 1
+
+
+class PeerTelemetry:
+    """
+    Traffic counters and round-trip latencies for one peer.
+    
+    Connections to the peer count wire bytes, including framing and
+    after compression, into bytes_in and bytes_out. A batch frame counts
+    as the messages it carries.
+    """
+    
+    __slots__ = ("config", "bytes_in", "bytes_out", "messages_in", "messages_out", "rtt")
+    
+    def __init__(self, config: TelemetryConfig):
+        """
+        Initialize zeroed counters.
+        
+        Args:
+            config: Telemetry configuration
+        """
+        self.config = config
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.messages_in = 0
+        self.messages_out = 0
+        # Allocated on the first sample, so quiet peers stay small
+        self.rtt: Optional[LatencyHistogram] = None
+    
+    def record_rtt(self, seconds: float) -> None:
+        """
+        Record a request/response round trip.
+        
+        Args:
+            seconds: Round-trip time
+        """
+        if self.rtt is None:
+            self.rtt = LatencyHistogram(self.config)
+        self.rtt.record(seconds)
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get peer counters.
+        
+        Returns:
+            Byte and message counts and the round-trip summary
+        """
+        return {
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "messages_in": self.messages_in,
+            "messages_out": self.messages_out,
+            "rtt": self.rtt.get_status() if self.rtt else None
+        }
+
+
+class NetworkTelemetry:
+    """
+    Telemetry for every peer of a node.
+    
+    Peer entries outlive connections, so counters accumulate across
+    reconnects until the peer is forgotten.
+    """
+    
+    def __init__(self, config: Optional[TelemetryConfig] = None):
+        """
+        Initialize telemetry.
+        
+        Args:
+            config: Telemetry configuration (uses defaults if None)
+        """
+        self.config = config or TelemetryConfig()
+        self.peers: Dict[str, PeerTelemetry] = {}
+    
+    def peer(self, peer_id: str) -> PeerTelemetry:
+        """
+        Get or create a peer's counters.
+        
+        Args:
+            peer_id: Peer ID
+            
+        Returns:
+            The peer's telemetry
+        """
+        telemetry = self.peers.get(peer_id)
+        if telemetry is None:
+            telemetry = self.peers[peer_id] = PeerTelemetry(self.config)
+        return telemetry
+    
+    def record_rtt(self, peer_id: str, seconds: float) -> None:
+        """
+        Record a round trip to a peer, if telemetry is enabled.
+        
+        Args:
+            peer_id: Peer ID
+            seconds: Round-trip time
+        """
+        if self.config.enabled:
+            self.peer(peer_id).record_rtt(seconds)
+    
+    def forget(self, peer_id: str) -> None:
+        """
+        Drop a peer's counters.
+        
+        Args:
+            peer_id: Peer ID
+        """
+        self.peers.pop(peer_id, None)
+    
+    def rtt(self) -> LatencyHistogram:
+        """
+        Round trips to all peers in one histogram.
+        
+        Returns:
+            Merged histogram
+        """
+        merged = LatencyHistogram(self.config)
+        for telemetry in self.peers.values():
+            if telemetry.rtt:
+                merged.merge(telemetry.rtt)
+        return merged
@@ -0,0 +1,393 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Framed Transport
+
+Implements length-prefixed message framing over asyncio TCP connections.
+"""
+
+import asyncio
+import logging
+import struct
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Each frame is a 4-byte big-endian length followed by the payload. The top
+# bit of the length marks a compressed payload and the next an encrypted one.
+FRAME_HEADER = struct.Struct("!I")
+COMPRESSED_FLAG = 0x80000000
+ENCRYPTED_FLAG = 0x40000000
+LENGTH_MASK = 0x3FFFFFFF
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class FrameError(Exception):
+    """Malformed or oversized frame"""
+
+
+class FrameDecoder:
+    """
+    Incremental decoder for length-prefixed frames.
+    
+    TCP delivers a byte stream, so a read may hold part of a frame or
+    several frames at once. Bytes are buffered until whole frames are
+    available.
+    
+    Encrypted payloads are decrypted with cipher, then decompressed.
+    Once a cipher is set, unencrypted frames are rejected.
+    """
+    
+    def __init__(self, max_frame_size: int = MAX_FRAME_SIZE):
+        """
+        Initialize decoder.
+        
+        Args:
+            max_frame_size: Largest accepted payload, in bytes
+        """
+        self.max_frame_size = max_frame_size
+        self.decompressor: Optional[Any] = None
+        self.cipher: Optional[Any] = None
+        self._buffer = bytearray()
+    
+    def feed(self, data: Buffer) -> List[bytes]:
+        """
+        Add received bytes and extract complete frames.
+        
+        Args:
+            data: Bytes read from the connection
+            
+        Returns:
+            Payloads of all frames completed by this read
+            
+        Raises:
+            FrameError: If a frame header announces an oversized payload,
+                or a payload cannot be decrypted or decompressed
+        """
+        return list(self.frames(data))
+    
+    def frames(self, data: Buffer) -> Iterator[bytes]:
+        """
+        Add received bytes and decode complete frames one at a time.
+        
+        Each frame is decoded only when requested, so a cipher or
+        decompressor installed while handling one frame applies to the
+        frames after it in the same read.
+        
+        Args:
+            data: Bytes read from the connection
+            
+        Yields:
+            Payloads of the frames completed by this read
+            
+        Raises:
+            FrameError: As for feed()
+        """
+        buffer = self._buffer
+        buffer += data
+        pos = 0
+        
+        try:
+            while len(buffer) - pos >= FRAME_HEADER.size:
+                (header,) = FRAME_HEADER.unpack_from(buffer, pos)
+                length = header & LENGTH_MASK
+                if length > self.max_frame_size:
+                    raise FrameError(f"Frame of {length} bytes exceeds limit")
+                
+                end = pos + FRAME_HEADER.size + length
+                if len(buffer) < end:
+                    break
+                payload = bytes(buffer[pos + FRAME_HEADER.size:end])
+                pos = end
+                if header & ENCRYPTED_FLAG:
+                    payload = self._decrypt(payload)
+                elif self.cipher is not None:
+                    raise FrameError("Unencrypted frame on encrypted connection")
+                if header & COMPRESSED_FLAG:
+                    payload = self._decompress(payload)
+                yield payload
+        finally:
+            if pos:
+                del buffer[:pos]
+    
+    @property
+    def buffered(self) -> int:
+        """Bytes held waiting for the rest of a frame."""
+        return len(self._buffer)
+    
+    def _decrypt(self, payload: bytes) -> bytes:
+        """Decrypt and authenticate an encrypted frame payload."""
+        if self.cipher is None:
+            raise FrameError("Encrypted frame on unencrypted connection")
+        try:
+            return self.cipher.decrypt(payload)
+        except ValueError as e:
+            raise FrameError(str(e)) from e
+    
+    def _decompress(self, payload: bytes) -> bytes:
+        """Decompress a compressed frame payload."""
+        if self.decompressor is None:
+            raise FrameError("Compressed frame on uncompressed connection")
+        try:
+            return self.decompressor.decompress(payload)
+        except ValueError as e:
+            raise FrameError(str(e)) from e
+
+
+def encode_frame(payload: Buffer) -> bytes:
+    """Encode a single frame."""
+    return FRAME_HEADER.pack(len(payload)) + bytes(payload)
+
+
+class FramedConnection(asyncio.Protocol):
+    """
+    A framed connection to a peer.
+    
+    Received frames are passed to on_frame as they complete. Sends are
+    non-blocking writes into the transport buffer; await drain() to respect
+    flow control when the peer reads slower than we write.
+    
+    Setting compressor compresses outgoing frames it accepts; setting
+    decompressor allows the peer to send compressed frames. Setting cipher
+    encrypts every later frame in both directions and stops compression:
+    a shared compression stream under encryption leaks secrets through
+    frame lengths (CRIME), so encrypted frames are never compressed.
+    Setting meter
+    counts wire bytes into its bytes_in and bytes_out and sent messages
+    into its messages_out.
+    """
+    
+    def __init__(
+        self,
+        on_frame: Callable[['FramedConnection', bytes], None],
+        on_close: Optional[Callable[['FramedConnection'], None]] = None,
+        on_open: Optional[Callable[['FramedConnection'], None]] = None,
+        max_frame_size: int = MAX_FRAME_SIZE
+    ):
+        """
+        Initialize connection protocol.
+        
+        Args:
+            on_frame: Called with each received frame payload
+            on_close: Called once when the connection is lost
+            on_open: Called once when the connection is established
+            max_frame_size: Largest accepted payload, in bytes
+        """
+        self.on_frame = on_frame
+        self.on_close = on_close
+        self.on_open = on_open
+        self.peer_id: Optional[str] = None
+        self.peer_key: Optional[str] = None
+        self.peername: Optional[Tuple[str, int]] = None
+        self.transport: Optional[asyncio.Transport] = None
+        self.max_frame_size = max_frame_size
+        self.compressor: Optional[Any] = None
+        self.meter: Optional[Any] = None
+        self._decoder = FrameDecoder(max_frame_size)
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+        self._closed = False
+    
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Record the transport once connected."""
+        self.transport = transport
+        self.peername = transport.get_extra_info("peername")
+        if self.on_open:
+            self.on_open(self)
+    
+    def data_received(self, data: bytes) -> None:
+        """Decode frames from received bytes."""
+        if self.meter:
+            self.meter.bytes_in += len(data)
+        frames = self._decoder.frames(data)
+        while True:
+            try:
+                frame = next(frames, None)
+            except FrameError as e:
+                logger.warning(f"Dropping connection to {self.peername}: {e}")
+                self.close()
+                return
+            if frame is None:
+                return
+            self.on_frame(self, frame)
+    
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        """Release writers and notify the owner."""
+        self._closed = True
+        self._can_write.set()
+        if self.on_close:
+            self.on_close(self)
+    
+    def pause_writing(self) -> None:
+        """Transport buffer is above its high-water mark."""
+        self._can_write.clear()
+    
+    def resume_writing(self) -> None:
+        """Transport buffer has drained below its low-water mark."""
+        self._can_write.set()
+    
+    @property
+    def decompressor(self) -> Optional[Any]:
+        """Decompressor for received compressed frames."""
+        return self._decoder.decompressor
+    
+    @decompressor.setter
+    def decompressor(self, decompressor: Optional[Any]) -> None:
+        self._decoder.decompressor = decompressor
+    
+    @property
+    def cipher(self) -> Optional[Any]:
+        """Cipher encrypting frames in both directions, once a session is set up."""
+        return self._decoder.cipher
+    
+    @cipher.setter
+    def cipher(self, cipher: Optional[Any]) -> None:
+        self._decoder.cipher = cipher
+    
+    @property
+    def is_closed(self) -> bool:
+        """Whether the connection is closed or closing."""
+        return self._closed or self.transport is None or self.transport.is_closing()
+    
+    def send_frame(self, payload: Buffer) -> None:
+        """
+        Queue a frame for sending.
+        
+        The payload is handed to the transport without being copied into
+        a joined buffer.
+        
+        Args:
+            payload: Frame payload
+            
+        Raises:
+            ConnectionError: If the connection is closed
+        """
+        self.send_parts([payload])
+    
+    def send_parts(self, parts: Sequence[Buffer], messages: int = 1) -> None:
+        """
+        Queue one frame whose payload is the concatenation of parts.
+        
+        Parts are written by reference, so large buffers such as
+        memoryviews of stored objects are never copied into the frame,
+        unless the compressor accepts the frame or the connection is
+        encrypted. Encrypted frames are never compressed.
+        
+        Args:
+            parts: Payload buffers, in order
+            messages: Messages the frame carries, for the meter
+            
+        Raises:
+            ConnectionError: If the connection is closed
+        """
+        if self.is_closed:
+            raise ConnectionError("Connection closed")
+        
+        flags = 0
+        if self.compressor and not self.cipher:
+            compressed = self.compressor.compress(parts)
+            if compressed is not None:
+                parts = [compressed]
+                flags = COMPRESSED_FLAG
+        if self.cipher:
+            parts = [self.cipher.encrypt(b"".join(parts))]
+            flags |= ENCRYPTED_FLAG
+        
+        length = sum(len(part) for part in parts)
+        self.transport.writelines([FRAME_HEADER.pack(length | flags), *parts])
+        self._metered(FRAME_HEADER.size + length, messages)
+    
+    def _metered(self, size: int, messages: int) -> None:
+        """Count a sent frame."""
+        if self.meter:
+            self.meter.bytes_out += size
+            self.meter.messages_out += messages
+    
+    async def drain(self) -> None:
+        """
+        Wait until the transport buffer accepts more data.
+        
+        Raises:
+            ConnectionError: If the connection closed while waiting
+        """
+        await self._can_write.wait()
+        if self._closed:
+            raise ConnectionError("Connection closed")
+    
+    def close(self) -> None:
+        """Close the connection."""
+        if self.transport and not self.transport.is_closing():
+            self.transport.close()
+
+
+ProtocolFactory = Callable[[], FramedConnection]
+
+
+class TcpTransport:
+    """
+    asyncio TCP transport for framed connections.
+    
+    A single event loop serves the listener and every connection, so one
+    thread handles thousands of peers.
+    """
+    
+    def __init__(self):
+        """Initialize transport."""
+        self._server: Optional[asyncio.AbstractServer] = None
+    
+    async def listen(self, host: str, port: int, factory: ProtocolFactory) -> int:
+        """
+        Start accepting connections.
+        
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 for any free port)
+            factory: Creates the protocol for each inbound connection
+            
+        Returns:
+            Bound port
+        """
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(factory, host, port)
+        bound = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Listening on {host}:{bound}")
+        return bound
+    
+    async def connect(
+        self,
+        host: str,
+        port: int,
+        factory: ProtocolFactory,
+        timeout: float = 10.0
+    ) -> FramedConnection:
+        """
+        Open an outbound connection.
+        
+        Args:
+            host: Peer host
+            port: Peer port
+            factory: Creates the protocol for the connection
+            timeout: Seconds to wait for the connection
+            
+        Returns:
+            Connected protocol
+        """
+        loop = asyncio.get_running_loop()
+        _, protocol = await asyncio.wait_for(
+            loop.create_connection(factory, host, port),
+            timeout
+        )
+        return protocol
+    
+    async def close(self) -> None:
+        """Stop accepting connections."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
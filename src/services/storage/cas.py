@@ -12,10 +12,61 @@ Implements content-addressed storage with integrity verification.
 
 import logging
 import hashlib
-from typing import Optional, Dict
+import json
+import mmap
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Iterable, List, Tuple
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Below this many bytes in a batch, hashing inline beats thread hand-off
+PARALLEL_HASH_MIN_BYTES = 1024 * 1024
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+def _hash(data: bytes) -> str:
+    """Compute the content address for data."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class IntegrityError(Exception):
+    """Stored data does not match its content address"""
+
+
+@dataclass
+class ChunkManifest:
+    """Layout of a chunked object"""
+    size: int
+    chunk_size: int
+    chunks: List[str]
+    
+    def to_bytes(self) -> bytes:
+        """Canonical encoding; its hash is the object's address"""
+        return json.dumps(
+            {"size": self.size, "chunk_size": self.chunk_size, "chunks": self.chunks},
+            sort_keys=True,
+            separators=(",", ":")
+        ).encode()
+    
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> 'ChunkManifest':
+        """Decode a manifest"""
+        return cls(**json.loads(raw))
+
+
+@dataclass
+class ObjectStat:
+    """Metadata for a stored object"""
+    address: str
+    size: int
+    codec: str  # "raw" or "chunked"
+    refcount: int
+
 
 class ContentAddressedStorage:
     """
@@ -25,11 +76,38 @@ class ContentAddressedStorage:
     - Immutability
     - Deduplication
     - Integrity verification
+    
+    Objects are held in memory unless a root directory is given, in which
+    case each object is written to its own file under ``root/objects``.
+    
+    Large objects can be stored chunked: each chunk is stored as its own
+    object and the object is addressed by the hash of its chunk manifest,
+    so any chunk can be verified on its own.
+    
+    Object metadata is kept in an in-memory index, so existence and size
+    checks never touch object data. Storing content that already exists
+    only bumps its reference count.
     """
     
-    def __init__(self):
-        """Initialize CAS."""
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize CAS.
+        
+        Args:
+            root: Directory for disk-resident objects (None for in-memory)
+        """
+        self.root = root
         self.store: Dict[str, bytes] = {}
+        self.manifests: Dict[str, ChunkManifest] = {}
+        self._index: Dict[str, ObjectStat] = {}
+        self.quarantined: Dict[str, bytes] = {}
+        self._lock = threading.RLock()
+        
+        if self.root:
+            os.makedirs(os.path.join(self.root, "objects"), exist_ok=True)
+            os.makedirs(os.path.join(self.root, "manifests"), exist_ok=True)
+            self._load_index()
+        
         logger.info("Content-Addressed Storage initialized")
     
     def put(self, data: bytes) -> str:
@@ -42,22 +120,355 @@ class ContentAddressedStorage:
         Returns:
             Content address (hash)
         """
-        address = hashlib.sha256(data).hexdigest()
-        self.store[address] = data
-        logger.info(f"Stored content at {address[:16]}...")
+        address = _hash(data)
+        with self._lock:
+            written = self._store_object(address, data)
+        
+        if written:
+            logger.info(f"Stored content at {address[:16]}...")
+        else:
+            logger.debug(f"Content already stored at {address[:16]}...")
+        return address
+    
+    def put_many(
+        self,
+        items: Iterable[bytes],
+        max_workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Store many objects, hashing them in parallel.
+        
+        hashlib releases the GIL while digesting large buffers, so bulk
+        ingest scales across cores. Objects are written in a single batch.
+        
+        Args:
+            items: Data objects to store
+            max_workers: Hashing threads (defaults to CPU count)
+            
+        Returns:
+            Content addresses, in input order
+        """
+        blobs = list(items)
+        addresses = self._hash_many(blobs, max_workers)
+        
+        with self._lock:
+            written = sum(
+                self._store_object(address, data)
+                for address, data in zip(addresses, blobs)
+            )
+        
+        logger.info(
+            f"Stored batch of {len(blobs)} objects "
+            f"({written} new)"
+        )
+        return addresses
+    
+    def put_chunked(
+        self,
+        data: bytes,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: Optional[int] = None
+    ) -> str:
+        """
+        Store data as fixed-size chunks and return its address.
+        
+        Args:
+            data: Data to store
+            chunk_size: Bytes per chunk (the last chunk may be shorter)
+            max_workers: Hashing threads (defaults to CPU count)
+            
+        Returns:
+            Content address (hash of the chunk manifest)
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        
+        view = memoryview(data)
+        chunks = [view[i:i + chunk_size] for i in range(0, len(view), chunk_size)]
+        chunk_addresses = self._hash_many(chunks, max_workers)
+        
+        manifest = ChunkManifest(
+            size=len(view),
+            chunk_size=chunk_size,
+            chunks=chunk_addresses
+        )
+        encoded = manifest.to_bytes()
+        address = _hash(encoded)
+        
+        with self._lock:
+            existing = self._index.get(address)
+            if existing:
+                existing.refcount += 1
+                logger.debug(f"Content already stored at {address[:16]}...")
+                return address
+            
+            for chunk_address, chunk in zip(chunk_addresses, chunks):
+                self._store_object(chunk_address, chunk)
+            self._store_manifest(address, manifest, encoded)
+        
+        logger.info(
+            f"Stored chunked content at {address[:16]}... "
+            f"({len(chunks)} chunks)"
+        )
+        return address
+    
+    def put_manifest(self, manifest: ChunkManifest) -> str:
+        """
+        Store the manifest of a chunked object whose chunks are stored.
+        
+        Used to assemble an object whose chunks arrived separately, for
+        example from peers.
+        
+        Args:
+            manifest: Chunk manifest
+            
+        Returns:
+            Content address of the object
+            
+        Raises:
+            ValueError: If any chunk is not stored
+        """
+        encoded = manifest.to_bytes()
+        address = _hash(encoded)
+        
+        with self._lock:
+            missing = [c for c in manifest.chunks if c not in self._index]
+            if missing:
+                raise ValueError(f"{len(missing)} chunks of {address[:16]}... not stored")
+            
+            existing = self._index.get(address)
+            if existing:
+                existing.refcount += 1
+                return address
+            self._store_manifest(address, manifest, encoded)
         return address
     
+    def get_manifest(self, address: str) -> Optional[ChunkManifest]:
+        """
+        Get the manifest of a chunked object.
+        
+        Args:
+            address: Content address
+            
+        Returns:
+            Manifest if the object is stored and chunked, None otherwise
+        """
+        return self._load_manifest(address)
+    
     def get(self, address: str) -> Optional[bytes]:
         """
         Retrieve data by address.
         
+        Chunked objects are reassembled, verifying each chunk.
+        
         Args:
             address: Content address
             
         Returns:
             Data if found, None otherwise
+            
+        Raises:
+            IntegrityError: If a chunk is missing or corrupted
+        """
+        manifest = self._load_manifest(address)
+        if manifest:
+            return self.read_range(address, 0, manifest.size)
+        
+        if address not in self._index:
+            return None
+        
+        if not self.root:
+            return self.store.get(address)
+        
+        try:
+            with open(self._object_path(address), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+    
+    def get_view(self, address: str) -> Optional[memoryview]:
+        """
+        Retrieve a read-only view of an object without copying it.
+        
+        Disk-resident objects are memory-mapped, so pages are loaded on
+        demand and shared with the OS page cache. In-memory objects are
+        exposed directly from the stored buffer. Chunked objects have no
+        contiguous backing buffer and are reassembled into one.
+        
+        Args:
+            address: Content address
+            
+        Returns:
+            Read-only memoryview if found, None otherwise
+        """
+        if self._load_manifest(address):
+            return memoryview(self.get(address)).toreadonly()
+        
+        if address not in self._index:
+            return None
+        
+        if not self.root:
+            data = self.store.get(address)
+            if data is None:
+                return None
+            return memoryview(data).toreadonly()
+        
+        try:
+            with open(self._object_path(address), "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    # Zero-length files cannot be mapped
+                    return memoryview(b"")
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        
+        # The view keeps the mapping alive after the file is closed
+        return memoryview(mapped)
+    
+    def read_range(
+        self,
+        address: str,
+        offset: int,
+        length: int
+    ) -> Optional[bytes]:
+        """
+        Read a byte range of an object.
+        
+        For chunked objects only the chunks overlapping the range are read,
+        and each is verified against its own address. Unchunked objects are
+        verified whole before slicing.
+        
+        Args:
+            address: Content address
+            offset: First byte to read
+            length: Maximum number of bytes to read
+            
+        Returns:
+            Bytes in the range (short at end of object), None if not found
+            
+        Raises:
+            ValueError: If offset or length is negative
+            IntegrityError: If data read does not match its address
         """
-        return self.store.get(address)
+        if offset < 0 or length < 0:
+            raise ValueError("offset and length must be non-negative")
+        
+        manifest = self._load_manifest(address)
+        if manifest is None:
+            view = self.get_view(address)
+            if view is None:
+                return None
+            if _hash(view) != address:
+                raise IntegrityError(f"Object {address[:16]}... is corrupted")
+            return view[offset:offset + length].tobytes()
+        
+        end = min(offset + length, manifest.size)
+        if offset >= end:
+            return b""
+        
+        cs = manifest.chunk_size
+        parts = []
+        for index in range(offset // cs, (end - 1) // cs + 1):
+            chunk = self._read_chunk(manifest.chunks[index])
+            start = index * cs
+            parts.append(chunk[max(offset - start, 0):end - start])
+        
+        return b"".join(parts)
+    
+    def has(self, address: str) -> bool:
+        """
+        Check whether an object is stored, without reading it.
+        
+        Args:
+            address: Content address
+            
+        Returns:
+            True if stored
+        """
+        return address in self._index
+    
+    def has_many(self, addresses: Iterable[str]) -> List[bool]:
+        """
+        Check whether each of many objects is stored.
+        
+        Args:
+            addresses: Content addresses
+            
+        Returns:
+            Existence flags, in input order
+        """
+        index = self._index
+        return [address in index for address in addresses]
+    
+    def stat(self, address: str) -> Optional[ObjectStat]:
+        """
+        Get object metadata, without reading the object.
+        
+        Args:
+            address: Content address
+            
+        Returns:
+            Copy of the object's metadata if stored, None otherwise
+        """
+        entry = self._index.get(address)
+        if entry is None:
+            return None
+        return ObjectStat(
+            address=entry.address,
+            size=entry.size,
+            codec=entry.codec,
+            refcount=entry.refcount
+        )
+    
+    def list_objects(self, codec: Optional[str] = None) -> List[str]:
+        """
+        List stored addresses, in sorted order.
+        
+        Args:
+            codec: Only list objects with this codec ("raw" or "chunked")
+            
+        Returns:
+            Snapshot of matching addresses
+        """
+        with self._lock:
+            entries = list(self._index.values())
+        return sorted(
+            entry.address for entry in entries
+            if codec is None or entry.codec == codec
+        )
+    
+    def quarantine(self, address: str) -> bool:
+        """
+        Move a corrupted object out of the store.
+        
+        The object disappears from the index, so it is no longer served and
+        a later put of the correct content stores it afresh. Disk-resident
+        objects are moved to ``root/quarantine`` for inspection.
+        
+        Args:
+            address: Address of a plain object
+            
+        Returns:
+            True if quarantined, False if no such plain object is stored
+        """
+        with self._lock:
+            entry = self._index.get(address)
+            if entry is None or entry.codec != "raw":
+                return False
+            
+            del self._index[address]
+            if not self.root:
+                self.quarantined[address] = self.store.pop(address)
+            else:
+                directory = os.path.join(self.root, "quarantine")
+                os.makedirs(directory, exist_ok=True)
+                os.replace(
+                    self._object_path(address),
+                    os.path.join(directory, address)
+                )
+        
+        logger.warning(f"Quarantined corrupted object {address[:16]}...")
+        return True
     
     def verify(self, address: str, data: bytes) -> bool:
         """
@@ -70,8 +481,245 @@ class ContentAddressedStorage:
         Returns:
             True if data matches address
         """
-        actual_address = hashlib.sha256(data).hexdigest()
+        manifest = self._load_manifest(address)
+        if manifest:
+            view = memoryview(data)
+            cs = manifest.chunk_size
+            rebuilt = ChunkManifest(
+                size=len(view),
+                chunk_size=cs,
+                chunks=[_hash(view[i:i + cs]) for i in range(0, len(view), cs)]
+            )
+            return _hash(rebuilt.to_bytes()) == address
+        
+        actual_address = _hash(data)
         return actual_address == address
+    
+    def verify_many(
+        self,
+        pairs: Iterable[Tuple[str, bytes]],
+        max_workers: Optional[int] = None
+    ) -> List[bool]:
+        """
+        Verify many (address, data) pairs, hashing in parallel.
+        
+        Args:
+            pairs: Claimed addresses and the data to check against them
+            max_workers: Hashing threads (defaults to CPU count)
+            
+        Returns:
+            Verification results, in input order
+        """
+        pairs = list(pairs)
+        chunked = [self._load_manifest(address) is not None for address, _ in pairs]
+        flat = [data for (_, data), is_chunked in zip(pairs, chunked) if not is_chunked]
+        actual = iter(self._hash_many(flat, max_workers))
+        
+        return [
+            self.verify(address, data) if is_chunked else address == next(actual)
+            for (address, data), is_chunked in zip(pairs, chunked)
+        ]
+    
+    def _object_path(self, address: str) -> str:
+        """Path of a disk-resident object."""
+        return os.path.join(self.root, "objects", address[:2], address)
+    
+    def _manifest_path(self, address: str) -> str:
+        """Path of a disk-resident chunk manifest."""
+        return os.path.join(self.root, "manifests", address[:2], address)
+    
+    def _load_manifest(self, address: str) -> Optional[ChunkManifest]:
+        """
+        Look up the manifest of a chunked object.
+        
+        Args:
+            address: Content address
+            
+        Returns:
+            Manifest if the object is chunked, None otherwise
+        """
+        return self.manifests.get(address)
+    
+    def _store_manifest(self, address: str, manifest: ChunkManifest, encoded: bytes) -> None:
+        """Persist a manifest and index its object. Caller holds the lock."""
+        if self.root:
+            self._write_file(self._manifest_path(address), encoded)
+        self.manifests[address] = manifest
+        self._index[address] = ObjectStat(
+            address=address,
+            size=manifest.size,
+            codec="chunked",
+            refcount=1
+        )
+    
+    def _load_index(self) -> None:
+        """
+        Rebuild the object index from the root directory.
+        
+        Object sizes come from directory metadata; only manifests are
+        read, and each is verified against its address. Reference counts
+        are not persisted, so every object starts at one plus its
+        references from manifests beyond the first.
+        """
+        for path, address in self._scan("objects"):
+            self._index[address] = ObjectStat(
+                address=address,
+                size=os.stat(path).st_size,
+                codec="raw",
+                refcount=1
+            )
+        
+        referenced: Dict[str, int] = {}
+        for path, address in self._scan("manifests"):
+            with open(path, "rb") as f:
+                encoded = f.read()
+            if _hash(encoded) != address:
+                logger.error(f"Skipping corrupted manifest {address[:16]}...")
+                continue
+            
+            manifest = ChunkManifest.from_bytes(encoded)
+            self.manifests[address] = manifest
+            self._index[address] = ObjectStat(
+                address=address,
+                size=manifest.size,
+                codec="chunked",
+                refcount=1
+            )
+            for chunk_address in set(manifest.chunks):
+                referenced[chunk_address] = referenced.get(chunk_address, 0) + 1
+        
+        for chunk_address, count in referenced.items():
+            entry = self._index.get(chunk_address)
+            if entry:
+                entry.refcount = max(entry.refcount, count)
+        
+        logger.info(f"Loaded index of {len(self._index)} objects")
+    
+    def _scan(self, kind: str) -> Iterable[Tuple[str, str]]:
+        """
+        List stored files of one kind.
+        
+        Args:
+            kind: "objects" or "manifests"
+            
+        Yields:
+            (path, address) pairs, skipping in-progress temporary files
+        """
+        base = os.path.join(self.root, kind)
+        for shard in os.scandir(base):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.name.startswith(".tmp-"):
+                    yield entry.path, entry.name
+    
+    def _read_chunk(self, address: str) -> memoryview:
+        """
+        Read and verify a single chunk.
+        
+        Args:
+            address: Chunk address
+            
+        Returns:
+            Read-only view of the chunk
+            
+        Raises:
+            IntegrityError: If the chunk is missing or corrupted
+        """
+        view = self.get_view(address)
+        if view is None:
+            raise IntegrityError(f"Chunk {address[:16]}... is missing")
+        if _hash(view) != address:
+            raise IntegrityError(f"Chunk {address[:16]}... is corrupted")
+        return view
+    
+    def _store_object(self, address: str, data: bytes) -> bool:
+        """
+        Store a plain object unless it already exists.
+        
+        Must be called with the lock held.
+        
+        Args:
+            address: Content address
+            data: Data to store
+            
+        Returns:
+            True if the object was written, False if it already existed
+        """
+        existing = self._index.get(address)
+        if existing:
+            existing.refcount += 1
+            return False
+        
+        self._write(address, data)
+        self._index[address] = ObjectStat(
+            address=address,
+            size=len(data),
+            codec="raw",
+            refcount=1
+        )
+        return True
+    
+    def _write(self, address: str, data: bytes) -> None:
+        """
+        Write an object to the backing store.
+        
+        Args:
+            address: Content address
+            data: Data to store
+        """
+        if not self.root:
+            self.store[address] = bytes(data)
+            return
+        
+        self._write_file(self._object_path(address), data)
+    
+    def _write_file(self, path: str, data: bytes) -> None:
+        """
+        Write a file atomically.
+        
+        Writes go through a temporary file and an atomic rename, so a
+        crash never leaves a partially written object at its address.
+        
+        Args:
+            path: Destination path
+            data: File contents
+        """
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def _hash_many(
+        self,
+        blobs: List[bytes],
+        max_workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Hash a batch of objects, on a thread pool when worthwhile.
+        
+        Args:
+            blobs: Data objects to hash
+            max_workers: Hashing threads (defaults to CPU count)
+            
+        Returns:
+            Content addresses, in input order
+        """
+        workers = max_workers or os.cpu_count() or 1
+        total = sum(len(data) for data in blobs)
+        
+        if workers <= 1 or len(blobs) < 2 or total < PARALLEL_HASH_MIN_BYTES:
+            return [_hash(data) for data in blobs]
+        
+        with ThreadPoolExecutor(max_workers=min(workers, len(blobs))) as pool:
+            return list(pool.map(_hash, blobs))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,237 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Integrity Scrubber
+
+Re-hashes stored objects in the background to catch silent corruption.
+"""
+
+import logging
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .cas import ContentAddressedStorage
+
+logger = logging.getLogger(__name__)
+
+# Objects are hashed in blocks so throttling stays smooth for large objects
+SCRUB_BLOCK_SIZE = 1024 * 1024
+
+
+class IntegrityScrubber:
+    """
+    Background integrity scrubber for content-addressed storage.
+    
+    Walks every plain object in address order, re-hashing it at a bounded
+    rate. Corrupted objects are quarantined. The position in the walk is
+    checkpointed so a restarted node resumes where it left off.
+    
+    The scrubber never holds the storage lock while reading or hashing,
+    and sleeps between blocks to stay within its budget, so foreground
+    get/put traffic is not starved.
+    """
+    
+    def __init__(
+        self,
+        cas: ContentAddressedStorage,
+        rate_mb_per_s: float = 8.0,
+        cursor_path: Optional[str] = None,
+        pass_interval: float = 3600.0,
+        checkpoint_every: int = 100
+    ):
+        """
+        Initialize the scrubber.
+        
+        Args:
+            cas: Storage to scrub
+            rate_mb_per_s: Hashing budget in MB/s
+            cursor_path: Checkpoint file (defaults to scrub.cursor under the
+                storage root; None with in-memory storage disables resume)
+            pass_interval: Seconds to idle between full passes
+            checkpoint_every: Objects between cursor checkpoints
+        """
+        if rate_mb_per_s <= 0:
+            raise ValueError("rate_mb_per_s must be positive")
+        
+        self.cas = cas
+        self.rate = rate_mb_per_s * 1024 * 1024
+        self.pass_interval = pass_interval
+        self.checkpoint_every = checkpoint_every
+        
+        if cursor_path is None and cas.root:
+            cursor_path = os.path.join(cas.root, "scrub.cursor")
+        self.cursor_path = cursor_path
+        self.cursor = self._load_cursor()
+        
+        self.objects_checked = 0
+        self.bytes_checked = 0
+        self.corrupted = 0
+        self.passes_completed = 0
+        self.last_pass_completed: Optional[float] = None
+        
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._window_start = time.monotonic()
+        self._window_bytes = 0
+        
+        logger.info(f"Integrity scrubber initialized ({rate_mb_per_s} MB/s)")
+    
+    def start(self) -> None:
+        """Start scrubbing in a background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="cas-scrubber",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info("Integrity scrubber started")
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background thread, checkpointing the cursor.
+        
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self._save_cursor()
+        logger.info("Integrity scrubber stopped")
+    
+    def scrub_pass(self, max_objects: Optional[int] = None) -> bool:
+        """
+        Scrub objects from the cursor onwards.
+        
+        Args:
+            max_objects: Stop after this many objects (None for no limit)
+        
+        Returns:
+            True if the pass reached the end of the store
+        """
+        self._window_start = time.monotonic()
+        self._window_bytes = 0
+        
+        pending = [a for a in self.cas.list_objects(codec="raw") if a > self.cursor]
+        checked = 0
+        
+        for address in pending:
+            if self._stop.is_set() or (max_objects is not None and checked >= max_objects):
+                self._save_cursor()
+                return False
+            
+            self._scrub_object(address)
+            self.cursor = address
+            checked += 1
+            
+            if checked % self.checkpoint_every == 0:
+                self._save_cursor()
+        
+        self.cursor = ""
+        self.passes_completed += 1
+        self.last_pass_completed = time.time()
+        self._save_cursor()
+        
+        logger.info(
+            f"Scrub pass complete: {self.objects_checked} objects, "
+            f"{self.corrupted} corrupted"
+        )
+        return True
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get scrubber progress metrics.
+        
+        Returns:
+            Status dictionary
+        """
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "cursor": self.cursor,
+            "objects_checked": self.objects_checked,
+            "bytes_checked": self.bytes_checked,
+            "corrupted": self.corrupted,
+            "passes_completed": self.passes_completed,
+            "last_pass_completed": self.last_pass_completed,
+            "rate_mb_per_s": self.rate / (1024 * 1024)
+        }
+    
+    def _run(self) -> None:
+        """Background loop: scrub, then idle until the next pass."""
+        while not self._stop.is_set():
+            try:
+                if self.scrub_pass():
+                    self._stop.wait(self.pass_interval)
+            except Exception as e:
+                logger.error(f"Scrub pass failed: {e}")
+                self._stop.wait(self.pass_interval)
+    
+    def _scrub_object(self, address: str) -> None:
+        """
+        Re-hash one object and quarantine it on mismatch.
+        
+        Args:
+            address: Object address
+        """
+        view = self.cas.get_view(address)
+        if view is None:
+            # Removed since the pass started
+            return
+        
+        digest = hashlib.sha256()
+        for start in range(0, len(view), SCRUB_BLOCK_SIZE):
+            block = view[start:start + SCRUB_BLOCK_SIZE]
+            digest.update(block)
+            self._throttle(len(block))
+        
+        self.objects_checked += 1
+        self.bytes_checked += len(view)
+        
+        if digest.hexdigest() != address:
+            logger.error(f"Integrity failure: {address[:16]}...")
+            self.corrupted += 1
+            self.cas.quarantine(address)
+    
+    def _throttle(self, nbytes: int) -> None:
+        """
+        Sleep as needed to keep within the hashing budget.
+        
+        Args:
+            nbytes: Bytes just hashed
+        """
+        self._window_bytes += nbytes
+        elapsed = time.monotonic() - self._window_start
+        delay = self._window_bytes / self.rate - elapsed
+        if delay > 0:
+            self._stop.wait(delay)
+    
+    def _load_cursor(self) -> str:
+        """Read the checkpointed cursor, if any."""
+        if not self.cursor_path:
+            return ""
+        try:
+            with open(self.cursor_path) as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            return ""
+    
+    def _save_cursor(self) -> None:
+        """Checkpoint the cursor atomically."""
+        if not self.cursor_path:
+            return
+        tmp_path = f"{self.cursor_path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.cursor)
+        os.replace(tmp_path, self.cursor_path)
@@ -24,6 +24,9 @@ from typing import Any, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from ..services.ledger.ledger import DEFAULT_INLINE_THRESHOLD, offload_payload
+from ..services.storage.cas import ContentAddressedStorage
+
 # Initialize logging with audit trail
 logging.basicConfig(
     level=logging.INFO,
@@ -50,6 +53,7 @@ class RuntimeConfig:
     max_iterations: int = 1000
     audit_logging: bool = True
     fail_safe_mode: bool = True
+    audit_payload_threshold: int = DEFAULT_INLINE_THRESHOLD  # Bytes kept inline with a store
 
 
 class SovereignRuntime:
@@ -63,14 +67,22 @@ class SovereignRuntime:
     - Using only vetted models
     """
     
-    def __init__(self, config: Optional[RuntimeConfig] = None):
+    def __init__(
+        self,
+        config: Optional[RuntimeConfig] = None,
+        payload_store: Optional[ContentAddressedStorage] = None
+    ):
         """
         Initialize the sovereign runtime.
         
         Args:
             config: Runtime configuration (uses defaults if None)
+            payload_store: Content-addressed storage for large audit
+                payloads (None keeps all audit data inline); payloads are
+                recorded as by ImmutableLedger
         """
         self.config = config or RuntimeConfig()
+        self.payload_store = payload_store
         self.state = RuntimeState.INITIALIZING
         self.iteration_count = 0
         self.audit_log = []
@@ -206,6 +218,11 @@ class SovereignRuntime:
         if not self.config.audit_logging:
             return
         
+        if self.payload_store is not None:
+            data = offload_payload(
+                data, self.payload_store, self.config.audit_payload_threshold
+            )
+        
         log_entry = {
             "timestamp": time.time(),
             "event": event,
@@ -0,0 +1,264 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Role-Based Access Control
+
+Test coverage:
+- Default roles and permission checks
+- Unknown users, roles and permissions
+- Users holding many roles
+- Redefining a role after it is assigned
+- Granting and revoking role permissions
+- Effective-permission cache hits and precise invalidation
+- Role inheritance, cycle detection and deep hierarchies
+- Resource-scoped wildcard permissions
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import random
+import unittest
+from services.access.rbac import RBAC, Role
+
+
+class TestRBAC(unittest.TestCase):
+    """Test cases for RBAC."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.rbac = RBAC()
+    
+    def test_default_roles(self):
+        """Test checks against the built-in roles."""
+        self.assertTrue(self.rbac.assign_role("alice", "admin"))
+        self.assertTrue(self.rbac.assign_role("bob", "viewer"))
+        
+        self.assertTrue(self.rbac.has_permission("alice", "manage_roles"))
+        self.assertTrue(self.rbac.has_permission("bob", "read"))
+        self.assertFalse(self.rbac.has_permission("bob", "write"))
+        self.assertEqual(self.rbac.get_user_permissions("bob"), {"read"})
+    
+    def test_unknown_names(self):
+        """Test unknown users, roles and permissions are denied."""
+        self.assertFalse(self.rbac.assign_role("alice", "superuser"))
+        self.rbac.assign_role("alice", "admin")
+        
+        self.assertFalse(self.rbac.has_permission("carol", "read"))
+        self.assertFalse(self.rbac.has_permission("alice", "launch"))
+        self.assertEqual(self.rbac.get_user_permissions("carol"), set())
+    
+    def test_many_roles(self):
+        """Test a user's roles combine, past a machine word of permissions."""
+        for i in range(100):
+            self.rbac.add_role(Role(f"team{i}", {f"perm{i}", f"shared{i % 7}"}, ""))
+        for i in range(0, 100, 3):
+            self.rbac.assign_role("alice", f"team{i}")
+        
+        for i in range(100):
+            self.assertEqual(self.rbac.has_permission("alice", f"perm{i}"), i % 3 == 0)
+        self.assertTrue(self.rbac.has_permission("alice", "shared6"))
+        self.assertFalse(self.rbac.has_permission("alice", "read"))
+        self.assertEqual(len(self.rbac.get_user_permissions("alice")), 34 + 7)
+    
+    def test_redefine_role(self):
+        """Test re-adding a role updates users who already hold it."""
+        self.rbac.assign_role("alice", "operator")
+        self.rbac.assign_role("alice", "viewer")
+        self.rbac.add_role(Role("operator", {"read", "restart"}, "Reduced operations"))
+        
+        self.assertTrue(self.rbac.has_permission("alice", "restart"))
+        self.assertFalse(self.rbac.has_permission("alice", "write"))
+        self.assertTrue(self.rbac.has_permission("alice", "read"))
+    
+    def test_grant_and_revoke(self):
+        """Test permission changes to a role apply to its holders."""
+        self.rbac.assign_role("alice", "viewer")
+        self.assertTrue(self.rbac.grant_permission("viewer", "export"))
+        self.assertTrue(self.rbac.has_permission("alice", "export"))
+        self.assertTrue(self.rbac.revoke_permission("viewer", "read"))
+        self.assertFalse(self.rbac.has_permission("alice", "read"))
+        self.assertEqual(self.rbac.get_user_permissions("alice"), {"export"})
+        self.assertFalse(self.rbac.grant_permission("auditor", "read"))
+        self.assertFalse(self.rbac.revoke_permission("auditor", "read"))
+
+
+class TestPermissionCache(unittest.TestCase):
+    """Test cases for the RBAC effective-permission cache."""
+    
+    def setUp(self):
+        """Set up users on different roles."""
+        self.rbac = RBAC()
+        self.rbac.assign_role("alice", "operator")
+        self.rbac.assign_role("bob", "viewer")
+    
+    def test_repeat_lookups_hit(self):
+        """Test repeat lookups return the same cached set."""
+        first = self.rbac.get_user_permissions("alice")
+        second = self.rbac.get_user_permissions("alice")
+        
+        self.assertIs(first, second)
+        self.assertEqual(first, {"read", "write", "view_audit_log"})
+        stats = self.rbac.get_cache_stats()
+        self.assertEqual((stats["cache_hits"], stats["cache_misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+    
+    def test_invalidation_is_precise(self):
+        """Test a change only invalidates the users it affects."""
+        alice = self.rbac.get_user_permissions("alice")
+        bob = self.rbac.get_user_permissions("bob")
+        
+        self.rbac.grant_permission("operator", "export")
+        self.assertIs(self.rbac.get_user_permissions("bob"), bob)
+        self.assertIn("export", self.rbac.get_user_permissions("alice"))
+        
+        self.rbac.assign_role("bob", "admin")
+        self.assertIn("manage_users", self.rbac.get_user_permissions("bob"))
+        self.assertIsNot(self.rbac.get_user_permissions("alice"), alice)
+        
+        self.rbac.add_role(Role("auditor", {"view_audit_log"}, ""))
+        self.rbac.assign_role("alice", "operator")
+        stats = self.rbac.get_cache_stats()
+        self.rbac.get_user_permissions("alice")
+        self.rbac.get_user_permissions("bob")
+        self.assertEqual(self.rbac.get_cache_stats()["cache_misses"], stats["cache_misses"])
+    
+    def test_unknown_users_not_cached(self):
+        """Test lookups for users without roles do not fill the cache."""
+        for i in range(100):
+            self.assertEqual(self.rbac.get_user_permissions(f"nobody{i}"), set())
+        self.assertEqual(self.rbac.get_cache_stats()["cached_users"], 0)
+
+
+class TestRoleInheritance(unittest.TestCase):
+    """Test cases for RBAC role inheritance."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.rbac = RBAC()
+    
+    def test_builtin_hierarchy(self):
+        """Test the built-in roles keep their permissions through inheritance."""
+        self.rbac.assign_role("alice", "admin")
+        self.rbac.assign_role("bob", "operator")
+        self.assertEqual(self.rbac.get_user_permissions("alice"), {
+            "read", "write", "delete", "manage_users", "manage_roles", "view_audit_log"
+        })
+        self.assertEqual(self.rbac.get_user_permissions("bob"), {"read", "write", "view_audit_log"})
+        
+        self.rbac.grant_permission("viewer", "export")
+        self.assertTrue(self.rbac.has_permission("alice", "export"))
+        self.assertTrue(self.rbac.has_permission("bob", "export"))
+    
+    def test_diamond_and_redefinition(self):
+        """Test shared ancestors, and removing an inherited role."""
+        self.rbac.add_role(Role("billing", {"invoice"}, ""))
+        self.rbac.add_role(Role("support", {"ticket"}, "", {"viewer"}))
+        self.rbac.add_role(Role("lead", {"approve"}, "", {"billing", "support", "operator"}))
+        self.rbac.assign_role("alice", "lead")
+        for permission in ("approve", "invoice", "ticket", "read", "write"):
+            self.assertTrue(self.rbac.has_permission("alice", permission))
+        
+        self.rbac.add_role(Role("support", {"ticket"}, ""))
+        self.rbac.revoke_permission("viewer", "read")
+        self.rbac.add_role(Role("lead", {"approve"}, "", {"support"}))
+        self.assertEqual(self.rbac.get_user_permissions("alice"), {"approve", "ticket"})
+    
+    def test_invalid_inheritance(self):
+        """Test unknown parents and cycles are refused without changing the policy."""
+        with self.assertRaisesRegex(ValueError, "unknown role"):
+            self.rbac.add_role(Role("ghost", set(), "", {"phantom"}))
+        with self.assertRaisesRegex(ValueError, "viewer -> admin -> operator -> viewer"):
+            self.rbac.add_role(Role("viewer", {"read"}, "", {"admin"}))
+        with self.assertRaisesRegex(ValueError, "cycle"):
+            self.rbac.add_role(Role("solo", set(), "", {"solo"}))
+        
+        self.assertNotIn("ghost", self.rbac.roles)
+        self.assertEqual(self.rbac.roles["viewer"].inherits, set())
+        self.rbac.assign_role("bob", "viewer")
+        self.assertEqual(self.rbac.get_user_permissions("bob"), {"read"})
+    
+    def test_deep_hierarchy(self):
+        """Test a long chain of roles compiles and checks like a flat one."""
+        self.rbac.add_role(Role("level0", {"perm0"}, ""))
+        for i in range(1, 1500):
+            self.rbac.add_role(Role(f"level{i}", {f"perm{i}"}, "", {f"level{i - 1}"}))
+        self.rbac.assign_role("ceo", "level1499")
+        self.rbac.assign_role("intern", "level10")
+        
+        self.assertTrue(self.rbac.has_permission("ceo", "perm0"))
+        self.assertFalse(self.rbac.has_permission("intern", "perm11"))
+        self.assertEqual(len(self.rbac.get_user_permissions("ceo")), 1500)
+        
+        self.rbac.grant_permission("level5", "audit")
+        self.assertTrue(self.rbac.has_permission("ceo", "audit"))
+        self.assertTrue(self.rbac.has_permission("intern", "audit"))
+
+
+class TestScopedPermissions(unittest.TestCase):
+    """Test cases for resource-scoped wildcard permissions."""
+    
+    def setUp(self):
+        """Set up a role scoped to one site."""
+        self.rbac = RBAC()
+        self.rbac.add_role(Role("berlin_reader", {"ledger:read:site/berlin/*"}, ""))
+        self.rbac.add_role(Role("auditor", {"*:audit:site/*/logs"}, "", {"berlin_reader"}))
+        self.rbac.assign_role("alice", "auditor")
+    
+    def test_trailing_wildcard(self):
+        """Test a trailing wildcard covers everything below its prefix."""
+        self.assertTrue(self.rbac.has_permission("alice", "ledger:read:site/berlin/node1"))
+        self.assertTrue(self.rbac.has_permission("alice", "ledger:read:site/berlin/node1/blocks"))
+        self.assertFalse(self.rbac.has_permission("alice", "ledger:read:site/berlin"))
+        self.assertFalse(self.rbac.has_permission("alice", "ledger:read:site/paris/node1"))
+        self.assertFalse(self.rbac.has_permission("alice", "ledger:write:site/berlin/node1"))
+    
+    def test_inner_wildcard(self):
+        """Test an inner wildcard matches exactly one segment."""
+        self.assertTrue(self.rbac.has_permission("alice", "storage:audit:site/paris/logs"))
+        self.assertTrue(self.rbac.has_permission("alice", "ledger:audit:site/berlin/logs"))
+        self.assertFalse(self.rbac.has_permission("alice", "storage:audit:site/paris/east/logs"))
+        self.assertFalse(self.rbac.has_permission("alice", "storage:audit:site/paris/logs/old"))
+        self.assertFalse(self.rbac.has_permission("bob", "storage:audit:site/paris/logs"))
+    
+    def test_flat_and_revoked(self):
+        """Test flat permissions still work and revoked patterns stop matching."""
+        self.rbac.assign_role("alice", "viewer")
+        self.assertTrue(self.rbac.has_permission("alice", "read"))
+        self.assertFalse(self.rbac.has_permission("alice", "write"))
+        
+        self.rbac.revoke_permission("berlin_reader", "ledger:read:site/berlin/*")
+        self.assertFalse(self.rbac.has_permission("alice", "ledger:read:site/berlin/node1"))
+        self.rbac.grant_permission("viewer", "ledger:read:*")
+        self.assertTrue(self.rbac.has_permission("alice", "ledger:read:site/berlin/node1"))
+    
+    def test_many_rules(self):
+        """Test thousands of scoped rules across many roles."""
+        rng = random.Random(5)
+        for team in range(200):
+            rules = {f"ledger:read:site/s{team}/rack{rack}/*" for rack in range(20)}
+            rules.add(f"storage:*:site/s{team}/*")
+            self.rbac.add_role(Role(f"team{team}", rules, ""))
+        for team in rng.sample(range(200), 20):
+            self.rbac.assign_role(f"user{team}", f"team{team}")
+        
+        for user_id in list(self.rbac.user_roles):
+            if not user_id.startswith("user"):
+                continue
+            team = int(user_id[4:])
+            self.assertTrue(self.rbac.has_permission(user_id, f"ledger:read:site/s{team}/rack7/n1"))
+            self.assertTrue(self.rbac.has_permission(user_id, f"storage:put:site/s{team}/x/y"))
+            self.assertFalse(self.rbac.has_permission(user_id, f"ledger:read:site/s{team}/rack20/n1"))
+            other = (team + 1) % 200
+            self.assertFalse(self.rbac.has_permission(user_id, f"ledger:read:site/s{other}/rack7/n1"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,7 +22,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
 import unittest
-from sovereign.ethics_engine import EthicsEngine, ViolationSeverity
+from src.sovereign.ethics_engine import EthicsEngine, ViolationSeverity
 
 
 class TestEthicsEngine(unittest.TestCase):
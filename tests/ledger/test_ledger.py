@@ -13,6 +13,10 @@ Test coverage:
 - Hash chain integrity
 - Chain validation
 - Tamper detection
+- Payloads stored by reference
+- Offloaded payloads keep their types
+- User data shaped like a reference
+- Extending with replicated entries
 """
 
 import sys
@@ -22,7 +26,9 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
 import unittest
-from services.ledger.ledger import ImmutableLedger, LedgerEntry
+from services.ledger.ledger import PAYLOAD_REF, PAYLOAD_SIZE, ImmutableLedger, LedgerEntry
+from services.networking.codec import CodecError
+from services.storage.cas import ContentAddressedStorage, IntegrityError
 
 
 class TestImmutableLedger(unittest.TestCase):
@@ -130,6 +136,125 @@ class TestImmutableLedger(unittest.TestCase):
         self.assertEqual(len(hashes), len(unique_hashes))
 
 
+class TestPayloadReferences(unittest.TestCase):
+    """Test cases for payloads offloaded to content-addressed storage."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.store = ContentAddressedStorage()
+        self.ledger = ImmutableLedger(payload_store=self.store, inline_threshold=256)
+        self.payload = {"weights": "x" * 10000, "model": "aurora"}
+    
+    def test_small_payload_inline(self):
+        """Test payloads under the threshold stay inline."""
+        entry = self.ledger.append("op", {"value": 42})
+        
+        self.assertEqual(entry.data, {"value": 42})
+        self.assertEqual(len(self.store.store), 0)
+    
+    def test_large_payload_by_reference(self):
+        """Test large payloads are replaced by address and size."""
+        entry = self.ledger.append("op", self.payload)
+        
+        self.assertEqual(set(entry.data), {PAYLOAD_REF, PAYLOAD_SIZE})
+        self.assertTrue(self.store.has(entry.data[PAYLOAD_REF]))
+        self.assertEqual(self.ledger.resolve_data(entry), self.payload)
+        self.assertTrue(self.ledger.verify_integrity())
+    
+    def test_offloaded_payload_keeps_types(self):
+        """Test offloaded payloads resolve equal to inline ones."""
+        inline = ImmutableLedger()
+        data = {
+            "weights": "x" * 10000,
+            "range": (0.5, 2.0),
+            "points": [(1, 2)],
+            "digest": bytes(32),
+            "big": 2 ** 100
+        }
+        
+        offloaded = self.ledger.append("op", data)
+        kept = inline.append("op", data)
+        
+        self.assertIn(PAYLOAD_REF, offloaded.data)
+        self.assertNotIn(PAYLOAD_REF, kept.data)
+        self.assertEqual(self.ledger.resolve_data(offloaded), inline.resolve_data(kept))
+        self.assertEqual(self.ledger.resolve_data(offloaded), data)
+    
+    def test_unencodable_payload_rejected(self):
+        """Test a large payload the codec cannot encode is refused."""
+        with self.assertRaises(CodecError):
+            self.ledger.append("op", {"weights": "x" * 10000, "when": object()})
+        self.assertEqual(len(self.ledger.entries), 1)
+    
+    def test_identical_payloads_deduplicated(self):
+        """Test repeated payloads are stored once."""
+        first = self.ledger.append("op", self.payload)
+        second = self.ledger.append("op", dict(self.payload))
+        
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(len(self.store.store), 1)
+        self.assertNotEqual(first.entry_hash, second.entry_hash)
+    
+    def test_tampered_payload_detected(self):
+        """Test resolving a payload whose stored bytes changed."""
+        entry = self.ledger.append("op", self.payload)
+        self.store.store[entry.data[PAYLOAD_REF]] = b"{}"
+        
+        with self.assertRaises(IntegrityError):
+            self.ledger.resolve_data(entry)
+    
+    def test_reference_keys_in_user_data(self):
+        """Test small payloads using reference key names are not taken for references."""
+        for data in (
+            {"payload_ref": "0" * 64, "payload_size": 1},
+            {PAYLOAD_REF: "0" * 64, PAYLOAD_SIZE: 1},
+            {"$$note": "kept", "value": 1},
+        ):
+            entry = self.ledger.append("op", data)
+            self.assertNotIn(PAYLOAD_REF, entry.data)
+            self.assertEqual(self.ledger.resolve_data(entry), data)
+        self.assertEqual(len(self.store.store), 0)
+        self.assertTrue(self.ledger.verify_integrity())
+
+
+class TestExtend(unittest.TestCase):
+    """Test cases for appending replicated entries."""
+    
+    def setUp(self):
+        """Set up a source ledger with a few entries."""
+        self.source = ImmutableLedger()
+        for i in range(5):
+            self.source.append("op", {"seq": i})
+    
+    def test_replica_adopts_genesis(self):
+        """Test a fresh ledger takes the source chain from index 0."""
+        replica = ImmutableLedger()
+        
+        self.assertEqual(replica.extend(self.source.entries[:3]), 3)
+        self.assertEqual(replica.extend(self.source.entries[3:]), 3)
+        self.assertEqual(replica.entries, self.source.entries)
+        self.assertTrue(replica.verify_integrity())
+    
+    def test_rejects_gap(self):
+        """Test entries must start at the end of the chain."""
+        with self.assertRaises(ValueError):
+            ImmutableLedger().extend(self.source.entries[2:])
+    
+    def test_rejects_bad_entries(self):
+        """Test broken links and hashes leave the ledger unchanged."""
+        replica = ImmutableLedger()
+        entries = list(self.source.entries)
+        entries[2] = self.source.entries[3]
+        with self.assertRaises(IntegrityError):
+            replica.extend(entries)
+        
+        self.source.entries[4].data["seq"] = 99
+        with self.assertRaises(IntegrityError):
+            replica.extend(self.source.entries)
+        self.assertEqual(len(replica.entries), 1)
+        self.assertEqual(replica.entries[0].data, {"note": "Ledger initialized"})
+
+
 class TestLedgerEntry(unittest.TestCase):
     """Test cases for LedgerEntry dataclass."""
     
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Ledger Sync
+
+Test coverage:
+- Replicas catching up from genesis and from behind
+- Transfer proportional to the gap
+- Fork detection
+- Rejection of tampered entries
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import unittest
+from services.ledger.ledger import ImmutableLedger
+from services.ledger.sync import LedgerSync, SyncConfig
+from services.networking.p2p import P2PNetwork, PeerInfo
+
+
+class TestLedgerSync(unittest.IsolatedAsyncioTestCase):
+    """Test cases for LedgerSync over loopback."""
+    
+    async def asyncSetUp(self):
+        """Start a source node and a replica connected to it."""
+        config = SyncConfig(batch_size=64, window=3)
+        self.nodes = [P2PNetwork(f"l{i}", host="127.0.0.1") for i in range(2)]
+        self.source, self.replica = ImmutableLedger(), ImmutableLedger()
+        self.source_sync = LedgerSync(self.nodes[0], self.source, config)
+        self.replica_sync = LedgerSync(self.nodes[1], self.replica, config)
+        for node in self.nodes:
+            await node.open()
+        await self.nodes[1].connect(PeerInfo("l0", "127.0.0.1", self.nodes[0].port))
+        
+        for i in range(1000):
+            self.source.append("process_complete", {"result": {"seq": i}})
+    
+    async def asyncTearDown(self):
+        """Stop all nodes."""
+        for node in self.nodes:
+            await node.close()
+    
+    def assertSameChain(self):
+        """Assert the replica holds exactly the source's entries."""
+        self.assertEqual(
+            [e.entry_hash for e in self.replica.entries],
+            [e.entry_hash for e in self.source.entries]
+        )
+        self.assertTrue(self.replica.verify_integrity())
+    
+    async def test_fresh_replica(self):
+        """Test a replica with only its genesis adopts the source chain."""
+        result = await self.replica_sync.sync("l0")
+        
+        self.assertTrue(result.complete)
+        self.assertEqual(result.received, 1001)
+        self.assertSameChain()
+        self.assertEqual(self.replica.entries[5].data, {"result": {"seq": 4}})
+    
+    async def test_catch_up_sends_only_gap(self):
+        """Test a lagging replica receives just the missing entries."""
+        await self.replica_sync.sync("l0")
+        for i in range(50):
+            self.source.append("ethics_flag", {"term": f"t{i}"})
+        served = self.source_sync.stats["entries_served"]
+        
+        result = await self.replica_sync.sync("l0")
+        
+        self.assertEqual(result.received, 50)
+        self.assertEqual(self.source_sync.stats["entries_served"] - served, 50)
+        self.assertSameChain()
+    
+    async def test_in_sync(self):
+        """Test identical ledgers exchange only their heads."""
+        await self.replica_sync.sync("l0")
+        digests = self.replica_sync.stats["digests_requested"]
+        
+        result = await self.replica_sync.sync("l0")
+        
+        self.assertEqual(result.received, 0)
+        self.assertEqual(self.replica_sync.stats["in_sync"], 1)
+        self.assertEqual(self.replica_sync.stats["digests_requested"], digests)
+    
+    async def test_fork_detected(self):
+        """Test diverged chains are located and left untouched."""
+        await self.replica_sync.sync("l0")
+        self.source.append("op", {"side": "source"})
+        self.replica.append("op", {"side": "replica"})
+        head = self.replica.entries[-1]
+        
+        result = await self.replica_sync.sync("l0")
+        
+        self.assertEqual(result.diverged_at, 1001)
+        self.assertIs(self.replica.entries[-1], head)
+        # Narrowing 1002 entries takes a few rounds of 16 digests
+        self.assertLess(self.replica_sync.stats["digests_requested"], 64)
+    
+    async def test_tampered_source_rejected(self):
+        """Test entries whose hashes do not verify are not appended."""
+        self.source.entries[10].data["result"]["seq"] = -1
+        
+        result = await self.replica_sync.sync("l0")
+        
+        self.assertFalse(result.complete)
+        self.assertEqual(self.replica_sync.stats["rejected"], 1)
+        self.assertLessEqual(len(self.replica.entries), 10)
+        self.assertTrue(self.replica.verify_integrity())
+
+
+if __name__ == '__main__':
+    unittest.main()
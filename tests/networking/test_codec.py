@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for P2P Message Codec
+
+Test coverage:
+- Typed value round trips
+- Raw bytes and zero-copy encoding
+- Ledger entry, CAS chunk and heartbeat fast paths
+- Registered layouts keep their message type
+- Version and malformed input rejection
+- Tuples preserved, so ledger entries holding them still verify
+- Nesting depth limit and unhashable map keys
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import unittest
+from services.ledger.ledger import ImmutableLedger
+from services.networking import codec
+from services.networking.codec import CasChunk, CodecError, Heartbeat
+
+
+class TestCodec(unittest.TestCase):
+    """Test cases for the message codec."""
+    
+    def test_value_round_trip(self):
+        """Test every typed value survives a round trip."""
+        value = {
+            "none": None,
+            "flags": [True, False],
+            "small": -7,
+            "big": 2 ** 100,
+            "ratio": 0.25,
+            "text": "héllo",
+            "blob": b"\x00\xff",
+            "nested": {"list": [1, [2, {"x": "y"}]]},
+            "pair": (1, ("a", [2])),
+            (4, "k"): "tuple key",
+            3: "int key"
+        }
+        self.assertEqual(codec.decode(codec.encode(value)), value)
+    
+    def test_raw_bytes_not_inflated(self):
+        """Test byte payloads are carried without base64 expansion."""
+        payload = os.urandom(1000)
+        encoded = codec.encode({"data": payload})
+        self.assertLess(len(encoded), len(payload) + 32)
+        self.assertIn(payload, encoded)
+    
+    def test_large_bytes_referenced(self):
+        """Test large payloads are emitted as views of the caller's buffer."""
+        payload = bytearray(os.urandom(codec.ZERO_COPY_MIN_BYTES * 2))
+        parts = codec.encode_parts(payload)
+        
+        views = [p for p in parts if isinstance(p, memoryview)]
+        self.assertEqual(len(views), 1)
+        self.assertIs(views[0].obj, payload)
+        self.assertEqual(codec.decode(b"".join(parts)), bytes(payload))
+    
+    def test_heartbeat(self):
+        """Test heartbeat fast path."""
+        beat = Heartbeat(seq=42, sent_at=1234.5)
+        encoded = codec.encode(beat)
+        self.assertEqual(len(encoded), 18)
+        self.assertEqual(codec.decode(encoded), beat)
+    
+    def test_cas_chunk(self):
+        """Test CAS chunks decode to views over the received frame."""
+        data = os.urandom(5000)
+        chunk = CasChunk(address="ab" * 32, index=3, data=data)
+        frame = codec.encode(chunk)
+        
+        decoded = codec.decode(frame)
+        self.assertEqual(decoded.address, chunk.address)
+        self.assertEqual(decoded.index, 3)
+        self.assertIsInstance(decoded.data, memoryview)
+        self.assertEqual(bytes(decoded.data), data)
+    
+    def test_ledger_entry(self):
+        """Test ledger entries round trip and still verify."""
+        ledger = ImmutableLedger()
+        entry = ledger.append("decision", {"approved": True, "score": 0.9})
+        
+        decoded = codec.decode(codec.encode(entry))
+        self.assertEqual(decoded, entry)
+        self.assertEqual(ledger._compute_hash(decoded), decoded.entry_hash)
+        self.assertEqual(codec.decode(codec.encode(ledger.entries[0])), ledger.entries[0])
+    
+    def test_ledger_entry_with_tuples(self):
+        """Test entries holding tuples keep their hash after a round trip."""
+        ledger = ImmutableLedger()
+        entry = ledger.append("reading", {"range": (0.5, 2.0), "points": [(1, 2)]})
+        
+        decoded = codec.decode(codec.encode(entry))
+        self.assertEqual(decoded.data, entry.data)
+        self.assertEqual(ledger._compute_hash(decoded), entry.entry_hash)
+    
+    def test_register_rejects_taken_type(self):
+        """Test a message type cannot be registered for a second class."""
+        class Other:
+            pass
+        
+        for msg_type in (codec.MSG_LEDGER_ENTRY, codec.MSG_HEARTBEAT):
+            with self.assertRaises(ValueError):
+                codec.register(Other, msg_type, lambda m: (b"", None), lambda v, p: None)
+    
+    def test_unknown_version(self):
+        """Test messages from another codec version are rejected."""
+        encoded = bytearray(codec.encode("hi"))
+        encoded[0] = codec.CODEC_VERSION + 1
+        with self.assertRaises(CodecError):
+            codec.decode(encoded)
+    
+    def test_malformed(self):
+        """Test truncated and unencodable input raise CodecError."""
+        encoded = codec.encode({"text": "hello"})
+        for cut in (1, 5, len(encoded) - 1):
+            with self.assertRaises(CodecError):
+                codec.decode(encoded[:cut])
+        with self.assertRaises(CodecError):
+            codec.encode({"bad": object()})
+    
+    def test_depth_limit(self):
+        """Test deeply nested and cyclic values are refused both ways."""
+        nested = []
+        for _ in range(codec.MAX_DEPTH - 1):
+            nested = [nested]
+        self.assertEqual(codec.decode(codec.encode(nested)), nested)
+        with self.assertRaises(CodecError):
+            codec.encode([nested])
+        
+        cyclic = []
+        cyclic.append(cyclic)
+        with self.assertRaises(CodecError):
+            codec.encode(cyclic)
+        
+        deep = codec.encode(nested)[:2] + bytes([codec.T_LIST, 0, 0, 0, 1]) * 100000
+        with self.assertRaises(CodecError):
+            codec.decode(deep)
+    
+    def test_unhashable_key(self):
+        """Test a list decoded as a map key raises CodecError."""
+        encoded = codec.encode({(1, 2): "x"}).replace(
+            bytes([codec.T_TUPLE]), bytes([codec.T_LIST])
+        )
+        with self.assertRaises(CodecError):
+            codec.decode(encoded)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Link Compression
+
+Test coverage:
+- Stream round trips across many frames
+- Preset dictionary gains on small messages
+- Adaptive skipping of small and incompressible frames
+- Skipping links with LAN round trips, on both ends of a connection
+- Corrupt and oversized input rejection
+- Negotiation between P2P nodes over loopback
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import unittest
+from services.networking import codec
+from services.networking.compression import (
+    ALGORITHM, CompressionConfig, StreamCompressor, StreamDecompressor, negotiate
+)
+from services.networking.p2p import P2PNetwork, PeerInfo
+from services.networking.telemetry import PeerTelemetry, TelemetryConfig
+from services.networking.transport import (
+    COMPRESSED_FLAG, FRAME_HEADER, FrameDecoder, FrameError
+)
+from tests.networking.test_p2p import wait_for
+
+
+def telemetry(i):
+    """Encoded telemetry message like a site would send."""
+    return codec.encode({
+        "site_type": "telecom_tower",
+        "timestamp": 1700000000.0 + i,
+        "soc": 0.5 + i / 1000,
+        "load_kw": 7.5,
+        "inputs": ["pv", "wind", "genset", "grid"]
+    })
+
+
+class TestStreamCompression(unittest.TestCase):
+    """Test cases for StreamCompressor and StreamDecompressor."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.compressor = StreamCompressor(CompressionConfig(min_size=16))
+        self.decompressor = StreamDecompressor(1024 * 1024)
+    
+    def test_round_trip(self):
+        """Test many frames decompress in order from one stream."""
+        frames = [telemetry(i) for i in range(100)]
+        for frame in frames:
+            compressed = self.compressor.compress([frame])
+            self.assertIsNotNone(compressed)
+            self.assertEqual(self.decompressor.decompress(compressed), frame)
+        
+        stats = self.compressor.get_status()
+        self.assertLess(stats["ratio"], 0.5)
+    
+    def test_dictionary_helps_first_message(self):
+        """Test the preset dictionary shrinks even the first small message."""
+        frame = telemetry(0)
+        compressed = self.compressor.compress([frame])
+        self.assertLess(len(compressed), len(frame) * 0.7)
+    
+    def test_parts_compressed_without_join(self):
+        """Test multi-part payloads round trip."""
+        parts = [b"\x01", memoryview(b"header" * 20), bytearray(b"body" * 50)]
+        compressed = self.compressor.compress(parts)
+        self.assertEqual(self.decompressor.decompress(compressed), b"".join(parts))
+    
+    def test_skips_small_and_incompressible(self):
+        """Test tiny and random payloads are not compressed."""
+        self.assertIsNone(self.compressor.compress([b"tiny"]))
+        self.assertIsNone(self.compressor.compress([os.urandom(64 * 1024)]))
+        self.assertEqual(self.compressor.skipped, 2)
+        
+        # Skipped frames leave the stream in sync
+        frame = telemetry(1)
+        self.assertEqual(
+            self.decompressor.decompress(self.compressor.compress([frame])), frame
+        )
+    
+    def test_skips_fast_links(self):
+        """Test links are compressed only until a LAN round trip is measured."""
+        link = PeerTelemetry(TelemetryConfig())
+        compressor = StreamCompressor(CompressionConfig(min_size=16), link)
+        self.assertIsNotNone(compressor.compress([telemetry(0)]))
+        
+        link.record_rtt(0.040)
+        self.assertIsNotNone(compressor.compress([telemetry(1)]))
+        link.record_rtt(0.0005)
+        self.assertIsNone(compressor.compress([telemetry(2)]))
+        self.assertEqual(compressor.skipped, 1)
+    
+    def test_rejects_bad_input(self):
+        """Test corrupt and oversized frames raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.decompressor.decompress(b"not zlib at all")
+        
+        small = StreamDecompressor(100)
+        compressed = StreamCompressor().compress([bytes(10000)])
+        with self.assertRaises(ValueError):
+            small.decompress(compressed)
+    
+    def test_negotiate(self):
+        """Test compression is only used when the peer offers our algorithm."""
+        self.assertEqual(negotiate([ALGORITHM]), ALGORITHM)
+        self.assertIsNone(negotiate(["zlib-otherdictionary"]))
+        self.assertIsNone(negotiate([]))
+
+
+class TestCompressedFrames(unittest.TestCase):
+    """Test cases for compressed frames in FrameDecoder."""
+    
+    def test_decode_compressed_frame(self):
+        """Test flagged frames are decompressed by the decoder."""
+        payload = telemetry(0)
+        compressed = StreamCompressor().compress([payload])
+        wire = FRAME_HEADER.pack(len(compressed) | COMPRESSED_FLAG) + compressed
+        
+        decoder = FrameDecoder()
+        decoder.decompressor = StreamDecompressor(1024)
+        self.assertEqual(decoder.feed(wire), [payload])
+        
+        with self.assertRaises(FrameError):
+            FrameDecoder().feed(wire)
+
+
+class TestP2PCompression(unittest.IsolatedAsyncioTestCase):
+    """Test cases for negotiated compression through P2PNetwork."""
+    
+    async def exchange(self, a, b):
+        """Send telemetry from a to b and return what b received."""
+        inbox = []
+        b.on_message(lambda peer, msg: inbox.append(msg))
+        try:
+            await a.open()
+            await b.open()
+            await a.connect(PeerInfo(b.node_id, "127.0.0.1", b.port))
+            for i in range(50):
+                await a.send(b.node_id, codec.decode(telemetry(i)))
+            await wait_for(lambda: len(inbox) == 50)
+            return inbox
+        finally:
+            await a.close()
+            await b.close()
+    
+    async def test_compressed_link(self):
+        """Test traffic is compressed when both nodes offer compression."""
+        a = P2PNetwork("ca", host="127.0.0.1")
+        b = P2PNetwork("cb", host="127.0.0.1")
+        stats = {}
+        b.on_message(lambda peer, msg: stats.update(a.get_compression_stats()))
+        
+        inbox = await self.exchange(a, b)
+        self.assertEqual(inbox[-1], codec.decode(telemetry(49)))
+        self.assertLess(stats["cb"]["bytes_out"], stats["cb"]["bytes_in"])
+    
+    async def test_uncompressed_peer(self):
+        """Test a node with compression disabled still interoperates."""
+        a = P2PNetwork("ua", host="127.0.0.1")
+        b = P2PNetwork("ub", host="127.0.0.1",
+                       compression_config=CompressionConfig(enabled=False))
+        
+        inbox = await self.exchange(a, b)
+        self.assertEqual(len(inbox), 50)
+        self.assertEqual(a.get_compression_stats(), {})
+    
+    async def test_accepting_side_skips_fast_link(self):
+        """Test the node that accepted a connection stops compressing on a LAN link."""
+        a = P2PNetwork("fa", host="127.0.0.1")
+        b = P2PNetwork("fb", host="127.0.0.1")
+        await a.open()
+        await b.open()
+        try:
+            await a.connect(PeerInfo(b.node_id, "127.0.0.1", b.port))
+            await wait_for(lambda: b.pool.get("fa") and b.pool.get("fa").compressor)
+            compressor = b.pool.get("fa").compressor
+            self.assertIs(compressor.link, b.telemetry.peer("fa"))
+            self.assertIsNotNone(compressor.compress([telemetry(0)]))
+            b.telemetry.record_rtt("fa", 0.0005)
+            self.assertIsNone(compressor.compress([telemetry(1)]))
+        finally:
+            await a.close()
+            await b.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
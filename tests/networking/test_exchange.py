@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for CAS Block Exchange
+
+Test coverage:
+- Fetching chunked and plain objects
+- Parallel fetch from several holders
+- Rejection of corrupt blocks
+- Missing objects
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import unittest
+from services.networking.exchange import BlockExchange, ExchangeConfig
+from services.networking.p2p import P2PNetwork, PeerInfo
+from services.storage.cas import ContentAddressedStorage
+
+
+class TestBlockExchange(unittest.IsolatedAsyncioTestCase):
+    """Test cases for BlockExchange over loopback."""
+    
+    async def asyncSetUp(self):
+        """Start a fetcher and three holders connected to it."""
+        config = ExchangeConfig(max_inflight_per_peer=2, request_timeout=2.0)
+        self.nodes = [P2PNetwork(f"x{i}", host="127.0.0.1") for i in range(4)]
+        self.stores = [ContentAddressedStorage() for _ in self.nodes]
+        self.exchanges = [
+            BlockExchange(node, store, config)
+            for node, store in zip(self.nodes, self.stores)
+        ]
+        for node in self.nodes:
+            await node.open()
+        for holder in self.nodes[1:]:
+            await self.nodes[0].connect(PeerInfo(holder.node_id, "127.0.0.1", holder.port))
+        
+        self.blob = os.urandom(64 * 1024 + 123)
+        for store in self.stores[1:]:
+            self.address = store.put_chunked(self.blob, chunk_size=4096)
+    
+    async def asyncTearDown(self):
+        """Stop all nodes."""
+        for node in self.nodes:
+            await node.close()
+    
+    async def test_parallel_fetch(self):
+        """Test chunks are fetched from every holder and reassembled."""
+        fetcher = self.exchanges[0]
+        self.assertEqual(sorted(await fetcher.find_holders(self.address)), ["x1", "x2", "x3"])
+        
+        self.assertTrue(await fetcher.fetch(self.address))
+        self.assertEqual(self.stores[0].get(self.address), self.blob)
+        
+        served = [ex.stats["blocks_served"] for ex in self.exchanges[1:]]
+        self.assertGreaterEqual(sum(served), 17)
+        self.assertGreater(sum(1 for n in served if n), 1)
+        self.assertEqual(fetcher.get_status()["inflight"], 0)
+    
+    async def test_plain_object(self):
+        """Test unchunked objects are fetched as a single block."""
+        address = self.stores[2].put(b"small config blob")
+        self.assertTrue(await self.exchanges[0].fetch(address))
+        self.assertEqual(self.stores[0].get(address), b"small config blob")
+    
+    async def test_corrupt_holder(self):
+        """Test blocks failing their hash check are refetched elsewhere."""
+        bad = self.stores[1]
+        for chunk in bad.get_manifest(self.address).chunks:
+            bad.store[chunk] = b"corrupted" + bad.store[chunk][9:]
+        
+        self.assertTrue(await self.exchanges[0].fetch(self.address))
+        self.assertEqual(self.stores[0].get(self.address), self.blob)
+        self.assertGreater(self.exchanges[0].stats["corrupt"], 0)
+    
+    async def test_missing_object(self):
+        """Test fetching an object nobody holds fails cleanly."""
+        self.assertFalse(await self.exchanges[0].fetch("0" * 64))
+        self.assertFalse(self.stores[0].has("0" * 64))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,216 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Failure Detector
+
+Test coverage:
+- Timer wheel firing, cascading and cancellation
+- Phi-accrual suspicion on regular and jittery heartbeats
+- Detection of silent peers
+- Eviction of dead peers from P2P routing and pools
+- Traffic standing in for heartbeats on busy links
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import asyncio
+import random
+import unittest
+from services.networking.failure_detector import (
+    FailureDetector, FailureDetectorConfig, PhiAccrual, TimerWheel
+)
+from services.networking.p2p import PeerInfo
+from services.networking.simnet import SimConfig, SimNetwork
+from tests.networking.test_p2p import wait_for
+from tests.networking.test_simnet import simulate, start, stop
+
+
+class TestTimerWheel(unittest.TestCase):
+    """Test cases for TimerWheel."""
+    
+    def setUp(self):
+        """Use a small wheel so tests cross every level."""
+        self.wheel = TimerWheel(tick=1.0, bits=2, levels=3)
+        self.fired = []
+    
+    def run_until(self, tick):
+        """Advance one tick at a time."""
+        for t in range(self.wheel.now + 1, tick + 1):
+            self.wheel.advance(t)
+    
+    def test_fires_on_deadline(self):
+        """Test timers fire on their tick at every level and beyond."""
+        delays = [1, 3, 4, 5, 15, 16, 17, 63, 64, 65, 150]
+        for delay in delays:
+            self.wheel.schedule(delay, lambda d=delay: self.fired.append((d, self.wheel.now)))
+        self.wheel.advance(2)
+        self.wheel.schedule(7, lambda: self.fired.append((7, self.wheel.now)))
+        
+        self.run_until(200)
+        
+        self.assertEqual(len(self.fired), len(delays) + 1)
+        for delay, tick in self.fired:
+            self.assertEqual(tick, delay + 2 if delay == 7 else delay)
+        self.assertEqual(len(self.wheel), 0)
+    
+    def test_cancel(self):
+        """Test cancelled timers never fire."""
+        keep = self.wheel.schedule(20, lambda: self.fired.append("keep"))
+        drop = self.wheel.schedule(20, lambda: self.fired.append("drop"))
+        self.wheel.cancel(drop)
+        self.wheel.cancel(drop)
+        
+        self.run_until(30)
+        
+        self.assertEqual(self.fired, ["keep"])
+        self.assertFalse(keep.active)
+    
+    def test_periodic(self):
+        """Test callbacks can reschedule themselves."""
+        def beat():
+            """Record and reschedule."""
+            self.fired.append(self.wheel.now)
+            self.wheel.schedule(5, beat)
+        
+        self.wheel.schedule(5, beat)
+        self.run_until(50)
+        
+        self.assertEqual(self.fired, list(range(5, 51, 5)))
+    
+    def test_idle_ticks_skipped(self):
+        """Test an empty wheel jumps forward instead of ticking."""
+        self.assertEqual(self.wheel.advance(10 ** 9), 0)
+        self.wheel.schedule(3, lambda: self.fired.append(self.wheel.now))
+        self.wheel.advance(10 ** 9 + 3)
+        
+        self.assertEqual(self.fired, [10 ** 9 + 3])
+
+
+class TestPhiAccrual(unittest.TestCase):
+    """Test cases for PhiAccrual."""
+    
+    def beats(self, intervals):
+        """Build a detector fed with heartbeats at the given intervals."""
+        detector = PhiAccrual(FailureDetectorConfig(), 0.0)
+        now = 0.0
+        for interval in intervals:
+            now += interval
+            detector.heartbeat(now)
+        return detector, now
+    
+    def test_grows_with_silence(self):
+        """Test phi is low on time and grows steadily when silent."""
+        detector, last = self.beats([1.0] * 50)
+        
+        self.assertLess(detector.phi(last + 1.0), 1.0)
+        values = [detector.phi(last + t) for t in (2, 3, 4, 6)]
+        self.assertEqual(values, sorted(values))
+        self.assertGreater(detector.phi(last + 6.0), 8.0)
+    
+    def test_jitter_tolerated(self):
+        """Test jittery links need a longer silence to become suspect."""
+        rng = random.Random(5)
+        steady, steady_last = self.beats([1.0] * 100)
+        jittery, jittery_last = self.beats([rng.uniform(0.3, 3.0) for _ in range(100)])
+        
+        self.assertGreater(steady.phi(steady_last + 5.0), 8.0)
+        self.assertLess(jittery.phi(jittery_last + 5.0), 8.0)
+
+
+class TestFailureDetector(unittest.TestCase):
+    """Test cases for FailureDetector on a manual clock."""
+    
+    def test_silent_peer_declared_dead(self):
+        """Test only the peer that stops answering is declared dead."""
+        sent, dead = [], []
+        detector = FailureDetector(
+            send=lambda peer, seq: sent.append(peer),
+            on_dead=lambda peer, phi: dead.append((peer, now)),
+        )
+        now = 0.0
+        detector.track("alive", now)
+        detector.track("silent", now)
+        
+        while now < 60.0:
+            now = round(now + 0.1, 1)
+            detector.advance(now)
+            if now % 1.0 == 0:
+                detector.heartbeat("alive", now)
+                if now <= 20.0:
+                    detector.heartbeat("silent", now)
+        
+        self.assertEqual([peer for peer, _ in dead], ["silent"])
+        self.assertLess(dead[0][1], 20.0 + 6.0)
+        self.assertEqual(sent.count("alive"), 60)
+        self.assertEqual(list(detector.peers), ["alive"])
+
+
+class TestP2PFailureDetection(unittest.TestCase):
+    """Test cases for heartbeats between P2P nodes."""
+    
+    def test_evicts_dead_peer_only(self):
+        """Test a hung peer is evicted while jittery peers are kept."""
+        async def main():
+            """Run a hub with two peers, one of which hangs."""
+            net = SimNetwork(SimConfig(latency=0.2, jitter=0.8, seed=2))
+            hub, steady, hung = (net.create_node(name) for name in ("hub", "steady", "hung"))
+            for node in (hub, steady, hung):
+                await node.open()
+                if node is not hub:
+                    await node.connect(PeerInfo("hub", hub.host, hub.port))
+            
+            await asyncio.sleep(120)
+            self.assertEqual(hub.detector.stats["evictions"], 0)
+            health = hub.get_peer_health()
+            self.assertEqual(sorted(health), ["hung", "steady"])
+            self.assertLess(max(health.values()), 8.0)
+            
+            # Any frame counts as a heartbeat, so silence the hung node
+            # entirely without closing the connection
+            net.set_link(hub.host, hung.host, latency=3600)
+            loop = asyncio.get_running_loop()
+            hung_at = loop.time()
+            await wait_for(lambda: "hung" not in hub.peers, timeout=30)
+            detected = loop.time() - hung_at
+            
+            self.assertNotIn("hung", hub.pool.slots)
+            self.assertIsNone(hub.routing.get("hung"))
+            self.assertIn("steady", hub.peers)
+            for node in (hub, steady, hung):
+                await node.close()
+            return detected
+        
+        self.assertLess(simulate(main()), 15.0)
+    
+    def test_busy_links_skip_heartbeats(self):
+        """Test traffic stands in for heartbeats, which resume when the link idles."""
+        async def main():
+            """Send steadily for a while, then go quiet."""
+            net = SimNetwork(SimConfig(latency=0.05))
+            a, b = await start(net, 2)
+            for _ in range(40):
+                await b.send("s0", "busy")
+                await asyncio.sleep(0.5)
+            busy = dict(b.detector.stats)
+            await asyncio.sleep(20)
+            idle = dict(b.detector.stats)
+            await stop([a, b])
+            return busy, idle, a.detector.stats["evictions"]
+        
+        busy, idle, evictions = simulate(main())
+        self.assertGreater(busy["heartbeats_skipped"], 15)
+        self.assertLess(busy["heartbeats_sent"], 5)
+        self.assertGreater(idle["heartbeats_sent"] - busy["heartbeats_sent"], 15)
+        self.assertEqual(evictions, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Gossip Broadcast
+
+Test coverage:
+- Bounded seen-message cache
+- Fleet-wide propagation with constant per-node sends
+- Deduplication of relayed copies
+- IHAVE/IWANT repair of missed messages
+- IHAVE announcements repeated for a bounded number of rounds
+- Repair of a publish whose every push was lost
+- Gossip relay between P2P nodes over loopback
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import asyncio
+import random
+import unittest
+from services.networking.gossip import GossipConfig, GossipProtocol, SeenCache
+from services.networking.p2p import P2PNetwork, PeerInfo
+from tests.networking.test_p2p import wait_for
+
+
+class Fleet:
+    """In-memory fleet of gossip nodes where every node knows every other."""
+    
+    def __init__(self, size, config):
+        """Create size nodes sharing one config."""
+        self.ids = [f"n{i}" for i in range(size)]
+        self.inbox = {node_id: [] for node_id in self.ids}
+        self.nodes = {
+            node_id: GossipProtocol(
+                node_id,
+                send=lambda peer, msg, src=node_id: self.send(src, peer, msg),
+                peers=lambda src=node_id: [p for p in self.ids if p != src],
+                deliver=lambda origin, data, box=self.inbox[node_id]: box.append((origin, data)),
+                config=config
+            )
+            for node_id in self.ids
+        }
+        self.drop = set()
+    
+    async def send(self, src, dst, message):
+        """Deliver a message, unless the destination is cut off."""
+        if dst in self.drop:
+            return False
+        await asyncio.sleep(0)
+        await self.nodes[dst].receive(src, message)
+        return True
+
+
+class TestSeenCache(unittest.TestCase):
+    """Test cases for SeenCache."""
+    
+    def test_dedup_and_bound(self):
+        """Test duplicates are reported and the oldest IDs evicted."""
+        cache = SeenCache(capacity=3)
+        self.assertTrue(cache.add(b"a"))
+        self.assertFalse(cache.add(b"a"))
+        for key in (b"b", b"c", b"d"):
+            cache.add(key)
+        
+        self.assertEqual(len(cache), 3)
+        self.assertNotIn(b"a", cache)
+        self.assertIn(b"d", cache)
+
+
+class TestGossipProtocol(unittest.IsolatedAsyncioTestCase):
+    """Test cases for GossipProtocol over an in-memory fleet."""
+    
+    def setUp(self):
+        """Seed peer selection for repeatable runs."""
+        random.seed(7)
+    
+    async def test_reaches_fleet(self):
+        """Test one publish reaches every node once, with bounded sends."""
+        config = GossipConfig(fanout=5, ttl=8)
+        fleet = Fleet(200, config)
+        
+        await fleet.nodes["n0"].publish({"block": 1})
+        
+        for node_id in fleet.ids[1:]:
+            self.assertEqual(fleet.inbox[node_id], [("n0", {"block": 1})])
+        self.assertEqual(fleet.inbox["n0"], [])
+        for node in fleet.nodes.values():
+            self.assertLessEqual(node.stats["sent"], config.fanout)
+    
+    async def test_ttl_limits_hops(self):
+        """Test messages stop once their TTL is spent."""
+        fleet = Fleet(50, GossipConfig(fanout=1, ttl=1))
+        
+        await fleet.nodes["n0"].publish("x")
+        
+        reached = [n for n in fleet.ids if fleet.inbox[n]]
+        self.assertEqual(len(reached), 1)
+    
+    async def test_repair_fills_gaps(self):
+        """Test IHAVE/IWANT delivers messages a node missed."""
+        fleet = Fleet(20, GossipConfig(fanout=4, ttl=4, repair_fanout=19))
+        fleet.drop.add("n19")
+        
+        await fleet.nodes["n0"].publish("late")
+        self.assertEqual(fleet.inbox["n19"], [])
+        
+        fleet.drop.clear()
+        for node_id in fleet.ids:
+            await fleet.nodes[node_id].repair()
+        
+        self.assertEqual(fleet.inbox["n19"], [("n0", "late")])
+    
+    async def test_repair_announces_published(self):
+        """Test IHAVE from the origin recovers a publish none of its pushes delivered."""
+        fleet = Fleet(20, GossipConfig(fanout=4, ttl=4, repair_fanout=19))
+        fleet.drop.update(fleet.ids[1:])
+        
+        await fleet.nodes["n0"].publish("lost")
+        self.assertTrue(all(not fleet.inbox[n] for n in fleet.ids))
+        
+        fleet.drop.clear()
+        await fleet.nodes["n0"].repair()
+        
+        for node_id in fleet.ids[1:]:
+            self.assertEqual(fleet.inbox[node_id], [("n0", "lost")])
+    
+    async def test_repair_repeats_announcements(self):
+        """Test IDs are announced for repair_rounds rounds, then dropped."""
+        fleet = Fleet(20, GossipConfig(fanout=4, ttl=4, repair_fanout=19, repair_rounds=2))
+        fleet.drop.update(fleet.ids[1:])
+        origin = fleet.nodes["n0"]
+        
+        await origin.publish("lost")
+        await origin.repair()
+        self.assertTrue(all(not fleet.inbox[n] for n in fleet.ids))
+        
+        fleet.drop.clear()
+        await origin.repair()
+        for node_id in fleet.ids[1:]:
+            self.assertEqual(fleet.inbox[node_id], [("n0", "lost")])
+        
+        sent = origin.stats["sent"]
+        await origin.repair()
+        self.assertEqual(origin.stats["sent"], sent)
+
+
+class TestP2PGossip(unittest.IsolatedAsyncioTestCase):
+    """Test cases for gossip through P2PNetwork."""
+    
+    async def test_relay(self):
+        """Test a published message is relayed to nodes the origin does not know."""
+        nodes = [P2PNetwork(f"g{i}", host="127.0.0.1") for i in range(3)]
+        inbox = []
+        try:
+            for node in nodes:
+                await node.open()
+            nodes[2].on_message(lambda peer, msg: inbox.append((peer, msg)))
+            a, b, c = nodes
+            await a.connect(PeerInfo("g1", "127.0.0.1", b.port))
+            await b.connect(PeerInfo("g2", "127.0.0.1", c.port))
+            
+            await a.publish({"op": "announce"})
+            await wait_for(lambda: inbox)
+            
+            self.assertNotIn("g0", c.peers)
+            self.assertEqual(inbox, [("g0", {"op": "announce"})])
+        finally:
+            for node in nodes:
+                await node.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for P2P Networking
+
+Test coverage:
+- Loopback connections between nodes
+- Message delivery in both directions
+- Broadcast
+- Blocking API
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import asyncio
+import queue
+import unittest
+from services.networking.p2p import P2PNetwork, PeerInfo
+
+
+async def wait_for(predicate, timeout=5.0):
+    """Poll until predicate() is true."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("Timed out waiting for condition")
+        await asyncio.sleep(0.01)
+
+
+class TestP2PNetwork(unittest.IsolatedAsyncioTestCase):
+    """Test cases for P2PNetwork over loopback."""
+    
+    async def asyncSetUp(self):
+        """Start a small set of nodes."""
+        self.nodes = [P2PNetwork(f"node{i}", host="127.0.0.1") for i in range(3)]
+        self.inbox = {node.node_id: [] for node in self.nodes}
+        for node in self.nodes:
+            await node.open()
+            node.on_message(
+                lambda peer, msg, box=self.inbox[node.node_id]: box.append((peer, msg))
+            )
+    
+    async def asyncTearDown(self):
+        """Stop all nodes."""
+        for node in self.nodes:
+            await node.close()
+    
+    def peer(self, node):
+        """PeerInfo for a node."""
+        return PeerInfo(node.node_id, "127.0.0.1", node.port)
+    
+    async def test_send_and_reply(self):
+        """Test messages flow both ways over one connection."""
+        a, b, _ = self.nodes
+        self.assertTrue(await a.connect(self.peer(b)))
+        
+        self.assertTrue(await a.send("node1", {"op": "ping"}))
+        await wait_for(lambda: self.inbox["node1"])
+        self.assertEqual(self.inbox["node1"], [("node0", {"op": "ping"})])
+        
+        # b learned a from the hello and can reply without connecting
+        self.assertIn("node0", b.peers)
+        self.assertTrue(await b.send("node0", b"\x00pong"))
+        await wait_for(lambda: self.inbox["node0"])
+        self.assertEqual(self.inbox["node0"], [("node1", b"\x00pong")])
+        self.assertIsNotNone(b.peers["node0"].last_seen)
+    
+    async def test_large_message(self):
+        """Test messages larger than socket buffers arrive intact."""
+        a, b, _ = self.nodes
+        await a.connect(self.peer(b))
+        payload = os.urandom(4 * 1024 * 1024)
+        
+        await a.send("node1", payload)
+        await wait_for(lambda: self.inbox["node1"])
+        
+        self.assertEqual(self.inbox["node1"][0][1], payload)
+    
+    async def test_send_all(self):
+        """Test broadcast reaches every connected peer."""
+        a, b, c = self.nodes
+        await a.connect(self.peer(b))
+        await a.connect(self.peer(c))
+        
+        await a.send_all("hello")
+        await wait_for(lambda: self.inbox["node1"] and self.inbox["node2"])
+    
+    async def test_unknown_and_unreachable_peers(self):
+        """Test sends to unknown or dead peers fail cleanly."""
+        a = self.nodes[0]
+        self.assertFalse(await a.send("ghost", "x"))
+        self.assertFalse(await a.connect(PeerInfo("dead", "127.0.0.1", 1)))
+
+
+class TestBlockingAPI(unittest.TestCase):
+    """Test cases for the background-thread API."""
+    
+    def test_connect_and_send(self):
+        """Test the blocking API over loopback."""
+        a = P2PNetwork("a", host="127.0.0.1")
+        b = P2PNetwork("b", host="127.0.0.1")
+        received = queue.Queue()
+        b.on_message(lambda peer, msg: received.put((peer, msg)))
+        a.start()
+        b.start()
+        try:
+            self.assertTrue(a.connect_peer(PeerInfo("b", "127.0.0.1", b.port)))
+            self.assertTrue(a.send_message("b", [1, 2, 3]))
+            self.assertEqual(received.get(timeout=5), ("a", [1, 2, 3]))
+            self.assertIn("b", a.get_peer_health())
+        finally:
+            a.stop()
+            b.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
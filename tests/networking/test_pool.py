@@ -0,0 +1,204 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for the Peer Connection Pool
+
+Test coverage:
+- Connection reuse and shared connection attempts
+- Jittered exponential backoff
+- Idle timeouts and health checks
+- Background reconnects
+- Pooled connections in P2PNetwork
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import asyncio
+import unittest
+from services.networking.p2p import P2PNetwork, PeerInfo
+from services.networking.pool import ConnectionPool, PoolConfig
+
+
+class FakeConnection:
+    """Stand-in for FramedConnection."""
+    
+    def __init__(self, peer_id):
+        """Create an open connection."""
+        self.peer_id = peer_id
+        self.is_closed = False
+        self.pings = 0
+    
+    def close(self):
+        """Close the connection."""
+        self.is_closed = True
+
+
+class TestConnectionPool(unittest.IsolatedAsyncioTestCase):
+    """Test cases for ConnectionPool."""
+    
+    async def asyncSetUp(self):
+        """Set up a pool over fake connections."""
+        self.dials = 0
+        self.fail = False
+        self.pool = ConnectionPool(self.dial, self.ping, PoolConfig(
+            idle_timeout=10.0,
+            health_interval=1.0,
+            health_timeout=1.0,
+            backoff_base=1.0,
+            backoff_max=8.0
+        ))
+    
+    async def dial(self, peer_id):
+        """Fake connector that counts attempts."""
+        self.dials += 1
+        await asyncio.sleep(0)
+        if self.fail:
+            raise OSError("refused")
+        return FakeConnection(peer_id)
+    
+    def ping(self, connection):
+        """Fake health-check ping."""
+        connection.pings += 1
+    
+    def advance(self, seconds):
+        """Shift every pool timestamp into the past."""
+        for slot in self.pool.slots.values():
+            slot.last_used -= seconds
+            slot.last_received -= seconds
+            slot.retry_at -= seconds
+            if slot.ping_sent is not None:
+                slot.ping_sent -= seconds
+    
+    async def test_reuse(self):
+        """Test a single connection serves repeated acquires."""
+        first = await self.pool.acquire("p")
+        for _ in range(10):
+            self.assertIs(await self.pool.acquire("p"), first)
+        self.assertEqual(self.dials, 1)
+    
+    async def test_concurrent_acquires_share_attempt(self):
+        """Test concurrent acquires make one connection attempt."""
+        results = await asyncio.gather(*(self.pool.acquire("p") for _ in range(5)))
+        
+        self.assertEqual(self.dials, 1)
+        self.assertTrue(all(r is results[0] for r in results))
+    
+    async def test_backoff(self):
+        """Test failed attempts back off exponentially with jitter."""
+        self.fail = True
+        loop = asyncio.get_running_loop()
+        
+        delays = []
+        for _ in range(5):
+            self.advance(100)
+            self.assertIsNone(await self.pool.acquire("p"))
+            delays.append(self.pool.slots["p"].retry_at - loop.time())
+        
+        # Within backoff, no new attempt is made
+        dials = self.dials
+        self.assertIsNone(await self.pool.acquire("p"))
+        self.assertEqual(self.dials, dials)
+        
+        for attempt, delay in enumerate(delays):
+            full = min(8.0, 2 ** attempt)
+            self.assertGreaterEqual(delay, full / 2 - 0.01)
+            self.assertLessEqual(delay, full + 0.01)
+    
+    async def test_idle_timeout(self):
+        """Test idle connections are closed without reconnecting."""
+        connection = await self.pool.acquire("p")
+        self.advance(11)
+        
+        self.pool.sweep()
+        
+        self.assertTrue(connection.is_closed)
+        self.assertIsNone(self.pool.get("p"))
+        self.pool.sweep()
+        await asyncio.sleep(0)
+        self.assertEqual(self.dials, 1)
+    
+    async def test_health_check(self):
+        """Test silent peers are pinged, then closed."""
+        connection = await self.pool.acquire("p")
+        self.advance(1.5)
+        
+        self.pool.sweep()
+        self.assertEqual(connection.pings, 1)
+        
+        # A reply clears the ping
+        self.pool.touch("p")
+        self.advance(1.5)
+        self.pool.sweep()
+        self.assertEqual(connection.pings, 2)
+        self.assertFalse(connection.is_closed)
+        
+        # No reply within the timeout closes the connection
+        self.advance(1.5)
+        self.pool.sweep()
+        self.assertTrue(connection.is_closed)
+    
+    async def test_reconnect_after_drop(self):
+        """Test connections dropped while in use are re-established."""
+        connection = await self.pool.acquire("p")
+        connection.close()
+        self.pool.discard(connection)
+        
+        self.pool.sweep()
+        await asyncio.sleep(0.01)
+        
+        self.assertEqual(self.dials, 2)
+        self.assertIsNotNone(self.pool.get("p"))
+        self.assertEqual(self.pool.reconnects, 1)
+
+
+class TestPooledNetwork(unittest.IsolatedAsyncioTestCase):
+    """Test cases for pooled connections in P2PNetwork."""
+    
+    async def test_steady_state_reuses_connection(self):
+        """Test repeated sends share one connection."""
+        a = P2PNetwork("a", host="127.0.0.1")
+        b = P2PNetwork("b", host="127.0.0.1")
+        inbound = []
+        original = b._on_hello
+        b._on_hello = lambda conn, hello: (inbound.append(conn), original(conn, hello))
+        await a.open()
+        await b.open()
+        try:
+            await a.connect(PeerInfo("b", "127.0.0.1", b.port))
+            for i in range(50):
+                self.assertTrue(await a.send("b", i))
+            self.assertEqual(len(inbound), 1)
+        finally:
+            await a.close()
+            await b.close()
+    
+    async def test_ping_updates_last_seen(self):
+        """Test health-check pongs count as traffic."""
+        a = P2PNetwork("a", host="127.0.0.1")
+        b = P2PNetwork("b", host="127.0.0.1")
+        await a.open()
+        await b.open()
+        try:
+            await a.connect(PeerInfo("b", "127.0.0.1", b.port))
+            await asyncio.sleep(0.05)
+            a.peers["b"].last_seen = 0
+            
+            a._send_ping(a.pool.get("b"))
+            await asyncio.sleep(0.05)
+            
+            self.assertGreater(a.peers["b"].last_seen, 0)
+        finally:
+            await a.close()
+            await b.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
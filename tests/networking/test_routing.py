@@ -0,0 +1,233 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Kademlia Routing
+
+Test coverage:
+- Bucket placement by XOR distance
+- Full buckets and replacement promotion
+- Bucket refresh selection
+- Iterative lookup over a large in-memory network
+- Bootstrap and lookup between P2P nodes over loopback
+- Malformed FIND_NODE and NODES messages dropped
+- Lookup contacts kept out of peers unless the routing table admits them
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import asyncio
+import math
+import random
+import unittest
+from services.networking.p2p import FRAME_FIND_NODE, FRAME_NODES, P2PNetwork, PeerInfo
+from services.networking.routing import (
+    RoutingConfig, RoutingTable, distance, iterative_lookup, node_key
+)
+from services.networking.simnet import SimConfig, SimNetwork
+from tests.networking.test_p2p import wait_for
+from tests.networking.test_simnet import simulate, stop
+
+
+def peer(node_id):
+    """PeerInfo with a placeholder address."""
+    return PeerInfo(node_id, "127.0.0.1", 0)
+
+
+class TestRoutingTable(unittest.TestCase):
+    """Test cases for RoutingTable."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.table = RoutingTable("self", k=4)
+    
+    def test_bucket_placement(self):
+        """Test contacts land in the bucket for their distance."""
+        self.table.add(peer("a"))
+        index = distance(self.table.key, node_key("a")).bit_length() - 1
+        self.assertIn("a", self.table.buckets[index].contacts)
+        self.assertFalse(self.table.add(peer("self")))
+    
+    def test_closest_ordering(self):
+        """Test closest returns contacts sorted by distance to the key."""
+        for i in range(50):
+            self.table.add(peer(f"n{i}"))
+        key = node_key("target")
+        
+        closest = self.table.closest(key)
+        distances = [distance(node_key(p.peer_id), key) for p in closest]
+        self.assertEqual(distances, sorted(distances))
+        self.assertLessEqual(len(closest), 4)
+    
+    def test_full_bucket_keeps_old_contacts(self):
+        """Test a full bucket caches newcomers and promotes them on removal."""
+        far = [f"n{i}" for i in range(200)]
+        far = [n for n in far if self.table.bucket_index(node_key(n)) == 255][:6]
+        for node_id in far:
+            self.table.add(peer(node_id))
+        
+        bucket = self.table.buckets[255]
+        self.assertEqual(list(bucket.contacts), far[:4])
+        self.assertEqual(list(bucket.replacements), far[4:])
+        
+        self.assertTrue(self.table.remove(far[0]))
+        self.assertIn(far[5], bucket.contacts)
+        self.assertEqual(len(bucket), 4)
+    
+    def test_stale_buckets(self):
+        """Test only buckets from the nearest contact outwards need refresh."""
+        self.assertEqual(self.table.stale_buckets(100.0, 10.0), [])
+        for i in range(20):
+            self.table.add(peer(f"n{i}"))
+        
+        nearest = min(i for i, b in enumerate(self.table.buckets) if b.contacts)
+        stale = self.table.stale_buckets(100.0, 10.0)
+        self.assertEqual(stale, list(range(nearest, 256)))
+        
+        key = self.table.random_key(255)
+        self.assertEqual(self.table.bucket_index(key), 255)
+        self.table.mark_lookup(key, 100.0)
+        self.assertNotIn(255, self.table.stale_buckets(100.0, 10.0))
+
+
+class TestIterativeLookup(unittest.IsolatedAsyncioTestCase):
+    """Test cases for iterative_lookup."""
+    
+    async def test_large_network(self):
+        """Test lookups find the true closest nodes in few rounds."""
+        random.seed(3)
+        ids = [f"node{i}" for i in range(400)]
+        tables = {node_id: RoutingTable(node_id, k=8) for node_id in ids}
+        for table in tables.values():
+            for other in ids:
+                table.add(peer(other))
+        
+        # Routing state grows with log N, not N
+        sizes = [len(t) for t in tables.values()]
+        self.assertLess(max(sizes), 8 * math.log2(len(ids)) + 8)
+        
+        queries = []
+        
+        async def query(contact):
+            """Answer from the contact's own routing table."""
+            queries.append(contact.peer_id)
+            return tables[contact.peer_id].closest(key)
+        
+        origin = tables["node0"]
+        for target in ("node200", "node399", "missing"):
+            key = node_key(target)
+            queries.clear()
+            found = await iterative_lookup(origin, key, query, alpha=3)
+            
+            expected = sorted((n for n in ids if n != "node0"),
+                              key=lambda n: distance(node_key(n), key))[:8]
+            self.assertEqual([p.peer_id for p in found], expected)
+            self.assertLess(len(queries), 3 * math.log2(len(ids)) + 8)
+    
+    async def test_unresponsive_nodes_dropped(self):
+        """Test nodes that do not answer are removed from the table."""
+        table = RoutingTable("origin", k=4)
+        for i in range(4):
+            table.add(peer(f"n{i}"))
+        
+        async def query(contact):
+            """Only n0 answers."""
+            return [] if contact.peer_id == "n0" else None
+        
+        found = await iterative_lookup(table, node_key("x"), query)
+        self.assertEqual([p.peer_id for p in found], ["n0"])
+        self.assertEqual(len(table), 1)
+
+
+class TestP2PRouting(unittest.IsolatedAsyncioTestCase):
+    """Test cases for routing through P2PNetwork."""
+    
+    async def asyncSetUp(self):
+        """Start a small network."""
+        config = RoutingConfig(k=4, request_timeout=2.0)
+        self.nodes = [
+            P2PNetwork(f"r{i}", host="127.0.0.1", routing_config=config)
+            for i in range(6)
+        ]
+        for node in self.nodes:
+            await node.open()
+    
+    async def asyncTearDown(self):
+        """Stop all nodes."""
+        for node in self.nodes:
+            await node.close()
+    
+    async def test_bootstrap_and_find(self):
+        """Test nodes joining through one seed can find each other."""
+        seed = PeerInfo("r0", "127.0.0.1", self.nodes[0].port)
+        for node in self.nodes[1:]:
+            self.assertGreater(await node.bootstrap([seed]), 0)
+        
+        first, last = self.nodes[1], self.nodes[-1]
+        found = await last.find_node(first.node_id)
+        self.assertEqual(found[0].peer_id, first.node_id)
+        self.assertEqual(found[0].port, first.port)
+        
+        inbox = []
+        first.on_message(lambda p, m: inbox.append((p, m)))
+        self.assertTrue(await last.send(first.node_id, "found you"))
+        await wait_for(lambda: inbox)
+        self.assertEqual(inbox, [(last.node_id, "found you")])
+    
+    async def test_malformed_routing_messages_dropped(self):
+        """Test bad FIND_NODE and NODES frames are logged and dropped."""
+        a, b = self.nodes[0], self.nodes[1]
+        self.assertTrue(await b.connect(PeerInfo("r0", "127.0.0.1", a.port)))
+        connection = b.pool.get("r0")
+        pending = b._requests[99] = asyncio.get_running_loop().create_future()
+        
+        with self.assertLogs("services.networking.p2p", "WARNING") as logs:
+            for request in ({"id": 1}, {"id": 1, "key": "x" * 32}, {"key": bytes(32)}, "key"):
+                await b._send("r0", request, FRAME_FIND_NODE)
+            for reply in ({"nodes": []}, {"id": 99, "nodes": [["r2", "127.0.0.1"]]},
+                          {"id": 99, "nodes": [["r2", 7400, "127.0.0.1"]]}, [99]):
+                await a._send("r1", reply, FRAME_NODES)
+            await wait_for(lambda: len(logs.output) == 8)
+        
+        self.assertFalse(pending.done())
+        self.assertIs(b.pool.get("r0"), connection)
+        self.assertFalse(connection.is_closed)
+        del b._requests[99]
+        found = await b.find_node("r0")
+        self.assertEqual(found[0].peer_id, "r0")
+
+
+class TestLookupPeers(unittest.TestCase):
+    """Test cases for which lookup contacts become peers."""
+    
+    def test_lookup_contacts_not_peers(self):
+        """Test nodes found by lookups become peers only if admitted to a bucket."""
+        async def main():
+            """Bootstrap nodes with one contact per bucket."""
+            net = SimNetwork(SimConfig(latency=0.01))
+            config = RoutingConfig(k=1, request_timeout=2.0)
+            nodes = [net.create_node(f"c{i}", routing_config=config) for i in range(16)]
+            for node in nodes:
+                await node.open()
+            seed = PeerInfo("c0", nodes[0].host, nodes[0].port)
+            for node in nodes[1:]:
+                await node.bootstrap([seed])
+            
+            for node in nodes:
+                for peer_id in node.peers:
+                    self.assertTrue(peer_id == "c0" or node.routing.get(peer_id), peer_id)
+            self.assertTrue(any(len(node.pool.slots) > len(node.peers) for node in nodes))
+            await stop(nodes)
+        
+        simulate(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Multiplexed RPC
+
+Test coverage:
+- Calls, remote errors and unknown methods
+- Many concurrent calls over one connection
+- Timeouts and cancellation reaching the handler
+- Small calls interleaved with a large transfer
+- Oversized messages rejected
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import asyncio
+import random
+import unittest
+from services.networking.rpc import RpcConfig, RpcError, RpcProtocol
+from services.networking.simnet import SimConfig, SimNetwork
+from tests.networking.test_p2p import wait_for
+from tests.networking.test_simnet import simulate, start, stop
+
+
+async def pair(config=None, rpc_config=None):
+    """Connect a client and a server node with RPC on each."""
+    net = SimNetwork(config or SimConfig(latency=0.05))
+    server, client = await start(net, 2)
+    return net, (server, client), RpcProtocol(client, rpc_config), RpcProtocol(server, rpc_config)
+
+
+class TestRpcProtocol(unittest.TestCase):
+    """Test cases for RpcProtocol."""
+    
+    def test_call(self):
+        """Test results, handler errors and unknown methods."""
+        async def main():
+            """Call an echo and a failing method."""
+            net, nodes, client, server = await pair()
+            
+            async def echo(peer, params):
+                """Return the caller and parameters."""
+                return {"peer": peer, "params": params}
+            
+            async def fail(peer, params):
+                """Raise an error."""
+                raise ValueError("no such entry")
+            
+            server.register("echo", echo)
+            server.register("fail", fail)
+            with self.assertRaises(ValueError):
+                server.register("echo", echo)
+            
+            result = await client.call("s0", "echo", [1, "two", b"\x03"])
+            self.assertEqual(result, {"peer": "s1", "params": [1, "two", b"\x03"]})
+            with self.assertRaisesRegex(RpcError, "no such entry"):
+                await client.call("s0", "fail")
+            with self.assertRaisesRegex(RpcError, "Unknown RPC method"):
+                await client.call("s0", "missing")
+            
+            self.assertEqual(server.stats["served"], 1)
+            self.assertEqual(server.stats["errors"], 2)
+            self.assertEqual(client.get_status()["inflight"], 0)
+            await stop(nodes)
+        
+        simulate(main())
+    
+    def test_concurrent_calls_share_connection(self):
+        """Test concurrent calls complete out of order over one connection."""
+        async def main():
+            """Issue many calls whose handlers finish in random order."""
+            net, nodes, client, server = await pair(SimConfig(latency=0.05, jitter=0.01))
+            rng = random.Random(4)
+            
+            async def slow_square(peer, n):
+                """Square a number after a random delay."""
+                await asyncio.sleep(rng.uniform(0, 2))
+                return n * n
+            
+            server.register("square", slow_square)
+            connections = net.stats["connections"]
+            results = await asyncio.gather(*(client.call("s0", "square", n) for n in range(200)))
+            
+            self.assertEqual(results, [n * n for n in range(200)])
+            self.assertEqual(net.stats["connections"], connections)
+            await stop(nodes)
+        
+        simulate(main())
+    
+    def test_timeout_cancels_handler(self):
+        """Test a timed-out call cancels its handler at the peer."""
+        async def main():
+            """Time out a call to a handler that never finishes."""
+            net, nodes, client, server = await pair()
+            cancelled = []
+            
+            async def hang(peer, params):
+                """Wait forever, recording cancellation."""
+                try:
+                    await asyncio.sleep(3600)
+                except asyncio.CancelledError:
+                    cancelled.append(params)
+                    raise
+            
+            server.register("hang", hang)
+            with self.assertRaises(asyncio.TimeoutError):
+                await client.call("s0", "hang", "first", timeout=1.0)
+            await wait_for(lambda: cancelled)
+            
+            task = asyncio.ensure_future(client.call("s0", "hang", "second"))
+            await asyncio.sleep(1.0)
+            task.cancel()
+            await wait_for(lambda: len(cancelled) == 2)
+            
+            self.assertEqual(cancelled, ["first", "second"])
+            self.assertEqual(client.stats["timeouts"], 1)
+            self.assertEqual(client.stats["cancelled"], 1)
+            self.assertEqual(server.get_status()["serving"], 0)
+            await stop(nodes)
+        
+        simulate(main())
+    
+    def test_large_transfer_does_not_block(self):
+        """Test small calls are answered while a large response is sent."""
+        async def main():
+            """Ping a server that is streaming a large blob back."""
+            net, nodes, client, server = await pair(
+                SimConfig(latency=0.05, bandwidth=1024 * 1024)
+            )
+            blob = random.Random(1).randbytes(8 * 1024 * 1024)
+            
+            async def get_blob(peer, params):
+                """Return the blob."""
+                return blob
+            
+            async def ping(peer, params):
+                """Answer immediately."""
+                return "pong"
+            
+            server.register("blob", get_blob)
+            server.register("ping", ping)
+            loop = asyncio.get_running_loop()
+            began = loop.time()
+            transfer = asyncio.ensure_future(client.call("s0", "blob", timeout=60))
+            await asyncio.sleep(1.0)
+            
+            pings = []
+            for _ in range(5):
+                sent = loop.time()
+                self.assertEqual(await client.call("s0", "ping"), "pong")
+                pings.append(loop.time() - sent)
+            
+            self.assertEqual(await transfer, blob)
+            self.assertGreater(loop.time() - began, 7.0)
+            await stop(nodes)
+            return pings
+        
+        self.assertLess(max(simulate(main())), 0.5)
+    
+    def test_oversized_rejected(self):
+        """Test messages over the size limit are refused."""
+        async def main():
+            """Send a request and receive a response that are too large."""
+            config = RpcConfig(chunk_size=1024, max_message_size=16 * 1024)
+            net, nodes, client, server = await pair(rpc_config=config)
+            
+            async def size(peer, params):
+                """Return the request size, or a large reply."""
+                return bytes(params) if isinstance(params, int) else len(params)
+            
+            server.register("size", size)
+            self.assertEqual(await client.call("s0", "size", bytes(8 * 1024)), 8 * 1024)
+            with self.assertRaisesRegex(RpcError, "request exceeds"):
+                await client.call("s0", "size", bytes(32 * 1024))
+            with self.assertRaisesRegex(RpcError, "response exceeds"):
+                await client.call("s0", "size", 32 * 1024)
+            self.assertEqual(await client.call("s0", "size", b"ok"), 2)
+            await stop(nodes)
+        
+        simulate(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
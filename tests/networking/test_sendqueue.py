@@ -0,0 +1,196 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Per-Peer Send Queues
+
+Test coverage:
+- In-order delivery and batch framing
+- Coalescing of small messages
+- Block and drop policies at the high-water mark
+- Isolation of slow peers from fast ones
+- Queue metrics
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import asyncio
+import unittest
+from services.networking.p2p import P2PNetwork, PeerInfo
+from services.networking.sendqueue import SendQueue, SendQueueConfig, split_batch
+from tests.networking.test_p2p import wait_for
+
+BATCH = 0x08
+
+
+class FakeConnection:
+    """Stand-in for FramedConnection that can be paused like a slow peer."""
+    
+    def __init__(self):
+        """Create an open, writable connection."""
+        self.frames = []
+        self.is_closed = False
+        self.writable = asyncio.Event()
+        self.writable.set()
+    
+    def send_parts(self, parts, messages=1):
+        """Record a frame."""
+        self.frames.append(b"".join(bytes(p) for p in parts))
+    
+    async def drain(self):
+        """Wait while paused."""
+        await self.writable.wait()
+    
+    def messages(self):
+        """All messages written, with batches unpacked."""
+        out = []
+        for frame in self.frames:
+            if frame[0] == BATCH:
+                out.extend(bytes(m) for m in split_batch(frame[1:]))
+            else:
+                out.append(frame)
+        return out
+
+
+class TestSendQueue(unittest.IsolatedAsyncioTestCase):
+    """Test cases for SendQueue."""
+    
+    def make_queue(self, **options):
+        """Queue writing to a fake connection."""
+        connection = self.connection = FakeConnection()
+        
+        async def connect():
+            """Return the fake connection."""
+            return connection
+        
+        return SendQueue(connect, BATCH, SendQueueConfig(**options))
+    
+    async def test_coalesces_small_messages(self):
+        """Test a burst of small messages goes out in few frames, in order."""
+        queue = self.make_queue(coalesce_max_bytes=1000)
+        messages = [b"\x01" + bytes([i]) * 10 for i in range(50)]
+        for message in messages:
+            await queue.put([message])
+        
+        await wait_for(lambda: queue.depth == 0 and queue.messages_sent == 50)
+        self.assertEqual(self.connection.messages(), messages)
+        self.assertLess(len(self.connection.frames), 5)
+        self.assertEqual(queue.get_status()["frames_sent"], len(self.connection.frames))
+    
+    async def test_large_messages_not_batched(self):
+        """Test messages above the coalescing limit are sent as their own frame."""
+        queue = self.make_queue(coalesce_max_bytes=100)
+        big = b"\x01" + b"x" * 500
+        await queue.put([big])
+        await queue.put([big])
+        
+        await wait_for(lambda: queue.messages_sent == 2)
+        self.assertEqual(self.connection.frames, [big, big])
+    
+    async def test_drop_policy(self):
+        """Test a stalled peer's queue rejects messages past the high-water mark."""
+        queue = self.make_queue(high_water=1000, low_water=200, policy="drop")
+        self.connection.writable.clear()
+        
+        accepted = [await queue.put([b"\x01" + b"x" * 99]) for _ in range(30)]
+        self.assertLessEqual(queue.queued_bytes, 1000 + 100)
+        self.assertIn(False, accepted)
+        self.assertTrue(queue.is_congested)
+        self.assertEqual(queue.dropped, accepted.count(False))
+        
+        self.connection.writable.set()
+        await wait_for(lambda: queue.depth == 0)
+        self.assertFalse(queue.is_congested)
+        self.assertEqual(len(self.connection.messages()), accepted.count(True))
+    
+    async def test_block_policy(self):
+        """Test senders wait at the high-water mark and resume at low water."""
+        queue = self.make_queue(high_water=1000, low_water=200, coalesce_max_bytes=100)
+        self.connection.writable.clear()
+        
+        async def produce():
+            """Queue more than the high-water mark."""
+            for _ in range(30):
+                await queue.put([b"\x01" + b"x" * 99])
+        
+        producer = asyncio.ensure_future(produce())
+        await wait_for(lambda: queue.is_congested)
+        await asyncio.sleep(0.05)
+        self.assertFalse(producer.done())
+        self.assertLessEqual(queue.queued_bytes, 1000)
+        
+        self.connection.writable.set()
+        await asyncio.wait_for(producer, 5)
+        await wait_for(lambda: queue.depth == 0)
+        self.assertEqual(queue.messages_sent, 30)
+        self.assertEqual(queue.dropped, 0)
+    
+    async def test_slow_peer_isolated(self):
+        """Test a stalled peer does not hold up sends to another peer."""
+        slow = self.make_queue(high_water=1000, low_water=200, policy="drop")
+        slow_connection = self.connection
+        fast = self.make_queue()
+        slow_connection.writable.clear()
+        
+        for i in range(100):
+            await slow.put([b"\x01" + b"s" * 99])
+            await fast.put([b"\x01" + bytes([i])])
+        
+        await wait_for(lambda: fast.messages_sent == 100)
+        self.assertEqual(slow.messages_sent, 0)
+        self.assertLessEqual(slow.queued_bytes, 1000 + 100)
+    
+    async def test_unreachable_peer_discards(self):
+        """Test queued messages are dropped when the peer cannot be reached."""
+        async def connect():
+            """Peer is gone."""
+            return None
+        
+        queue = SendQueue(connect, BATCH)
+        await queue.put([b"\x01a"])
+        await wait_for(lambda: queue.depth == 0)
+        self.assertEqual(queue.dropped, 1)
+        self.assertEqual(queue.queued_bytes, 0)
+    
+    def test_unknown_policy(self):
+        """Test an unknown policy is rejected."""
+        with self.assertRaises(ValueError):
+            SendQueue(None, BATCH, SendQueueConfig(policy="spill"))
+
+
+class TestP2PSendQueues(unittest.IsolatedAsyncioTestCase):
+    """Test cases for send queues through P2PNetwork."""
+    
+    async def test_burst_coalesced_over_loopback(self):
+        """Test a burst of sends arrives complete and in order in few frames."""
+        a = P2PNetwork("qa", host="127.0.0.1")
+        b = P2PNetwork("qb", host="127.0.0.1")
+        inbox = []
+        b.on_message(lambda peer, msg: inbox.append(msg))
+        try:
+            await a.open()
+            await b.open()
+            await a.connect(PeerInfo("qb", "127.0.0.1", b.port))
+            
+            for i in range(200):
+                await a.send("qb", {"seq": i})
+            await wait_for(lambda: len(inbox) == 200)
+            
+            self.assertEqual([m["seq"] for m in inbox], list(range(200)))
+            stats = a.get_queue_stats()["qb"]
+            self.assertEqual(stats["messages_sent"], 200)
+            self.assertLess(stats["frames_sent"], 50)
+        finally:
+            await a.close()
+            await b.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
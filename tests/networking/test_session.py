@@ -0,0 +1,323 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Secure Sessions
+
+Test coverage:
+- Frame encryption, counters and tamper detection
+- Full handshake between nodes, with traffic encrypted on the wire
+- Ticket resumption on reconnect, and fallback when a ticket is refused
+- Replayed tickets refused
+- Silent inbound peers dropped after the handshake timeout
+- Public key pinning
+- Cipher switching part way through a read
+- No compression under encryption
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import asyncio
+import unittest
+from services.networking.compression import StreamCompressor
+from services.networking.p2p import PeerInfo
+from services.networking.session import (
+    CRYPTO_AVAILABLE, FrameCipher, NodeIdentity, SessionConfig
+)
+from services.networking.simnet import SimConfig, SimNetwork
+from services.networking.transport import FrameDecoder, FrameError, FramedConnection
+from tests.networking.test_p2p import wait_for
+from tests.networking.test_simnet import simulate, stop
+
+
+async def secure_pair(net, config=None, server_key=None):
+    """Open two nodes with identities, the second connected to the first."""
+    server = net.create_node("s0", identity=NodeIdentity(), session_config=config)
+    client = net.create_node("s1", identity=NodeIdentity(), session_config=config)
+    await server.open()
+    await client.open()
+    connected = await client.connect(PeerInfo("s0", server.host, server.port, public_key=server_key))
+    return server, client, connected
+
+
+class XorCipher:
+    """Toy cipher that flips every byte, for transport tests."""
+    
+    def encrypt(self, payload):
+        """Flip payload bytes."""
+        return bytes(b ^ 0xFF for b in payload)
+    
+    def decrypt(self, payload):
+        """Flip payload bytes back."""
+        return bytes(b ^ 0xFF for b in payload)
+
+
+class RecordingTransport:
+    """Transport that keeps everything written to it."""
+    
+    def __init__(self):
+        """Initialize with nothing written."""
+        self.written = bytearray()
+    
+    def write(self, data):
+        """Record data."""
+        self.written.extend(data)
+    
+    def writelines(self, parts):
+        """Record each part."""
+        for part in parts:
+            self.written.extend(part)
+    
+    def is_closing(self):
+        """Never closing."""
+        return False
+
+
+def framed():
+    """Create a connection that records the frames it sends."""
+    connection = FramedConnection(lambda conn, frame: None)
+    connection.transport = RecordingTransport()
+    return connection
+
+
+class TestCipherSwitch(unittest.TestCase):
+    """Test cases for installing a cipher on a frame stream."""
+    
+    def test_cipher_applies_to_later_frames_in_same_read(self):
+        """Test a cipher set while handling a frame decrypts the rest of the read."""
+        plain = framed()
+        plain.send_frame(b"hello")
+        plain.cipher = XorCipher()
+        plain.send_frame(b"secret")
+        
+        decoder = FrameDecoder(1024)
+        frames = decoder.frames(bytes(plain.transport.written))
+        self.assertEqual(next(frames), b"hello")
+        decoder.cipher = XorCipher()
+        self.assertEqual(list(frames), [b"secret"])
+    
+    def test_plaintext_rejected_after_cipher(self):
+        """Test unencrypted frames are refused once a cipher is installed."""
+        plain = framed()
+        plain.send_frame(b"sneaky")
+        
+        decoder = FrameDecoder(1024)
+        decoder.cipher = XorCipher()
+        with self.assertRaises(FrameError):
+            decoder.feed(bytes(plain.transport.written))
+    
+    def test_encrypted_frames_not_compressed(self):
+        """Test a compressor is bypassed once a cipher is installed."""
+        secure = framed()
+        secure.compressor = StreamCompressor()
+        secure.cipher = XorCipher()
+        secure.send_frame(b"secret=" * 100)
+        
+        decoder = FrameDecoder(1024)
+        decoder.cipher = XorCipher()
+        self.assertEqual(decoder.feed(bytes(secure.transport.written)), [b"secret=" * 100])
+        self.assertEqual(secure.compressor.bytes_in, 0)
+
+
+@unittest.skipUnless(CRYPTO_AVAILABLE, "cryptography not installed")
+class TestFrameCipher(unittest.TestCase):
+    """Test cases for FrameCipher."""
+    
+    def test_round_trip_and_tamper(self):
+        """Test frames decrypt in order and altered or replayed frames fail."""
+        a_to_b, b_to_a = os.urandom(32), os.urandom(32)
+        a = FrameCipher(a_to_b, b_to_a)
+        b = FrameCipher(b_to_a, a_to_b)
+        
+        first, second = a.encrypt(b"one"), a.encrypt(b"two")
+        self.assertNotIn(b"one", first)
+        self.assertEqual(b.decrypt(first), b"one")
+        with self.assertRaises(ValueError):
+            b.decrypt(first)
+        
+        tampered = bytearray(second)
+        tampered[-1] ^= 1
+        with self.assertRaises(ValueError):
+            FrameCipher(b_to_a, a_to_b).decrypt(bytes(tampered))
+        self.assertEqual(b.decrypt(second), b"two")
+        self.assertEqual(a.decrypt(b.encrypt(b"back")), b"back")
+
+
+@unittest.skipUnless(CRYPTO_AVAILABLE, "cryptography not installed")
+class TestSecureSessions(unittest.TestCase):
+    """Test cases for SessionManager on a simulated network."""
+    
+    def test_handshake_encrypts_traffic(self):
+        """Test nodes authenticate each other and messages travel encrypted."""
+        async def main():
+            """Exchange messages and inspect the wire."""
+            net = SimNetwork(SimConfig(latency=0.01))
+            server, client, connected = await secure_pair(net)
+            self.assertTrue(connected)
+            
+            wire = []
+            connection = client.pool.get("s0")
+            write = connection.transport.write
+            connection.transport.write = lambda data: (wire.append(bytes(data)), write(data))
+            
+            received = []
+            server.on_message(lambda peer, msg: received.append((peer, msg)))
+            client.on_message(lambda peer, msg: received.append((peer, msg)))
+            await client.send("s0", {"text": "plaintext marker"})
+            await wait_for(lambda: received)
+            await server.send("s1", "reply")
+            await wait_for(lambda: len(received) == 2)
+            
+            self.assertEqual(received, [("s1", {"text": "plaintext marker"}), ("s0", "reply")])
+            self.assertNotIn(b"plaintext marker", b"".join(wire))
+            self.assertEqual(server.peers["s1"].public_key, client.sessions.identity.public_key)
+            self.assertEqual(client.peers["s0"].public_key, server.sessions.identity.public_key)
+            self.assertEqual(server.sessions.stats["full_handshakes"], 1)
+            self.assertEqual(client.sessions.get_status()["tickets_held"], 1)
+            self.assertIsNone(connection.compressor)
+            self.assertIsNone(server.pool.get("s1").compressor)
+            await stop([server, client])
+        
+        simulate(main())
+    
+    def test_reconnect_resumes_with_ticket(self):
+        """Test a reconnect resumes the session without a new handshake."""
+        async def main():
+            """Drop the link and send again, twice."""
+            net = SimNetwork(SimConfig(latency=0.01))
+            server, client, _ = await secure_pair(net)
+            received = []
+            server.on_message(lambda peer, msg: received.append(msg))
+            
+            for i in range(2):
+                client.pool.get("s0").close()
+                await asyncio.sleep(1)
+                self.assertTrue(await client.send("s0", i))
+                await wait_for(lambda: len(received) == i + 1)
+            
+            self.assertEqual(received, [0, 1])
+            self.assertEqual(server.sessions.stats["full_handshakes"], 1)
+            self.assertEqual(server.sessions.stats["resumed"], 2)
+            self.assertEqual(server.sessions.stats["tickets_issued"], 3)
+            await stop([server, client])
+        
+        simulate(main())
+    
+    def test_refused_ticket_falls_back(self):
+        """Test an expired ticket leads to a full handshake."""
+        async def main():
+            """Reconnect after the ticket has expired at the server."""
+            net = SimNetwork(SimConfig(latency=0.01))
+            server, client, _ = await secure_pair(net, SessionConfig(ticket_lifetime=1.0))
+            await asyncio.sleep(2)
+            # Keep the client offering the ticket past its expiry
+            ticket = client.sessions.tickets["s0"]
+            client.sessions.tickets["s0"] = ticket[:2] + (ticket[2] + 3600,) + ticket[3:]
+            client.pool.get("s0").close()
+            await asyncio.sleep(1)
+            self.assertTrue(await client.send("s0", "after"))
+            
+            self.assertEqual(server.sessions.stats["tickets_rejected"], 1)
+            self.assertEqual(server.sessions.stats["full_handshakes"], 2)
+            await stop([server, client])
+        
+        simulate(main())
+    
+    def test_replayed_ticket_refused(self):
+        """Test a ticket is only accepted once."""
+        async def main():
+            """Resume with a ticket, then present the same ticket again."""
+            net = SimNetwork(SimConfig(latency=0.01))
+            server, client, _ = await secure_pair(net)
+            captured = client.sessions.tickets["s0"]
+            client.pool.get("s0").close()
+            await asyncio.sleep(1)
+            self.assertTrue(await client.send("s0", "resumed"))
+            self.assertEqual(server.sessions.stats["resumed"], 1)
+            
+            client.sessions.tickets["s0"] = captured
+            client.pool.get("s0").close()
+            await asyncio.sleep(1)
+            self.assertTrue(await client.send("s0", "replayed"))
+            
+            self.assertEqual(server.sessions.stats["resumed"], 1)
+            self.assertEqual(server.sessions.stats["tickets_rejected"], 1)
+            self.assertEqual(server.sessions.stats["full_handshakes"], 2)
+            await stop([server, client])
+        
+        simulate(main())
+    
+    def test_key_mismatch_refused(self):
+        """Test a peer presenting an unexpected key is not connected."""
+        async def main():
+            """Connect expecting a different key, then require known keys."""
+            net = SimNetwork(SimConfig(latency=0.01))
+            server, client, connected = await secure_pair(
+                net, server_key=NodeIdentity().public_key
+            )
+            self.assertFalse(connected)
+            self.assertGreaterEqual(client.sessions.stats["failures"], 1)
+            await stop([server, client])
+            
+            net = SimNetwork(SimConfig(latency=0.01))
+            server, client, connected = await secure_pair(
+                net, SessionConfig(require_known_keys=True, handshake_timeout=2.0)
+            )
+            self.assertFalse(connected)
+            self.assertNotIn("s1", server.peers)
+            await stop([server, client])
+        
+        simulate(main())
+    
+    def test_silent_inbound_peer_dropped(self):
+        """Test a peer that connects but never handshakes is disconnected."""
+        async def main():
+            """Open a raw connection to a secure node and send nothing."""
+            net = SimNetwork(SimConfig(latency=0.01))
+            server = net.create_node(
+                "s0", identity=NodeIdentity(), session_config=SessionConfig(handshake_timeout=2.0)
+            )
+            silent = net.create_node("silent")
+            await server.open()
+            closed = []
+            await silent.transport.connect(server.host, server.port, lambda: FramedConnection(
+                on_frame=lambda connection, frame: None,
+                on_close=closed.append
+            ))
+            
+            await asyncio.sleep(1)
+            self.assertEqual(closed, [])
+            await wait_for(lambda: closed)
+            self.assertEqual(server.sessions.stats["failures"], 1)
+            self.assertEqual(server.sessions._accepting, {})
+            await stop([server, silent])
+        
+        simulate(main())
+    
+    def test_plaintext_peer_rejected(self):
+        """Test a node without an identity cannot talk to one with sessions."""
+        async def main():
+            """Connect a plain node to a secure one."""
+            net = SimNetwork(SimConfig(latency=0.01))
+            server = net.create_node("s0", identity=NodeIdentity())
+            plain = net.create_node("plain")
+            await server.open()
+            await plain.open()
+            await plain.connect(PeerInfo("s0", server.host, server.port))
+            await plain.send("s0", "hello?")
+            await asyncio.sleep(1)
+            self.assertNotIn("plain", server.peers)
+            await stop([server, plain])
+        
+        simulate(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
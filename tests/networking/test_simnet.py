@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Simulated Network
+
+Test coverage:
+- Virtual clock
+- Latency, jitter and in-order delivery
+- Bandwidth limits and writer backpressure
+- Loss as retransmission delay
+- Partitions and healing
+- Gossip across hundreds of simulated nodes
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import asyncio
+import random
+import time
+import unittest
+from services.networking.p2p import PeerInfo
+from services.networking.simnet import SimConfig, SimNetwork, VirtualEventLoop
+from tests.networking.test_p2p import wait_for
+
+
+def simulate(coro):
+    """Run a coroutine on a fresh virtual-time loop."""
+    with asyncio.Runner(loop_factory=VirtualEventLoop) as runner:
+        return runner.run(coro)
+
+
+async def start(net, count):
+    """Create and open nodes, connecting each to the previous one."""
+    nodes = [net.create_node(f"s{i}") for i in range(count)]
+    for node in nodes:
+        await node.open()
+    await asyncio.gather(*(
+        node.connect(PeerInfo(prev.node_id, prev.host, prev.port))
+        for prev, node in zip(nodes, nodes[1:])
+    ))
+    return nodes
+
+
+async def stop(nodes):
+    """Close nodes."""
+    for node in nodes:
+        await node.close()
+
+
+class TestVirtualEventLoop(unittest.TestCase):
+    """Test cases for VirtualEventLoop."""
+    
+    def test_sleep_takes_no_wall_time(self):
+        """Test an hour of sleeping completes immediately."""
+        async def main():
+            """Sleep and timeout on the virtual clock."""
+            loop = asyncio.get_running_loop()
+            await asyncio.sleep(3600)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.sleep(10), 5)
+            return loop.time()
+        
+        began = time.monotonic()
+        self.assertAlmostEqual(simulate(main()), 3605, places=3)
+        self.assertLess(time.monotonic() - began, 1.0)
+
+
+class TestSimNetwork(unittest.TestCase):
+    """Test cases for SimNetwork links between P2P nodes."""
+    
+    def test_latency(self):
+        """Test messages arrive one link latency after they are sent."""
+        async def main():
+            """Time one message between two nodes."""
+            net = SimNetwork(SimConfig(latency=0.25))
+            a, b = await start(net, 2)
+            arrivals = []
+            a.on_message(lambda peer, msg: arrivals.append(asyncio.get_running_loop().time()))
+            sent = asyncio.get_running_loop().time()
+            await b.send(a.node_id, {"ping": 1})
+            await wait_for(lambda: arrivals)
+            await stop([a, b])
+            return arrivals[0] - sent
+        
+        self.assertAlmostEqual(simulate(main()), 0.25, delta=0.01)
+    
+    def test_jitter_keeps_order(self):
+        """Test jittered writes are still delivered as a stream."""
+        async def main():
+            """Send a burst of messages over a jittery link."""
+            net = SimNetwork(SimConfig(latency=0.01, jitter=0.05, seed=7))
+            a, b = await start(net, 2)
+            inbox = []
+            a.on_message(lambda peer, msg: inbox.append(msg))
+            for i in range(200):
+                await b.send(a.node_id, i)
+                await asyncio.sleep(0.001)
+            await wait_for(lambda: len(inbox) == 200)
+            await stop([a, b])
+            return inbox
+        
+        self.assertEqual(simulate(main()), list(range(200)))
+    
+    def test_bandwidth_backpressure(self):
+        """Test a bandwidth-limited link holds writes back in the send queue."""
+        async def main():
+            """Queue a megabyte on a link that carries 100 KB per second."""
+            net = SimNetwork(SimConfig(latency=0.01, bandwidth=100 * 1024))
+            a, b = await start(net, 2)
+            inbox = []
+            a.on_message(lambda peer, msg: inbox.append(msg))
+            loop = asyncio.get_running_loop()
+            began = loop.time()
+            for i in range(10):
+                await b.send(a.node_id, bytes(100 * 1024))
+            await asyncio.sleep(0.1)
+            queued = b.queues[a.node_id].queued_bytes
+            await b.wait_queued(a.node_id, 0)
+            drained = loop.time() - began
+            await wait_for(lambda: len(inbox) == 10)
+            await stop([a, b])
+            return queued, drained
+        
+        queued, drained = simulate(main())
+        self.assertGreater(queued, 800 * 1024)
+        self.assertGreater(drained, 8.0)
+    
+    def test_loss_delays_delivery(self):
+        """Test lost packets are retransmitted rather than dropped."""
+        async def main():
+            """Send over a lossy link."""
+            net = SimNetwork(SimConfig(latency=0.01, loss=0.5, seed=1))
+            a, b = await start(net, 2)
+            inbox = []
+            a.on_message(lambda peer, msg: inbox.append(msg))
+            for i in range(20):
+                await b.send(a.node_id, i)
+            await wait_for(lambda: len(inbox) == 20)
+            await stop([a, b])
+            return inbox, net.stats["retransmits"]
+        
+        inbox, retransmits = simulate(main())
+        self.assertEqual(inbox, list(range(20)))
+        self.assertGreater(retransmits, 0)
+    
+    def test_partition_and_heal(self):
+        """Test a partition cuts links and refuses connects until healed."""
+        async def main():
+            """Partition two nodes, then heal."""
+            net = SimNetwork()
+            a, b = await start(net, 2)
+            inbox = []
+            a.on_message(lambda peer, msg: inbox.append(msg))
+            
+            net.partition([a.host], [b.host])
+            await asyncio.sleep(1)
+            cut = await b.send(a.node_id, "during")
+            self.assertEqual(net.stats["severed"], 2)
+            
+            net.heal()
+            await asyncio.sleep(120)
+            self.assertTrue(await b.send(a.node_id, "after"))
+            await wait_for(lambda: "after" in inbox)
+            await stop([a, b])
+            return cut, inbox
+        
+        cut, inbox = simulate(main())
+        self.assertFalse(cut)
+        self.assertEqual(inbox, ["after"])
+    
+    def test_gossip_at_scale(self):
+        """Test gossip reaches every node of a few hundred."""
+        async def main():
+            """Publish from one node of a random mesh."""
+            net = SimNetwork(SimConfig(latency=0.05, jitter=0.02))
+            nodes = await start(net, 300)
+            rng = random.Random(3)
+            await asyncio.gather(*(
+                node.connect(PeerInfo(nodes[j].node_id, nodes[j].host, nodes[j].port))
+                for i, node in enumerate(nodes[3:], 3)
+                for j in rng.sample(range(i - 1), 2)
+            ))
+            
+            reached = set()
+            for node in nodes[1:]:
+                node.on_message(lambda peer, msg, node=node: reached.add(node.node_id))
+            loop = asyncio.get_running_loop()
+            began = loop.time()
+            await nodes[0].publish({"alert": "grid_fault"})
+            await wait_for(lambda: len(reached) == 299)
+            elapsed = loop.time() - began
+            await stop(nodes)
+            return elapsed
+        
+        self.assertLess(simulate(main()), 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Network Telemetry
+
+Test coverage:
+- Histogram percentile accuracy, range clamping and merging
+- Per-peer byte and message counters
+- RPC round-trip latency per peer
+- Reconnect counts and disabling telemetry
+- Counting over real TCP connections
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import asyncio
+import random
+import unittest
+from services.networking.p2p import P2PNetwork, PeerInfo
+from services.networking.rpc import RpcProtocol
+from services.networking.simnet import SimConfig, SimNetwork
+from services.networking.telemetry import LatencyHistogram, TelemetryConfig
+from tests.networking.test_p2p import wait_for
+from tests.networking.test_simnet import simulate, start, stop
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test cases for LatencyHistogram."""
+    
+    def test_percentiles_within_precision(self):
+        """Test percentiles are within the bucket precision of exact values."""
+        rng = random.Random(1)
+        samples = [rng.lognormvariate(-4, 1.5) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for sample in samples:
+            histogram.record(sample)
+        
+        samples.sort()
+        for q in (50, 90, 99, 99.9):
+            exact = samples[int(q / 100 * len(samples)) - 1]
+            self.assertAlmostEqual(histogram.percentile(q) / exact, 1.0, delta=1 / 32)
+        self.assertEqual(histogram.percentile(100), samples[-1])
+        self.assertEqual(histogram.count, len(samples))
+    
+    def test_empty_and_clamped(self):
+        """Test an empty histogram and samples beyond the range."""
+        histogram = LatencyHistogram(TelemetryConfig(max_latency=1.0))
+        self.assertEqual(histogram.get_status()["p99"], 0.0)
+        
+        histogram.record(0.0)
+        histogram.record(30.0)
+        self.assertEqual(histogram.percentile(50), 0.0)
+        self.assertEqual(histogram.max, 30.0)
+        self.assertGreater(histogram.percentile(100), 0.99)
+    
+    def test_merge(self):
+        """Test merged histograms match one fed every sample."""
+        rng = random.Random(2)
+        parts = [LatencyHistogram() for _ in range(3)]
+        whole = LatencyHistogram()
+        for _ in range(3000):
+            sample = rng.expovariate(20)
+            rng.choice(parts).record(sample)
+            whole.record(sample)
+        
+        merged = LatencyHistogram()
+        for part in parts:
+            merged.merge(part)
+        self.assertEqual(merged.counts, whole.counts)
+        self.assertEqual(merged.percentile(99), whole.percentile(99))
+        self.assertAlmostEqual(merged.get_status()["mean"], whole.get_status()["mean"])
+        with self.assertRaises(ValueError):
+            merged.merge(LatencyHistogram(TelemetryConfig(precision_bits=4)))
+
+
+class TestPeerTelemetry(unittest.TestCase):
+    """Test cases for P2PNetwork peer telemetry."""
+    
+    def test_traffic_counters(self):
+        """Test bytes and messages are counted on both ends of a link."""
+        async def main():
+            """Send messages both ways between two nodes."""
+            net = SimNetwork(SimConfig(latency=0.01))
+            a, b = await start(net, 2)
+            received = []
+            a.on_message(lambda peer, msg: received.append(msg))
+            b.on_message(lambda peer, msg: received.append(msg))
+            for i in range(50):
+                await b.send("s0", {"seq": i, "data": bytes(100)})
+            await wait_for(lambda: len(received) == 50)
+            await a.send("s1", "hi")
+            await wait_for(lambda: len(received) == 51)
+            await stop([a, b])
+            return a.get_peer_stats()["s1"], b.get_peer_stats()["s0"]
+        
+        at_a, at_b = simulate(main())
+        self.assertGreaterEqual(at_b["messages_out"], 50)
+        self.assertGreaterEqual(at_a["messages_in"], 50)
+        self.assertGreater(at_b["bytes_out"], 50 * 100)
+        # Hellos are sent before the link is attributed to a peer
+        self.assertAlmostEqual(at_a["bytes_in"], at_b["bytes_out"], delta=100)
+        self.assertAlmostEqual(at_b["bytes_in"], at_a["bytes_out"], delta=100)
+        self.assertEqual(at_b["queue_depth"], 0)
+        self.assertIsNone(at_a["rtt"])
+    
+    def test_rpc_round_trips(self):
+        """Test RPC round trips are recorded against the peer called."""
+        async def main():
+            """Call a peer over a slow link and a fast one."""
+            net = SimNetwork(SimConfig(latency=0.01))
+            hub, near, far = await start(net, 3)
+            net.set_link(near.host, far.host, latency=0.1)
+            RpcProtocol(hub).register("ping", lambda peer, params: asyncio.sleep(0, "pong"))
+            RpcProtocol(far).register("ping", lambda peer, params: asyncio.sleep(0, "pong"))
+            rpc = RpcProtocol(near)
+            for _ in range(20):
+                await rpc.call("s0", "ping")
+                await rpc.call("s2", "ping")
+            await stop([hub, near, far])
+            return near.get_peer_stats(), near.telemetry.rtt()
+        
+        stats, overall = simulate(main())
+        self.assertEqual(stats["s0"]["rtt"]["count"], 20)
+        self.assertAlmostEqual(stats["s0"]["rtt"]["p50"], 0.02, delta=0.005)
+        self.assertAlmostEqual(stats["s2"]["rtt"]["p99"], 0.2, delta=0.01)
+        self.assertEqual(overall.count, 40)
+    
+    def test_reconnects_and_disabled(self):
+        """Test reconnects are counted, and nothing is counted when disabled."""
+        async def main():
+            """Drop a link and send again."""
+            net = SimNetwork(SimConfig(latency=0.01))
+            a, b = await start(net, 2)
+            quiet = net.create_node("quiet", telemetry_config=TelemetryConfig(enabled=False))
+            await quiet.open()
+            await quiet.connect(PeerInfo(a.node_id, a.host, a.port))
+            b.pool.get("s0").close()
+            await asyncio.sleep(1)
+            await b.send("s0", "again")
+            await asyncio.sleep(1)
+            await stop([a, b, quiet])
+            return b.get_peer_stats()["s0"], quiet.get_peer_stats()
+        
+        stats, quiet = simulate(main())
+        self.assertEqual(stats["reconnects"], 1)
+        self.assertEqual(quiet, {})
+
+
+class TestTcpTelemetry(unittest.IsolatedAsyncioTestCase):
+    """Test cases for peer telemetry over loopback."""
+    
+    async def test_fresh_connection(self):
+        """Test one connect counts no reconnects and meters the dialler's hello."""
+        a = P2PNetwork("node0", host="127.0.0.1")
+        b = P2PNetwork("node1", host="127.0.0.1")
+        await a.open()
+        await b.open()
+        try:
+            self.assertTrue(await a.connect(PeerInfo("node1", "127.0.0.1", b.port)))
+            await wait_for(lambda: "node0" in b.pool.slots)
+            await wait_for(lambda: a.get_peer_stats()["node1"]["bytes_in"] > 0)
+            
+            stats = a.get_peer_stats()["node1"]
+            self.assertEqual(stats["reconnects"], 0)
+            self.assertEqual(b.get_peer_stats()["node0"]["reconnects"], 0)
+            # Both hellos crossed the dialled connection, which is metered
+            # from its first byte
+            self.assertGreater(stats["bytes_out"], 0)
+            self.assertEqual(a.pool.slots["node1"].connections, 1)
+        finally:
+            await a.close()
+            await b.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
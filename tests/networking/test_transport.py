@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Framed Transport
+
+Test coverage:
+- Frame encoding and decoding
+- Partial and coalesced reads
+- Oversized frame rejection
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import unittest
+from services.networking.transport import FrameDecoder, FrameError, encode_frame
+
+
+class TestFrameDecoder(unittest.TestCase):
+    """Test cases for FrameDecoder."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.decoder = FrameDecoder(max_frame_size=1024)
+    
+    def test_single_frame(self):
+        """Test decoding one complete frame."""
+        self.assertEqual(self.decoder.feed(encode_frame(b"hello")), [b"hello"])
+        self.assertEqual(self.decoder.buffered, 0)
+    
+    def test_byte_at_a_time(self):
+        """Test frames split across many reads."""
+        stream = encode_frame(b"hello") + encode_frame(b"") + encode_frame(b"world")
+        frames = []
+        for i in range(len(stream)):
+            frames.extend(self.decoder.feed(stream[i:i + 1]))
+        
+        self.assertEqual(frames, [b"hello", b"", b"world"])
+    
+    def test_coalesced_reads(self):
+        """Test several frames and a partial frame in one read."""
+        stream = encode_frame(b"a") + encode_frame(b"bb") + encode_frame(b"ccc")
+        
+        self.assertEqual(self.decoder.feed(stream[:-2]), [b"a", b"bb"])
+        self.assertEqual(self.decoder.feed(stream[-2:]), [b"ccc"])
+    
+    def test_oversized_frame(self):
+        """Test frames above the limit are rejected."""
+        with self.assertRaises(FrameError):
+            self.decoder.feed(encode_frame(b"x" * 2048))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,7 @@ Test coverage:
 - State management
 - Error handling
 - Audit logging
+- Audit payloads stored by reference
 """
 
 import sys
@@ -22,7 +23,10 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
 import unittest
-from sovereign.runtime import SovereignRuntime, RuntimeConfig, RuntimeState
+from unittest.mock import patch
+from src.sovereign.runtime import SovereignRuntime, RuntimeConfig, RuntimeState
+from src.services.ledger.ledger import PAYLOAD_REF
+from src.services.storage.cas import ContentAddressedStorage
 
 
 class TestSovereignRuntime(unittest.TestCase):
@@ -83,6 +87,32 @@ class TestSovereignRuntime(unittest.TestCase):
         result = self.runtime.process(input_data)
         
         self.assertTrue(result["ethics_verified"])
+    
+    def test_large_audit_payloads_by_reference(self):
+        """Test large audit payloads go to the payload store."""
+        store = ContentAddressedStorage()
+        config = RuntimeConfig(
+            require_human_approval=False,
+            audit_payload_threshold=512
+        )
+        runtime = SovereignRuntime(config, payload_store=store)
+        
+        runtime.process({"blob": "x" * 4096})
+        
+        trail = runtime.get_audit_trail()
+        start = next(e for e in trail if e["event"] == "process_start")
+        self.assertIn(PAYLOAD_REF, start["data"])
+        self.assertTrue(store.has(start["data"][PAYLOAD_REF]))
+    
+    def test_audit_payloads_inline_without_store(self):
+        """Test audit data is recorded as given without a payload store."""
+        with patch("src.sovereign.runtime.offload_payload") as offload:
+            self.runtime.process({"blob": "x" * 8192})
+        
+        offload.assert_not_called()
+        trail = self.runtime.get_audit_trail()
+        start = next(e for e in trail if e["event"] == "process_start")
+        self.assertEqual(start["data"], {"input": {"blob": "x" * 8192}})
 
 
 class TestRuntimeConfig(unittest.TestCase):
@@ -0,0 +1,288 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+#
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for Content-Addressed Storage
+
+Test coverage:
+- Put/get round trips
+- Batch put and verify
+- Disk-backed storage and zero-copy views
+- Chunked objects and byte-range reads
+- Existence checks, metadata and deduplicated puts
+- Integrity verification
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import hashlib
+import tempfile
+import unittest
+from unittest import mock
+from services.storage.cas import ContentAddressedStorage, IntegrityError
+
+
+class TestContentAddressedStorage(unittest.TestCase):
+    """Test cases for ContentAddressedStorage."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cas = ContentAddressedStorage()
+
+    def test_put_get(self):
+        """Test storing and retrieving an object."""
+        address = self.cas.put(b"hello")
+
+        self.assertEqual(address, hashlib.sha256(b"hello").hexdigest())
+        self.assertEqual(self.cas.get(address), b"hello")
+
+    def test_verify(self):
+        """Test verification of data against its address."""
+        address = self.cas.put(b"hello")
+
+        self.assertTrue(self.cas.verify(address, b"hello"))
+        self.assertFalse(self.cas.verify(address, b"tampered"))
+
+
+class TestBatchOperations(unittest.TestCase):
+    """Test cases for put_many and verify_many."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cas = ContentAddressedStorage()
+        # Large enough to take the thread pool path
+        self.blobs = [bytes([i]) * (512 * 1024) for i in range(6)]
+
+    def test_put_many_preserves_order(self):
+        """Test addresses come back in input order."""
+        addresses = self.cas.put_many(self.blobs, max_workers=4)
+
+        expected = [hashlib.sha256(b).hexdigest() for b in self.blobs]
+        self.assertEqual(addresses, expected)
+        for address, blob in zip(addresses, self.blobs):
+            self.assertEqual(self.cas.get(address), blob)
+
+    def test_put_many_small_batch(self):
+        """Test small batches hashed inline give the same result."""
+        addresses = self.cas.put_many([b"a", b"b", b"a"])
+
+        self.assertEqual(addresses[0], addresses[2])
+        self.assertEqual(len(self.cas.store), 2)
+
+    def test_put_many_empty(self):
+        """Test an empty batch."""
+        self.assertEqual(self.cas.put_many([]), [])
+
+    def test_verify_many(self):
+        """Test batch verification flags mismatches in place."""
+        addresses = self.cas.put_many(self.blobs, max_workers=4)
+        pairs = list(zip(addresses, self.blobs))
+        pairs[2] = (addresses[2], b"tampered")
+
+        results = self.cas.verify_many(pairs, max_workers=4)
+
+        self.assertEqual(results, [True, True, False, True, True, True])
+
+
+class TestZeroCopyViews(unittest.TestCase):
+    """Test cases for get_view on memory and disk backends."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_memory_view_is_readonly(self):
+        """Test in-memory views expose the stored buffer read-only."""
+        cas = ContentAddressedStorage()
+        address = cas.put(b"weights")
+
+        view = cas.get_view(address)
+
+        self.assertTrue(view.readonly)
+        self.assertEqual(view.tobytes(), b"weights")
+        self.assertIs(view.obj, cas.store[address])
+
+    def test_disk_round_trip(self):
+        """Test disk-resident objects persist across instances."""
+        address = ContentAddressedStorage(self.tmpdir.name).put(b"persisted")
+
+        reopened = ContentAddressedStorage(self.tmpdir.name)
+
+        self.assertEqual(reopened.get(address), b"persisted")
+
+    def test_disk_view_is_mmap(self):
+        """Test disk views are memory-mapped and read-only."""
+        cas = ContentAddressedStorage(self.tmpdir.name)
+        blob = os.urandom(256 * 1024)
+        address = cas.put(blob)
+
+        view = cas.get_view(address)
+
+        self.assertTrue(view.readonly)
+        self.assertEqual(view[:16].tobytes(), blob[:16])
+        self.assertEqual(bytes(view), blob)
+        with self.assertRaises(TypeError):
+            view[0] = 0
+
+    def test_disk_view_empty_object(self):
+        """Test zero-length objects yield an empty view."""
+        cas = ContentAddressedStorage(self.tmpdir.name)
+        address = cas.put(b"")
+
+        self.assertEqual(len(cas.get_view(address)), 0)
+
+    def test_view_missing(self):
+        """Test views of unknown addresses."""
+        self.assertIsNone(ContentAddressedStorage().get_view("0" * 64))
+        disk = ContentAddressedStorage(self.tmpdir.name)
+        self.assertIsNone(disk.get_view("0" * 64))
+        self.assertIsNone(disk.get("0" * 64))
+
+
+class TestRangeReads(unittest.TestCase):
+    """Test cases for chunked objects and read_range."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cas = ContentAddressedStorage(self.tmpdir.name)
+        self.blob = os.urandom(10 * 1000 + 7)
+        self.address = self.cas.put_chunked(self.blob, chunk_size=1000)
+
+    def test_chunked_round_trip(self):
+        """Test chunked objects reassemble and verify."""
+        self.assertEqual(self.cas.get(self.address), self.blob)
+        self.assertTrue(self.cas.verify(self.address, self.blob))
+        self.assertFalse(self.cas.verify(self.address, self.blob[:-1]))
+        self.assertEqual(
+            self.cas.verify_many([(self.address, self.blob), (self.address, b"x")]),
+            [True, False]
+        )
+
+    def test_chunked_survives_reopen(self):
+        """Test manifests are loaded back from disk."""
+        reopened = ContentAddressedStorage(self.tmpdir.name)
+
+        self.assertEqual(reopened.read_range(self.address, 2500, 1000),
+                         self.blob[2500:3500])
+
+    def test_ranges(self):
+        """Test ranges within, across and beyond chunk boundaries."""
+        for offset, length in [(0, 10), (995, 10), (1000, 1000),
+                               (2999, 3002), (10000, 100), (20000, 5)]:
+            self.assertEqual(
+                self.cas.read_range(self.address, offset, length),
+                self.blob[offset:offset + length],
+                f"range {offset}+{length}"
+            )
+
+    def test_range_touches_only_overlapping_chunks(self):
+        """Test a corrupted chunk outside the range is never read."""
+        manifest = self.cas.manifests[self.address]
+        with open(self.cas._object_path(manifest.chunks[0]), "wb") as f:
+            f.write(b"bit rot")
+
+        self.assertEqual(self.cas.read_range(self.address, 4000, 500),
+                         self.blob[4000:4500])
+        with self.assertRaises(IntegrityError):
+            self.cas.read_range(self.address, 500, 10)
+
+    def test_assemble_from_manifest(self):
+        """Test an object is assembled from separately stored chunks."""
+        manifest = self.cas.get_manifest(self.address)
+        other = ContentAddressedStorage()
+
+        with self.assertRaises(ValueError):
+            other.put_manifest(manifest)
+        for chunk in manifest.chunks:
+            other.put(self.cas.get(chunk))
+
+        self.assertEqual(other.put_manifest(manifest), self.address)
+        self.assertEqual(other.get(self.address), self.blob)
+        self.assertIsNone(other.get_manifest(manifest.chunks[0]))
+
+    def test_range_unchunked(self):
+        """Test ranges over plain objects in memory."""
+        cas = ContentAddressedStorage()
+        address = cas.put(b"0123456789")
+
+        self.assertEqual(cas.read_range(address, 3, 4), b"3456")
+        self.assertIsNone(cas.read_range("0" * 64, 0, 1))
+        with self.assertRaises(ValueError):
+            cas.read_range(address, -1, 4)
+
+
+class TestIndex(unittest.TestCase):
+    """Test cases for has, has_many, stat and skip-on-exists puts."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cas = ContentAddressedStorage(self.tmpdir.name)
+
+    def test_put_skips_existing(self):
+        """Test repeated puts do not rewrite the object."""
+        address = self.cas.put(b"shard")
+
+        with mock.patch.object(self.cas, "_write") as write:
+            self.assertEqual(self.cas.put(b"shard"), address)
+            self.cas.put_many([b"shard", b"shard"])
+            write.assert_not_called()
+
+        self.assertEqual(self.cas.stat(address).refcount, 4)
+
+    def test_has_and_has_many(self):
+        """Test existence checks."""
+        address = self.cas.put(b"known")
+
+        self.assertTrue(self.cas.has(address))
+        self.assertFalse(self.cas.has("0" * 64))
+        self.assertEqual(self.cas.has_many([address, "0" * 64]), [True, False])
+
+    def test_stat_never_reads_objects(self):
+        """Test stat answers from the index alone."""
+        address = self.cas.put(b"12345")
+        chunked = self.cas.put_chunked(b"x" * 2500, chunk_size=1000)
+
+        with mock.patch("builtins.open", side_effect=AssertionError):
+            raw = self.cas.stat(address)
+            big = self.cas.stat(chunked)
+
+        self.assertEqual((raw.size, raw.codec, raw.refcount), (5, "raw", 1))
+        self.assertEqual((big.size, big.codec, big.refcount), (2500, "chunked", 1))
+        self.assertIsNone(self.cas.stat("0" * 64))
+
+    def test_chunk_refcounts(self):
+        """Test chunks shared between objects are counted once each."""
+        first = self.cas.put_chunked(b"a" * 1000 + b"b" * 1000, chunk_size=1000)
+        self.cas.put_chunked(b"a" * 1000 + b"c" * 1000, chunk_size=1000)
+        self.cas.put_chunked(b"a" * 1000 + b"b" * 1000, chunk_size=1000)
+
+        shared = self.cas.manifests[first].chunks[0]
+        self.assertEqual(self.cas.stat(shared).refcount, 2)
+        self.assertEqual(self.cas.stat(first).refcount, 2)
+
+    def test_index_rebuilt_on_open(self):
+        """Test the index is rebuilt from disk."""
+        address = self.cas.put(b"12345")
+        chunked = self.cas.put_chunked(b"x" * 2500, chunk_size=1000)
+
+        reopened = ContentAddressedStorage(self.tmpdir.name)
+
+        self.assertTrue(reopened.has(address))
+        self.assertEqual(reopened.stat(chunked).size, 2500)
+        self.assertEqual(reopened.get(chunked), b"x" * 2500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: CERL-1.0
+# Copyright (c) 2025 MAYA Node Contributors
+# 
+# Constrained Ethics Runtime License 1.0
+# This code is licensed under CERL-1.0. See LICENSE-CERL-1.0 for full terms.
+
+"""
+Tests for the Integrity Scrubber
+
+Test coverage:
+- Corruption detection and quarantine
+- Cursor checkpoint and resume
+- Rate limiting
+- Background thread lifecycle
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import tempfile
+import time
+import unittest
+from services.storage.cas import ContentAddressedStorage
+from services.storage.integrity import IntegrityScrubber
+
+
+class TestIntegrityScrubber(unittest.TestCase):
+    """Test cases for IntegrityScrubber."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cas = ContentAddressedStorage(self.tmpdir.name)
+        self.addresses = self.cas.put_many(
+            [f"object {i}".encode() for i in range(10)]
+        )
+    
+    def corrupt(self, address):
+        """Flip the contents of a stored object on disk."""
+        with open(self.cas._object_path(address), "wb") as f:
+            f.write(b"bit rot")
+    
+    def test_clean_pass(self):
+        """Test a full pass over healthy storage."""
+        scrubber = IntegrityScrubber(self.cas, rate_mb_per_s=100)
+        
+        self.assertTrue(scrubber.scrub_pass())
+        
+        status = scrubber.get_status()
+        self.assertEqual(status["objects_checked"], 10)
+        self.assertEqual(status["corrupted"], 0)
+        self.assertEqual(status["passes_completed"], 1)
+        self.assertEqual(status["cursor"], "")
+    
+    def test_corruption_quarantined(self):
+        """Test corrupted objects are detected and quarantined."""
+        victim = self.addresses[3]
+        self.corrupt(victim)
+        scrubber = IntegrityScrubber(self.cas, rate_mb_per_s=100)
+        
+        scrubber.scrub_pass()
+        
+        self.assertEqual(scrubber.corrupted, 1)
+        self.assertFalse(self.cas.has(victim))
+        self.assertIsNone(self.cas.get(victim))
+        self.assertTrue(os.path.exists(
+            os.path.join(self.tmpdir.name, "quarantine", victim)
+        ))
+        
+        # The correct content can be stored again
+        self.cas.put(b"object 3")
+        self.assertTrue(self.cas.has(victim))
+    
+    def test_resume_from_cursor(self):
+        """Test a restarted scrubber resumes from its checkpoint."""
+        first = IntegrityScrubber(self.cas, rate_mb_per_s=100)
+        self.assertFalse(first.scrub_pass(max_objects=4))
+        
+        resumed = IntegrityScrubber(
+            ContentAddressedStorage(self.tmpdir.name),
+            rate_mb_per_s=100
+        )
+        self.assertEqual(resumed.cursor, first.cursor)
+        self.assertTrue(resumed.scrub_pass())
+        self.assertEqual(resumed.objects_checked, 6)
+    
+    def test_in_memory_quarantine(self):
+        """Test quarantine of in-memory objects."""
+        cas = ContentAddressedStorage()
+        address = cas.put(b"fine")
+        cas.store[address] = b"flipped"
+        
+        scrubber = IntegrityScrubber(cas, rate_mb_per_s=100)
+        scrubber.scrub_pass()
+        
+        self.assertFalse(cas.has(address))
+        self.assertEqual(cas.quarantined[address], b"flipped")
+    
+    def test_rate_limit(self):
+        """Test hashing stays within the configured budget."""
+        cas = ContentAddressedStorage()
+        cas.put_many([os.urandom(64 * 1024) for _ in range(4)])
+        scrubber = IntegrityScrubber(cas, rate_mb_per_s=1)
+        
+        started = time.monotonic()
+        scrubber.scrub_pass()
+        
+        # 256 KiB at 1 MB/s takes at least a quarter second
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+    
+    def test_background_thread(self):
+        """Test the scrubber runs and stops in the background."""
+        scrubber = IntegrityScrubber(self.cas, rate_mb_per_s=100)
+        
+        scrubber.start()
+        deadline = time.monotonic() + 5
+        while scrubber.passes_completed == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(scrubber.get_status()["running"])
+        scrubber.stop(timeout=5)
+        
+        self.assertEqual(scrubber.passes_completed, 1)
+        self.assertFalse(scrubber.get_status()["running"])
+
+
+if __name__ == "__main__":
+    unittest.main()